@@ -0,0 +1,7 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Benchmarks for signature construction, binding and transformed calls.
+
+Run the standalone runner with ``python -m benchmarks.runner`` or, with
+pytest-benchmark installed, ``pytest benchmarks/bench_signature.py``.
+"""
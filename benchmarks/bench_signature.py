@@ -0,0 +1,22 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""pytest-benchmark suite.
+
+Run with ``pytest benchmarks/bench_signature.py --benchmark-json=results.json``.
+"""
+import pytest
+
+from benchmarks.cases import all_cases
+
+CASES = all_cases()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[c.id for c in CASES])
+def test_benchmark(benchmark, case):
+    benchmark.group = f"{case.group}-{case.size}-{case.mix}"
+    if case.mutates:
+        benchmark.pedantic(
+            lambda fn: fn(), setup=lambda: ((case.setup(),), {}), rounds=20
+        )
+    else:
+        benchmark(case.setup())
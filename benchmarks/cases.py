@@ -0,0 +1,270 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Benchmark case definitions shared by the standalone runner and the
+pytest-benchmark suite."""
+import functools
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Sequence
+from typing import Tuple
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.pipeline import TransformPipeline
+from jdv_funcutils.signature.utils import copy_signature
+
+SIZES = (1, 10, 100, 1000)
+MIXES = ("positional", "keyword", "mixed")
+STAGES = (1, 8)
+
+
+class Case(NamedTuple):
+    """A benchmark case.
+
+    `setup` returns the zero-argument callable to time. If `mutates` is
+    True, the callable changes state and `setup` is rerun before every
+    round.
+    """
+
+    group: str
+    name: str
+    size: int
+    mix: str
+    setup: Callable[[], Callable[[], Any]]
+    mutates: bool = False
+
+    @property
+    def id(self) -> str:
+        return f"{self.group}-{self.name}-{self.size}-{self.mix}"
+
+
+def make_function(size: int, name: str = "fn") -> Callable[..., Any]:
+    """Create a function with `size` positional-or-keyword parameters."""
+    params = ", ".join(f"p{i}" for i in range(size))
+    namespace: Dict[str, Any] = {}
+    exec(f"def {name}({params}):\n    return p0\n", namespace)  # noqa
+    return namespace[name]
+
+
+def make_arguments(size: int, mix: str) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Create call arguments for a function from `make_function`."""
+    if mix == "positional":
+        n_args = size
+    elif mix == "keyword":
+        n_args = 0
+    else:
+        n_args = size // 2
+    return tuple(range(n_args)), {f"p{i}": i for i in range(n_args, size)}
+
+
+def _reversed_signature(fn: Callable[..., Any]) -> MutableSignature:
+    s = MutableSignature(fn)
+    s.reorder(*reversed([p.name for p in s]))
+    return s
+
+
+def _reversed_arguments(size: int, mix: str) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    args, _ = make_arguments(size, mix)
+    names = [f"p{i}" for i in reversed(range(size))][len(args) :]
+    return args, {name: i for i, name in enumerate(names)}
+
+
+def _construct_cases(size: int) -> List[Case]:
+    def construct():
+        fn = make_function(size)
+        return lambda: MutableSignature(fn)
+
+    def construct_from_signature():
+        signature = inspect.signature(make_function(size))
+        return lambda: MutableSignature(signature)
+
+    return [
+        Case("construct", "function", size, "-", construct),
+        Case("construct", "signature", size, "-", construct_from_signature),
+    ]
+
+
+def _bind_cases(size: int, mix: str) -> List[Case]:
+    def bind():
+        s = MutableSignature(make_function(size))
+        args, kwargs = make_arguments(size, mix)
+        return lambda: s.bind(*args, **kwargs)
+
+    def bind_many():
+        s = MutableSignature(make_function(size))
+        records = [make_arguments(size, mix)] * 100
+        return lambda: list(s.bind_many(records))
+
+    def inspect_bind():
+        signature = inspect.signature(make_function(size))
+        args, kwargs = make_arguments(size, mix)
+        return lambda: signature.bind(*args, **kwargs)
+
+    return [
+        Case("bind", "bind", size, mix, bind),
+        Case("bind", "bind_many_x100", size, mix, bind_many),
+        Case("bind", "inspect_bind", size, mix, inspect_bind),
+    ]
+
+
+def _mutation_cases(size: int) -> List[Case]:
+    fn = make_function(size)
+    names = [f"p{i}" for i in range(size)]
+
+    def pack():
+        s = MutableSignature(fn)
+        return lambda: s.pack(names[::2])
+
+    def reorder():
+        s = MutableSignature(fn)
+        return lambda: s.reorder(*reversed(names))
+
+    return [
+        Case("mutate", "pack", size, "-", pack, mutates=True),
+        Case("mutate", "reorder", size, "-", reorder, mutates=True),
+    ]
+
+
+def _call_cases(size: int, mix: str) -> List[Case]:
+    def direct():
+        fn = make_function(size)
+        args, kwargs = make_arguments(size, mix)
+        return lambda: fn(*args, **kwargs)
+
+    def inspect_bind_call():
+        fn = make_function(size)
+        signature = inspect.signature(fn)
+        args, kwargs = make_arguments(size, mix)
+
+        def call():
+            bound = signature.bind(*args, **kwargs)
+            return fn(*bound.args, **bound.kwargs)
+
+        return call
+
+    def transformed(compiled: bool):
+        def setup():
+            fn = make_function(size)
+            wrapped = _reversed_signature(fn).transform(fn, compiled=compiled)
+            args, kwargs = _reversed_arguments(size, mix)
+            return lambda: wrapped(*args, **kwargs)
+
+        return setup
+
+    return [
+        Case("call", "direct", size, mix, direct),
+        Case("call", "inspect_bind", size, mix, inspect_bind_call),
+        Case("call", "transform_compiled", size, mix, transformed(True)),
+        Case("call", "transform_interpreted", size, mix, transformed(False)),
+    ]
+
+
+def _partial_cases(size: int) -> List[Case]:
+    fixed = tuple(range(size // 2))
+    args = tuple(range(size // 2, size))
+
+    def functools_partial():
+        p = functools.partial(make_function(size), *fixed)
+        return lambda: p(*args)
+
+    def signature_partial():
+        fn = make_function(size)
+        p = MutableSignature(fn).partial(fn, *fixed)
+        return lambda: p(*args)
+
+    return [
+        Case("partial", "functools_partial", size, "-", functools_partial),
+        Case("partial", "signature_partial", size, "-", signature_partial),
+    ]
+
+
+def _pipeline_cases(size: int, stages: int) -> List[Case]:
+    # every stage rotates the parameters by one
+    rotation = list(range(1, size)) + [0]
+    args = tuple(range(size))
+
+    def fused():
+        pipeline = TransformPipeline(make_function(size))
+        for _ in range(stages):
+            pipeline.permute(*rotation)
+        wrapped = pipeline.build()
+        return lambda: wrapped(*args)
+
+    def nested():
+        wrapped = make_function(size)
+        for _ in range(stages):
+            s = MutableSignature(wrapped)
+            s.reorder(*rotation)
+            wrapped = s.transform(wrapped)
+        return lambda: wrapped(*args)
+
+    mix = f"{stages}-stages"
+    return [
+        Case("pipeline", "fused", size, mix, fused),
+        Case("pipeline", "nested", size, mix, nested),
+    ]
+
+
+def _copy_signature_cases(size: int, mix: str) -> List[Case]:
+    def copied(copy_function: bool):
+        def setup():
+            fn = make_function(size)
+            args, kwargs = make_arguments(size, mix)
+            wrapped = copy_signature(fn, copy_function=copy_function)(fn)
+            return lambda: wrapped(*args, **kwargs)
+
+        return setup
+
+    def direct():
+        fn = make_function(size)
+        args, kwargs = make_arguments(size, mix)
+        return lambda: fn(*args, **kwargs)
+
+    return [
+        Case("copy_signature", "direct", size, mix, direct),
+        Case("copy_signature", "forwarder", size, mix, copied(False)),
+        Case("copy_signature", "copy_function", size, mix, copied(True)),
+    ]
+
+
+def _record_cases(size: int) -> List[Case]:
+    names = [f"p{i}" for i in range(size)]
+    dict_rows = [dict(zip(names, range(size)))] * 100
+    tuple_rows = [tuple(range(size))] * 100
+
+    def bind():
+        s = MutableSignature(make_function(size))
+        return lambda: [s.bind(**row) for row in dict_rows]
+
+    def adapt_dicts():
+        adapter = MutableSignature(make_function(size)).record_adapter()
+        return lambda: list(adapter.adapt(dict_rows))
+
+    def adapt_tuples():
+        adapter = MutableSignature(make_function(size)).record_adapter(names)
+        return lambda: list(adapter.adapt(tuple_rows))
+
+    return [
+        Case("records", "bind_x100", size, "-", bind),
+        Case("records", "adapt_dicts_x100", size, "-", adapt_dicts),
+        Case("records", "adapt_tuples_x100", size, "-", adapt_tuples),
+    ]
+
+
+def all_cases(sizes: Sequence[int] = SIZES, mixes: Sequence[str] = MIXES) -> List[Case]:
+    cases: List[Case] = []
+    for size in sizes:
+        cases += _construct_cases(size)
+        cases += _mutation_cases(size)
+        cases += _partial_cases(size)
+        cases += _record_cases(size)
+        for stages in STAGES:
+            cases += _pipeline_cases(size, stages)
+        for mix in mixes:
+            cases += _bind_cases(size, mix)
+            cases += _call_cases(size, mix)
+            cases += _copy_signature_cases(size, mix)
+    return cases
@@ -0,0 +1,81 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Memory benchmark for resident signatures.
+
+Usage::
+
+    python -m benchmarks.memory --count 10000 --output memory-results.json
+"""
+import argparse
+import gc
+import inspect
+import json
+import sys
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.cases import make_function
+from jdv_funcutils import MutableSignature
+
+
+def measure_allocated(fn: Callable[[], Any]) -> int:
+    """Return the number of bytes allocated by `fn` and still held by its
+    result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = fn()  # noqa
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before
+
+
+def run(sizes: Sequence[int] = (1, 10, 100), count: int = 1000) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        signature = inspect.signature(make_function(size))
+        mutable = measure_allocated(
+            lambda: [MutableSignature(signature) for _ in range(count)]
+        )
+        signatures = [MutableSignature(signature) for _ in range(count)]
+        compact = measure_allocated(lambda: [s.compact() for s in signatures])
+        result = {
+            "size": size,
+            "count": count,
+            "mutable_bytes_per_signature": mutable / count,
+            "compact_bytes_per_signature": compact / count,
+            "ratio": compact / mutable,
+        }
+        print(
+            f"size={size:<5} mutable={result['mutable_bytes_per_signature']:>10,.0f} B"
+            f"  compact={result['compact_bytes_per_signature']:>10,.0f} B"
+            f"  ratio={result['ratio']:.2f}",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return {"results": results}
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--output", "-o", default=None)
+    args = parser.parse_args(argv)
+    data = run(args.sizes, args.count)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+    else:
+        json.dump(data, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
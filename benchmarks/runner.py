@@ -0,0 +1,117 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Standalone benchmark runner.
+
+Usage::
+
+    python -m benchmarks.runner --output benchmark-results.json
+    python -m benchmarks.runner --sizes 1 10 --groups call bind
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.cases import all_cases
+from benchmarks.cases import Case
+from benchmarks.cases import MIXES
+from benchmarks.cases import SIZES
+from jdv_funcutils import __version__
+
+
+def _time_batch(fn, number: int) -> int:
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        fn()
+    return time.perf_counter_ns() - start
+
+
+def measure(case: Case, min_time: float = 0.1, repeat: int = 5) -> Dict[str, Any]:
+    """Measure a case, returning timings in nanoseconds per operation."""
+    timings: List[float] = []
+    if case.mutates:
+        deadline = time.perf_counter() + min_time * repeat
+        while len(timings) < repeat or (
+            time.perf_counter() < deadline and len(timings) < 1000
+        ):
+            fn = case.setup()
+            timings.append(_time_batch(fn, 1))
+        number = 1
+    else:
+        fn = case.setup()
+        number = 1
+        while True:
+            elapsed = _time_batch(fn, number)
+            if elapsed >= min_time * 1e9 / repeat or number >= 1 << 20:
+                break
+            number *= 2
+        timings = [_time_batch(fn, number) / number for _ in range(repeat)]
+    return {
+        "id": case.id,
+        "group": case.group,
+        "name": case.name,
+        "size": case.size,
+        "mix": case.mix,
+        "rounds": len(timings),
+        "iterations": number,
+        "min_ns": min(timings),
+        "mean_ns": statistics.mean(timings),
+        "stdev_ns": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def run(
+    sizes: Sequence[int] = SIZES,
+    mixes: Sequence[str] = MIXES,
+    groups: Optional[Sequence[str]] = None,
+    min_time: float = 0.1,
+) -> Dict[str, Any]:
+    results = []
+    for case in all_cases(sizes, mixes):
+        if groups and case.group not in groups:
+            continue
+        result = measure(case, min_time=min_time)
+        print(
+            f"{case.id:<55} {result['min_ns']:>14,.0f} ns",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return {
+        "meta": {
+            "jdv_funcutils": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--mixes", nargs="+", default=list(MIXES), choices=MIXES)
+    parser.add_argument("--groups", nargs="+", default=None)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument(
+        "--output", "-o", default=None, help="Write JSON results to this file."
+    )
+    args = parser.parse_args(argv)
+    data = run(args.sizes, args.mixes, args.groups, args.min_time)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+    else:
+        json.dump(data, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
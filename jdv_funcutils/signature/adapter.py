@@ -0,0 +1,340 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Code generation for argument adapters.
+
+An adapter is a generated function with a new signature that remaps its
+arguments onto the parameters of a target function and calls it. The
+mapping is described once by an :class:`AdapterSpec` and flattened into
+plain Python source, so calling an adapter costs a single extra frame.
+"""
+from __future__ import annotations
+
+import inspect
+import itertools
+import textwrap
+from inspect import _ParameterKind  # noqa
+from inspect import Parameter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.typecheck import argument_type_error
+from jdv_funcutils.signature.typecheck import TypeCheck
+
+
+class FunctionKind:
+    """Kinds of functions an adapter can be generated as. The adapter must
+    have the same kind as its target to be a drop-in replacement (e.g. for
+    `inspect.iscoroutinefunction` checks)."""
+
+    FUNCTION = "function"
+    COROUTINE = "coroutine"
+    GENERATOR = "generator"
+    ASYNC_GENERATOR = "async_generator"
+
+
+def function_kind(fn: Callable[..., Any]) -> str:
+    """Return the :class:`FunctionKind` of a callable."""
+    if inspect.iscoroutinefunction(fn):
+        return FunctionKind.COROUTINE
+    if inspect.isasyncgenfunction(fn):
+        return FunctionKind.ASYNC_GENERATOR
+    if inspect.isgeneratorfunction(fn):
+        return FunctionKind.GENERATOR
+    return FunctionKind.FUNCTION
+
+
+# delegates iteration, `asend`, `athrow` and `aclose` to the target async
+# generator; async generators have no equivalent of `yield from`.
+_ASYNC_GENERATOR_BODY = """\
+{p}gen = {call}
+try:
+    {p}value = await {p}gen.__anext__()
+except StopAsyncIteration:
+    return
+while True:
+    try:
+        {p}sent = yield {p}value
+    except GeneratorExit:
+        await {p}gen.aclose()
+        raise
+    except BaseException as {p}exc:
+        {p}step = {p}gen.athrow({p}exc)
+    else:
+        if {p}sent is None:
+            {p}step = {p}gen.__anext__()
+        else:
+            {p}step = {p}gen.asend({p}sent)
+    try:
+        {p}value = await {p}step
+    except StopAsyncIteration:
+        return
+"""
+
+
+class ParameterSpec(NamedTuple):
+    """A parameter of the adapter.
+
+    If `check` is given, arguments are type checked before calling the
+    target. It is either a tuple of classes (checked with `isinstance`) or a
+    function returning whether the value is valid (see
+    :func:`compile_type_check`). Values of variadic parameters are checked
+    one by one. Default values are not checked.
+    """
+
+    name: str
+    kind: _ParameterKind
+    default: Any = empty
+    check: Optional[TypeCheck] = None
+    annotation: Any = empty
+
+
+class ArgumentSpec(NamedTuple):
+    """A parameter of the target and where its value comes from.
+
+    If `source` is None, `value` is passed instead (or nothing, if
+    `value` is empty). If `container` is given, the value is built by calling
+    `container` with the values of `members` instead; tuple and dict literals
+    are generated for `tuple` and `dict` (using the member names as keys).
+    """
+
+    name: str
+    kind: _ParameterKind
+    source: Optional[str] = None
+    path: Tuple[Union[int, str], ...] = ()
+    value: Any = empty
+    container: Any = None
+    members: Tuple[ArgumentSpec, ...] = ()
+
+
+class AdapterSpec(NamedTuple):
+    """The parameters of an adapter and how they map onto the target.
+
+    Type checks of the parameters run on every `check_every`-th call.
+    `unmatched` names parameters (with defaults) that do not map onto the
+    target; passing a value for them raises a ValueError.
+    """
+
+    params: Tuple[ParameterSpec, ...]
+    arguments: Tuple[ArgumentSpec, ...]
+    check_every: int = 1
+    unmatched: Tuple[str, ...] = ()
+
+
+def _unique_prefix(spec: AdapterSpec) -> str:
+    names = [p.name for p in spec.params]
+    prefix = "_jdv_"
+    while any(n.startswith(prefix) for n in names):
+        prefix = "_" + prefix
+    return prefix
+
+
+class _SourceBuilder:
+    def __init__(self, spec: AdapterSpec, namespace: Dict[str, Any]):
+        self.spec = spec
+        self.prefix = _unique_prefix(spec)
+        self.namespace = namespace
+
+    def constant(self, value: Any) -> str:
+        key = f"{self.prefix}c{len(self.namespace)}"
+        self.namespace[key] = value
+        return key
+
+    def format_params(self) -> str:
+        params = self.spec.params
+        has_var_positional = any(p.kind is Parameter.VAR_POSITIONAL for p in params)
+        tokens: List[str] = []
+        for i, p in enumerate(params):
+            prev_kind = params[i - 1].kind if i else None
+            if (
+                p.kind is Parameter.KEYWORD_ONLY
+                and not has_var_positional
+                and prev_kind is not Parameter.KEYWORD_ONLY
+            ):
+                tokens.append("*")
+            if p.kind is Parameter.VAR_POSITIONAL:
+                token = "*" + p.name
+            elif p.kind is Parameter.VAR_KEYWORD:
+                token = "**" + p.name
+            else:
+                token = p.name
+                if p.default is not empty:
+                    token += "=" + self.constant(p.default)
+            tokens.append(token)
+            next_kind = params[i + 1].kind if i + 1 < len(params) else None
+            if (
+                p.kind is Parameter.POSITIONAL_ONLY
+                and next_kind is not Parameter.POSITIONAL_ONLY
+            ):
+                tokens.append("/")
+        return ", ".join(tokens)
+
+    def format_container(self, arg: ArgumentSpec) -> str:
+        items = [self.format_argument(m) for m in arg.members]
+        if any(item is None for item in items):
+            missing = [m.name for m, item in zip(arg.members, items) if item is None]
+            raise ValueError(f"No value for {missing} of parameter '{arg.name}'")
+        if arg.container is dict:
+            pairs = (f"{m.name!r}: {item}" for m, item in zip(arg.members, items))
+            return "{" + ", ".join(pairs) + "}"
+        if arg.container is tuple:
+            return "(" + "".join(f"{item}, " for item in items) + ")"
+        return f"{self.constant(arg.container)}({', '.join(items)})"
+
+    def format_argument(self, arg: ArgumentSpec) -> Optional[str]:
+        if arg.container is not None:
+            return self.format_container(arg)
+        if arg.source is not None:
+            return arg.source + "".join(f"[{k!r}]" for k in arg.path)
+        if arg.value is empty:
+            return None
+        return self.constant(arg.value)
+
+    def format_call(self) -> str:
+        tokens: List[str] = []
+        for arg in self.spec.arguments:
+            expr = self.format_argument(arg)
+            if arg.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                if expr is None:
+                    raise ValueError(f"No value for positional parameter '{arg.name}'")
+                tokens.append(expr)
+            elif expr is None:
+                # let the target fill in its own defaults
+                continue
+            elif arg.kind is Parameter.VAR_POSITIONAL:
+                tokens.append("*" + expr)
+            elif arg.kind is Parameter.KEYWORD_ONLY:
+                tokens.append(f"{arg.name}={expr}")
+            else:
+                tokens.append("**" + expr)
+        return ", ".join(tokens)
+
+    def format_check(self, p: ParameterSpec) -> List[str]:
+        if isinstance(p.check, tuple):
+            check = self.constant(p.check[0] if len(p.check) == 1 else p.check)
+            template = f"isinstance({{}}, {check})"
+        else:
+            template = self.constant(p.check) + "({})"
+        annotation = self.constant(p.annotation)
+        error = f"raise {self.prefix}error({p.name!r}, {{}}, {annotation})"
+        if p.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            item = self.prefix + "item"
+            values = p.name
+            if p.kind is Parameter.VAR_KEYWORD:
+                values += ".values()"
+            return [
+                f"for {item} in {values}:",
+                "    if not " + template.format(item) + ":",
+                "        " + error.format(item),
+            ]
+        condition = "not " + template.format(p.name)
+        if p.default is not empty:
+            # defaults are not checked (e.g. `x: int = None`)
+            condition = f"{p.name} is not {self.constant(p.default)} and {condition}"
+        return ["if " + condition + ":", "    " + error.format(p.name)]
+
+    def format_checks(self) -> str:
+        lines: List[str] = []
+        for p in self.spec.params:
+            if p.check is not None:
+                lines.extend(self.format_check(p))
+        if not lines:
+            return ""
+        self.namespace[self.prefix + "error"] = argument_type_error
+        if self.spec.check_every > 1:
+            counter = self.constant(itertools.count())
+            sampled = f"if next({counter}) % {self.spec.check_every:d} == 0:"
+            lines = [sampled] + ["    " + line for line in lines]
+        return textwrap.indent("\n".join(lines) + "\n", "    ")
+
+    def format_unmatched(self) -> str:
+        lines: List[str] = []
+        for p in self.spec.params:
+            if p.name in self.spec.unmatched:
+                error = f"Could not find parameter value for {p.name}"
+                lines.append(f"if {p.name} is not {self.constant(p.default)}:")
+                lines.append(f"    raise {self.constant(ValueError)}({error!r})")
+        return textwrap.indent("".join(line + "\n" for line in lines), "    ")
+
+    def build(self, name: str, kind: str = FunctionKind.FUNCTION) -> str:
+        params = self.format_params()
+        call = f"{self.prefix}fn({self.format_call()})"
+        header = f"def {name}({params}):\n"
+        if kind in (FunctionKind.COROUTINE, FunctionKind.ASYNC_GENERATOR):
+            header = "async " + header
+        header += self.format_checks()
+        header += self.format_unmatched()
+        if kind == FunctionKind.COROUTINE:
+            return header + f"    return await {call}\n"
+        if kind == FunctionKind.GENERATOR:
+            return header + f"    return (yield from {call})\n"
+        if kind == FunctionKind.ASYNC_GENERATOR:
+            body = _ASYNC_GENERATOR_BODY.format(p=self.prefix, call=call)
+            return header + textwrap.indent(body, "    ")
+        return header + f"    return {call}\n"
+
+
+def adapter_source(
+    spec: AdapterSpec, name: str = "adapter", kind: str = FunctionKind.FUNCTION
+) -> str:
+    """Return the generated source code for an adapter (useful for
+    debugging)."""
+    return _SourceBuilder(spec, {}).build(name, kind)
+
+
+def compile_adapter(
+    spec: AdapterSpec,
+    fn: Callable[..., Any],
+    name: str = "adapter",
+    kind: Optional[str] = None,
+) -> Callable[..., Any]:
+    """Compile an adapter calling `fn` according to `spec`.
+
+    :param spec: The argument mapping
+    :param fn: The target function
+    :param name: Name of the generated function
+    :param kind: The :class:`FunctionKind` of the adapter. Defaults to the kind
+        of `fn`. `fn` must return a coroutine, generator or async generator if
+        the adapter is one.
+    :return: The generated adapter function
+    """
+    if kind is None:
+        kind = function_kind(fn)
+    namespace: Dict[str, Any] = {}
+    builder = _SourceBuilder(spec, namespace)
+    namespace[builder.prefix + "fn"] = fn
+    source = builder.build(name, kind)
+    exec(compile(source, f"<adapter {name}>", "exec"), namespace)  # noqa
+    return namespace[name]
+
+
+_FORWARDING_SPEC = AdapterSpec(
+    (
+        ParameterSpec("args", Parameter.VAR_POSITIONAL),
+        ParameterSpec("kwargs", Parameter.VAR_KEYWORD),
+    ),
+    (
+        ArgumentSpec("args", Parameter.VAR_POSITIONAL, "args"),
+        ArgumentSpec("kwargs", Parameter.VAR_KEYWORD, "kwargs"),
+    ),
+)
+
+
+def compile_forwarder(
+    fn: Callable[..., Any], name: str = "adapter", kind: Optional[str] = None
+) -> Callable[..., Any]:
+    """Compile an adapter passing all of its arguments on to `fn`.
+
+    :param fn: The target function
+    :param name: Name of the generated function
+    :param kind: The :class:`FunctionKind` of the adapter. Defaults to the kind
+        of `fn`.
+    :return: The generated adapter function
+    """
+    return compile_adapter(_FORWARDING_SPEC, fn, name=name, kind=kind)
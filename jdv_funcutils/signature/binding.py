@@ -0,0 +1,149 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Binding of argument sets to a signature without creating
+:class:`BoundSignature` objects."""
+from __future__ import annotations
+
+from inspect import _ParameterKind  # noqa
+from inspect import Parameter
+from types import MappingProxyType
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import Mapping
+from typing import NamedTuple
+from typing import Sequence
+from typing import Tuple
+
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.typedefs import ParameterLike
+
+ArgsKwargs = Tuple[Sequence[Any], Mapping[str, Any]]
+
+
+class BoundArguments(NamedTuple):
+    """Lightweight result of binding arguments to a signature.
+
+    `args` and `kwargs` hold the values bound to parameters, the same way
+    as `BoundSignature.args` and `BoundSignature.kwargs`. `missing` holds
+    the names of parameters without a value.
+    """
+
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    extra_args: Tuple[Any, ...]
+    extra_kwargs: Dict[str, Any]
+    missing: Tuple[str, ...]
+
+
+class BindingPlan:
+    """Immutable, precomputed tables for binding arguments to a list of
+    parameters.
+
+    Positional arguments bind to the positional parameters by index, keyword
+    arguments bind to any parameter by name. Plans are created with
+    `MutableSignature.compile_binder` and are only valid for the signature
+    version they were compiled from.
+    """
+
+    __slots__ = (
+        "params",
+        "names",
+        "defaults",
+        "positional_count",
+        "kind_boundaries",
+        "version",
+        "_keyword_table",
+    )
+
+    params: Tuple[ParameterLike, ...]
+    names: Tuple[str, ...]
+    defaults: Tuple[Any, ...]
+    positional_count: int
+    kind_boundaries: Mapping[_ParameterKind, Tuple[int, int]]
+    version: int
+
+    def __init__(self, params: Sequence[ParameterLike], version: int = 0):
+        params = tuple(params)
+        kind_boundaries: Dict[_ParameterKind, Tuple[int, int]] = {}
+        keyword_table: Dict[str, int] = {}
+        for i, p in enumerate(params):
+            start, _ = kind_boundaries.get(p.kind, (i, i))
+            kind_boundaries[p.kind] = (start, i + 1)
+            keyword_table.setdefault(p.name, i)
+        _set = object.__setattr__
+        _set(self, "params", params)
+        _set(self, "names", tuple(p.name for p in params))
+        _set(self, "defaults", tuple(p.default for p in params))
+        _set(
+            self,
+            "positional_count",
+            sum(
+                p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+                for p in params
+            ),
+        )
+        _set(self, "kind_boundaries", MappingProxyType(kind_boundaries))
+        _set(self, "version", version)
+        _set(self, "_keyword_table", keyword_table)
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key: str):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    @property
+    def keyword_table(self) -> Mapping[str, int]:
+        """Mapping of keyword names to parameter indices."""
+        return MappingProxyType(self._keyword_table)
+
+    def __reduce__(self):
+        return self.__class__, (self.params, self.version)
+
+    def __repr__(self) -> str:
+        names = ", ".join(self.names)
+        return f"<{self.__class__.__name__}({names}) version={self.version}>"
+
+    def bind(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> BoundArguments:
+        return next(self.bind_many([(args, kwargs)]))
+
+    def bind_many(
+        self, records: Iterable[ArgsKwargs]
+    ) -> Generator[BoundArguments, None, None]:
+        """Lazily bind many `(args, kwargs)` records.
+
+        :param records: Iterable of `(args, kwargs)` tuples
+        :return: Generator of :class:`BoundArguments`
+        """
+        names = self.names
+        n_params = len(names)
+        n_pos = self.positional_count
+        keyword_table = self._keyword_table
+        no_args: Tuple[Any, ...] = ()
+        for args, kwargs in records:
+            args = tuple(args)
+            extra_args = no_args
+            if len(args) > n_pos:
+                extra_args = args[n_pos:]
+                args = args[:n_pos]
+            n_args = len(args)
+            bound_kwargs: Dict[str, Any] = {}
+            extra_kwargs: Dict[str, Any] = {}
+            for k, v in kwargs.items():
+                i = keyword_table.get(k)
+                if i is None:
+                    extra_kwargs[k] = v
+                elif i < n_args:
+                    raise SignatureException(
+                        f"\nInvalid Args: bind(*{args} **{kwargs})"
+                        f"\n\tCannot set arg {k}='{v}' because it is already bound."
+                    )
+                else:
+                    bound_kwargs[k] = v
+            if n_args + len(bound_kwargs) == n_params:
+                missing: Tuple[str, ...] = ()
+            else:
+                missing = tuple(n for n in names[n_args:] if n not in bound_kwargs)
+            yield BoundArguments(args, bound_kwargs, extra_args, extra_kwargs, missing)
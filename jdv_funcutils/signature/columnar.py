@@ -0,0 +1,123 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Columnar argument batches.
+
+Many argument records are bound at once and turned into one NumPy array per
+parameter, so that a vectorized function can be called once for the whole
+batch. Packed parameters become record arrays with one field per member.
+NumPy is optional and only imported when a batch is created.
+"""
+from __future__ import annotations
+
+from inspect import _ParameterKind  # noqa
+from inspect import Parameter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.binding import ArgsKwargs
+from jdv_funcutils.signature.binding import BindingPlan
+from jdv_funcutils.signature.exceptions import SignatureException
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("Columnar batches require NumPy (`pip install numpy`)") from e
+    return numpy
+
+
+class ColumnSpec(NamedTuple):
+    """A parameter of a batch. `fields` holds the members of packed
+    parameters, and is None otherwise."""
+
+    name: str
+    kind: _ParameterKind
+    default: Any = empty
+    fields: Optional[Tuple[ColumnSpec, ...]] = None
+
+
+class ColumnBatch(NamedTuple):
+    """Arguments of a batch of `size` records, with one array per
+    parameter."""
+
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    size: int
+
+    def call(self, fn: Callable[..., Any]) -> Any:
+        """Call `fn` once with the arrays of the batch."""
+        return fn(*self.args, **self.kwargs)
+
+
+def _column(
+    np: Any, spec: ColumnSpec, values: Sequence[Any], dtypes: Mapping[str, Any]
+) -> Any:
+    if spec.fields is None:
+        return np.asarray(values, dtype=dtypes.get(spec.name))
+    n_fields = len(spec.fields)
+    for value in values:
+        if len(value) != n_fields:
+            raise SignatureException(
+                f"Expected {n_fields} values for packed parameter '{spec.name}', "
+                f"got {value!r}"
+            )
+    transposed = list(zip(*values)) if values else [()] * n_fields
+    columns = [_column(np, f, v, dtypes) for f, v in zip(spec.fields, transposed)]
+    dtype = [(f.name, c.dtype, c.shape[1:]) for f, c in zip(spec.fields, columns)]
+    array = np.empty(len(values), dtype=dtype)
+    for f, c in zip(spec.fields, columns):
+        array[f.name] = c
+    return array.view(np.recarray)
+
+
+def bind_columns(
+    specs: Sequence[ColumnSpec],
+    plan: BindingPlan,
+    records: Iterable[ArgsKwargs],
+    dtypes: Optional[Mapping[str, Any]] = None,
+) -> ColumnBatch:
+    """Bind `(args, kwargs)` records and collect the values of each parameter
+    into an array.
+
+    :param specs: The non-variadic parameters of `plan`, in order
+    :param plan: The binding plan of the signature
+    :param records: Iterable of `(args, kwargs)` tuples
+    :param dtypes: Optional NumPy dtypes by parameter (or member) name
+    :return: The batch
+    """
+    np = import_numpy()
+    dtypes = dtypes or {}
+    values: List[List[Any]] = [[] for _ in specs]
+    size = 0
+    for i, bound in enumerate(plan.bind_many(records)):
+        if bound.extra_args or bound.extra_kwargs:
+            raise SignatureException(
+                f"Record {i}: variadic arguments cannot be batched"
+            )
+        args, kwargs = bound.args, bound.kwargs
+        n_args = len(args)
+        for j, spec in enumerate(specs):
+            value = args[j] if j < n_args else kwargs.get(spec.name, spec.default)
+            if value is empty:
+                raise SignatureException(f"Record {i}: missing argument '{spec.name}'")
+            values[j].append(value)
+        size += 1
+    batch_args: List[Any] = []
+    batch_kwargs: Dict[str, Any] = {}
+    for spec, column_values in zip(specs, values):
+        column = _column(np, spec, column_values, dtypes)
+        if spec.kind is Parameter.KEYWORD_ONLY:
+            batch_kwargs[spec.name] = column
+        else:
+            batch_args.append(column)
+    return ColumnBatch(tuple(batch_args), batch_kwargs, size)
@@ -0,0 +1,109 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Compact, read-only representation of signatures."""
+from __future__ import annotations
+
+from inspect import _ParameterKind  # noqa
+from inspect import Parameter
+from inspect import Signature
+from typing import Any
+from typing import Generator
+from typing import Optional
+from typing import Tuple
+
+from jdv_funcutils.utils import Null
+
+
+class CompactSignature:
+    """Read-only signature stored as parallel tuples of parameter names,
+    kinds, defaults and annotations.
+
+    This takes much less memory than a :class:`MutableSignature`, which
+    keeps a list per parameter kind and one object per parameter. Use
+    `MutableSignature.compact` and `MutableSignature.from_compact` to
+    convert between the two.
+
+    `members` is None unless the signature has packed parameters, in which
+    case it holds the CompactSignature of the members of each packed
+    parameter (or None for regular parameters). Likewise, `sources` is None
+    unless the signature has parameters split out of other parameters (see
+    `MutableSignature.unpack`), in which case it holds the tuple describing
+    the origin of each of those parameters (or None).
+    """
+
+    __slots__ = (
+        "names",
+        "kinds",
+        "defaults",
+        "annotations",
+        "members",
+        "return_annotation",
+        "sources",
+    )
+
+    names: Tuple[str, ...]
+    kinds: Tuple[_ParameterKind, ...]
+    defaults: Tuple[Any, ...]
+    annotations: Tuple[Any, ...]
+    members: Optional[Tuple[Optional[CompactSignature], ...]]
+    return_annotation: Any
+    sources: Optional[Tuple[Optional[Tuple[Any, ...]], ...]]
+
+    def __init__(
+        self,
+        names: Tuple[str, ...],
+        kinds: Tuple[_ParameterKind, ...],
+        defaults: Tuple[Any, ...],
+        annotations: Tuple[Any, ...],
+        members: Optional[Tuple[Optional[CompactSignature], ...]] = None,
+        return_annotation: Any = Null,
+        sources: Optional[Tuple[Optional[Tuple[Any, ...]], ...]] = None,
+    ):
+        if not len(names) == len(kinds) == len(defaults) == len(annotations):
+            raise ValueError("Parameter tuples must have the same length")
+        _set = object.__setattr__
+        _set(self, "names", tuple(names))
+        _set(self, "kinds", tuple(kinds))
+        _set(self, "defaults", tuple(defaults))
+        _set(self, "annotations", tuple(annotations))
+        _set(self, "members", members)
+        _set(self, "return_annotation", return_annotation)
+        _set(self, "sources", sources)
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key: str):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        return self.__class__, (
+            self.names,
+            self.kinds,
+            self.defaults,
+            self.annotations,
+            self.members,
+            self.return_annotation,
+            self.sources,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def parameters(self) -> Generator[Parameter, None, None]:
+        for name, kind, default, annotation in zip(
+            self.names, self.kinds, self.defaults, self.annotations
+        ):
+            yield Parameter(name, kind, default=default, annotation=annotation)
+
+    def to_signature(self) -> Signature:
+        kwargs = {}
+        if self.return_annotation is not Null:
+            kwargs["return_annotation"] = self.return_annotation
+        return Signature(list(self.parameters()), **kwargs)
+
+    def __str__(self):
+        return f"<{self.__class__.__name__}{self.to_signature()}>"
+
+    def __repr__(self):
+        return self.__str__()
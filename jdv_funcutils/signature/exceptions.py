@@ -0,0 +1,14 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+
+
+class SignatureException(Exception):
+    ...
+
+
+class SignatureMissingParameterException(Exception):
+    ...
+
+
+class ArgumentTypeError(SignatureException, TypeError):
+    ...
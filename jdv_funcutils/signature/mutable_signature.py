@@ -2,11 +2,12 @@
 #  You may use, distribute, and modify this code under the terms of the MIT license.
 from __future__ import annotations
 
+import copy
 import functools
-import inspect
-import operator
+import itertools
 import textwrap
 import typing
+import weakref
 from collections import OrderedDict
 from inspect import _ParameterKind  # noqa
 from inspect import Parameter
@@ -16,10 +17,11 @@ from typing import Callable
 from typing import Collection
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import NamedTuple
 from typing import Optional
-from typing import Protocol
 from typing import Sequence
 from typing import Tuple
 from typing import Type
@@ -27,11 +29,44 @@ from typing import TypeVar
 from typing import Union
 
 from jdv_funcutils.imports import empty
-from jdv_funcutils.signature.utils import copy_signature
+from jdv_funcutils.signature.adapter import AdapterSpec
+from jdv_funcutils.signature.adapter import ArgumentSpec
+from jdv_funcutils.signature.adapter import compile_adapter
+from jdv_funcutils.signature.adapter import compile_forwarder
+from jdv_funcutils.signature.adapter import function_kind
+from jdv_funcutils.signature.adapter import ParameterSpec
+from jdv_funcutils.signature.binding import ArgsKwargs
+from jdv_funcutils.signature.binding import BindingPlan
+from jdv_funcutils.signature.binding import BoundArguments
+from jdv_funcutils.signature.columnar import bind_columns
+from jdv_funcutils.signature.columnar import ColumnBatch
+from jdv_funcutils.signature.columnar import ColumnSpec
+from jdv_funcutils.signature.compact import CompactSignature
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.exceptions import SignatureMissingParameterException
+from jdv_funcutils.signature.parallel import ExecutorLike
+from jdv_funcutils.signature.parallel import is_process_executor
+from jdv_funcutils.signature.parallel import parallel_map
+from jdv_funcutils.signature.parallel import Record
+from jdv_funcutils.signature.profiling import CallStats
+from jdv_funcutils.signature.profiling import profile_name
+from jdv_funcutils.signature.profiling import profiling_enabled
+from jdv_funcutils.signature.profiling import time_callee
+from jdv_funcutils.signature.profiling import time_calls
+from jdv_funcutils.signature.records import RecordAdapter
+from jdv_funcutils.signature.transformed import TransformedFunction
+from jdv_funcutils.signature.typecheck import argument_type_error
+from jdv_funcutils.signature.typecheck import compile_checker
+from jdv_funcutils.signature.typecheck import compile_type_check
+from jdv_funcutils.signature.typedefs import ParameterLike
 from jdv_funcutils.signature.utils import dict_remove_null
+from jdv_funcutils.signature.utils import get_annotation_resolver
 from jdv_funcutils.signature.utils import get_signature
 from jdv_funcutils.utils import Null
 from jdv_funcutils.utils import null
+from jdv_funcutils.utils.caching import CacheInfo
+from jdv_funcutils.utils.caching import LRUCache
+from jdv_funcutils.utils.caching import structural_key
 from jdv_funcutils.utils.repr_utils import ReprMixin
 from jdv_funcutils.utils.textutils import left_align
 
@@ -41,14 +76,6 @@ _Type = TypeVar("_Type", bound=Type[object])
 SignatureLike = Union[Callable[..., Any], Signature, List[Parameter]]
 
 
-class SignatureException(Exception):
-    ...
-
-
-class SignatureMissingParameterException(Exception):
-    ...
-
-
 class ParameterKind:
 
     POSITIONAL_OR_KEYWORD = Parameter.POSITIONAL_OR_KEYWORD
@@ -58,14 +85,6 @@ class ParameterKind:
     VAR_KEYWORD = Parameter.VAR_KEYWORD
 
 
-class ParameterLike(Protocol):
-
-    name: str
-    default: Any
-    annotation: Any
-    kind: _ParameterKind
-
-
 def _is_empty(x: Any) -> bool:
     return "_empty" in str(x)
 
@@ -81,24 +100,59 @@ def _to_annotations_tuple(
     return tuple(annot_list)
 
 
-def tuple_type_constructor(annotations_list: List[Any], tuple_cls=None) -> Type:
-    annotations_list = _to_annotations_tuple(annotations_list)
-    tuple_cls = Tuple or tuple_cls
-    return tuple_cls[annotations_list]
+def _tuple_type(annotations: Tuple[Any, ...]) -> Type:
+    return Tuple[_to_annotations_tuple(annotations)]
 
 
-def named_tuple_type_constructor(
-    annotations_list: Sequence[Any], names: List[str]
+def _named_tuple_type(
+    annotations: Tuple[Any, ...], names: Tuple[str, ...]
 ) -> Type[NamedTuple]:
-    assert len(annotations_list) == len(names)
     name = "NamedTuple__" + "__".join(names)
-    annotations_list = _to_annotations_tuple(annotations_list)
+    annotations = _to_annotations_tuple(annotations)
     tuple_fields: List[Tuple[str, Any]] = []
-    for param_name, annot in zip(names, annotations_list):
+    for param_name, annot in zip(names, annotations):
         tuple_fields.append((param_name, annot))
     return NamedTuple(name, tuple_fields)
 
 
+# packing creates the same types over and over and creating a NamedTuple class
+# is slow, so constructed types are shared.
+_tuple_type_cache: LRUCache[Type] = LRUCache(_tuple_type, maxsize=256)
+_named_tuple_type_cache: LRUCache[Type[NamedTuple]] = LRUCache(
+    _named_tuple_type, maxsize=256
+)
+
+
+def tuple_type_constructor(annotations_list: List[Any], tuple_cls=None) -> Type:
+    return _tuple_type_cache(tuple(annotations_list))
+
+
+def named_tuple_type_constructor(
+    annotations_list: Sequence[Any], names: List[str]
+) -> Type[NamedTuple]:
+    assert len(annotations_list) == len(names)
+    return _named_tuple_type_cache(tuple(annotations_list), tuple(names))
+
+
+def packed_type_cache_info() -> Dict[str, CacheInfo]:
+    """Return the statistics of the caches used by `tuple_type_constructor`
+    and `named_tuple_type_constructor`.
+
+    :return: Dictionary of CacheInfo by constructor name
+    """
+    return {
+        "tuple_type_constructor": _tuple_type_cache.info(),
+        "named_tuple_type_constructor": _named_tuple_type_cache.info(),
+    }
+
+
+def clear_packed_type_cache():
+    """Clear the caches used by `tuple_type_constructor` and
+    `named_tuple_type_constructor`."""
+    _tuple_type_cache.clear()
+    _named_tuple_type_cache.clear()
+
+
 class ParameterLocation(NamedTuple):
 
     param_index: int
@@ -106,9 +160,26 @@ class ParameterLocation(NamedTuple):
     param: MutableParameter
 
 
+class _ParameterIndex(NamedTuple):
+
+    by_id: Dict[int, ParameterLocation]
+    by_position: List[ParameterLocation]
+
+
+def _add_owner(
+    owners: Tuple[weakref.ref, ...], ref: weakref.ref
+) -> Tuple[weakref.ref, ...]:
+    """Return `owners` with `ref` added. References to collected owners are
+    dropped, so objects shared by many short-lived owners (e.g. copies of a
+    signature) do not accumulate them."""
+    if any(r is ref for r in owners):
+        return owners
+    return tuple(r for r in owners if r() is not None) + (ref,)
+
+
 class MutableParameter(ParameterLike):
 
-    __slots__ = ["name", "default", "annotation", "kind"]
+    __slots__ = ["_name", "default", "_annotation", "kind", "_resolver", "_owners"]
     POSITIONAL_OR_KEYWORD = ParameterKind.POSITIONAL_OR_KEYWORD
     POSITIONAL_ONLY = ParameterKind.POSITIONAL_ONLY
     KEYWORD_ONLY = ParameterKind.KEYWORD_ONLY
@@ -116,11 +187,59 @@ class MutableParameter(ParameterLike):
     VAR_KEYWORD = ParameterKind.VAR_KEYWORD
 
     def __init__(self, name: str, default: Any, annotation: Any, kind: _ParameterKind):
+        self._owners: Tuple[weakref.ref, ...] = ()
         self.name = name
         self.default = default
         self.annotation = annotation
         self.kind: _ParameterKind = kind
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        """Rename the parameter. Signatures containing the parameter update
+        their name index."""
+        owners = self._owners
+        if not owners:
+            self._name = value
+            return
+        old = self._name
+        self._name = value
+        for ref in owners:
+            owner = ref()
+            if owner is not None:
+                owner._renamed(self, old)  # noqa
+
+    @property
+    def annotation(self) -> Any:
+        """The annotation of the parameter. String annotations of parameters
+        created from a function are evaluated on first access."""
+        resolver = self._resolver
+        if resolver is not None:
+            self._annotation = resolver(self._annotation)
+            self._resolver = None
+        return self._annotation
+
+    @annotation.setter
+    def annotation(self, value: Any):
+        self._annotation = value
+        self._resolver = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "default": self.default,
+            "annotation": self.annotation,
+            "kind": self.kind,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._owners = ()
+        for k, v in state.items():
+            setattr(self, k, v)
+
     @classmethod
     def from_parameter(cls, param: Parameter) -> MutableParameter:
         return cls(
@@ -163,6 +282,16 @@ class MutableParameter(ParameterLike):
             return False
         return True
 
+    def freeze(self) -> FrozenMutableParameter:
+        """Return an immutable, hashable copy of the parameter."""
+        return FrozenMutableParameter(
+            self.name,
+            self.default,
+            self.annotation,
+            self.kind,
+            source=_parameter_source(self),
+        )
+
     def __str__(self):
         return f"<{self.__class__.__name__}({self.to_parameter()})>"
 
@@ -173,8 +302,103 @@ class MutableParameter(ParameterLike):
 _Param = Union[Parameter, MutableParameter]
 
 
+class _ParameterList(list):
+    """The parameters of a kind in `MutableSignature.param_by_kind`. Modifying
+    the list directly invalidates the caches of the signature. The signature
+    itself modifies the lists with the `list` methods and updates its caches
+    incrementally."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, owner: MutableSignature, params: Iterable[MutableParameter] = ()
+    ):
+        super().__init__(params)
+        self._owner = weakref.ref(owner)
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def _changed(self):
+        owner = self._owner()
+        if owner is not None:
+            owner._lists_changed()  # noqa
+
+
+class _ParameterLists(OrderedDict):
+    """`MutableSignature.param_by_kind`. Lists assigned to it are wrapped in
+    :class:`_ParameterList`, and modifying it invalidates the caches of the
+    signature."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self,
+        owner: MutableSignature,
+        lists: Mapping[_ParameterKind, Iterable[MutableParameter]],
+    ):
+        super().__init__()
+        self._owner = weakref.ref(owner)
+        for kind, params in lists.items():
+            OrderedDict.__setitem__(self, kind, _ParameterList(owner, params))
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
+    def __setitem__(self, kind: _ParameterKind, params: Iterable[MutableParameter]):
+        owner = self._owner()
+        if owner is not None:
+            params = _ParameterList(owner, params)
+        OrderedDict.__setitem__(self, kind, params)
+        self._changed()
+
+    _changed = _ParameterList._changed
+
+
+def _notify_change(method: Callable[..., _T]) -> Callable[..., _T]:
+    @functools.wraps(method)
+    def wrapped(self: _ParameterList, *args: Any, **kwargs: Any) -> _T:
+        result = method(self, *args, **kwargs)
+        self._changed()  # noqa
+        return result
+
+    return wrapped
+
+
+for _method in (
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_ParameterList, _method, _notify_change(getattr(list, _method)))
+
+for _method in ("__delitem__", "clear", "move_to_end", "pop", "popitem"):
+    setattr(_ParameterLists, _method, _notify_change(getattr(OrderedDict, _method)))
+
+
 class MutableSignature(Sequence[MutableParameter]):
 
+    __slots__ = (
+        "_param_by_kind",
+        "_return_annotation",
+        "_resolver",
+        "_version",
+        "_params",
+        "_names",
+        "_index",
+        "_binder",
+        "__weakref__",
+    )
+
     ParameterKind = ParameterKind
     KEYWORD_ONLY = ParameterKind.KEYWORD_ONLY
     POSITIONAL_OR_KEYWORD = ParameterKind.POSITIONAL_OR_KEYWORD
@@ -187,15 +411,19 @@ class MutableSignature(Sequence[MutableParameter]):
         obj: Optional[Union[Callable[..., Any], Signature, List[Parameter]]] = None,
         return_annotation: Any = Null,
     ):
-        self.param_by_kind: OrderedDict[
-            _ParameterKind, List[MutableParameter]
-        ] = OrderedDict(
+        # caches derived from `param_by_kind`, invalidated whenever it is modified
+        self._version = 0
+        self._params: Optional[Tuple[MutableParameter, ...]] = ()
+        self._names: Optional[Dict[str, MutableParameter]] = None
+        self._index: Optional[_ParameterIndex] = None
+        self._binder: Optional[BindingPlan] = None
+        self.param_by_kind = OrderedDict(
             {
-                ParameterKind.POSITIONAL_ONLY: list(),
-                ParameterKind.POSITIONAL_OR_KEYWORD: list(),
-                ParameterKind.VAR_POSITIONAL: list(),
-                ParameterKind.KEYWORD_ONLY: list(),
-                ParameterKind.VAR_KEYWORD: list(),
+                ParameterKind.POSITIONAL_ONLY: [],
+                ParameterKind.POSITIONAL_OR_KEYWORD: [],
+                ParameterKind.VAR_POSITIONAL: [],
+                ParameterKind.KEYWORD_ONLY: [],
+                ParameterKind.VAR_KEYWORD: [],
             }
         )
         if obj:
@@ -203,6 +431,65 @@ class MutableSignature(Sequence[MutableParameter]):
             self.clear_and_add_all(list(s.parameters.values()))
             return_annotation = s.return_annotation
         self.return_annotation = return_annotation
+        if callable(obj):
+            self._defer_annotations(obj)
+
+    def _defer_annotations(self, obj: Callable[..., Any]):
+        """Attach an annotation resolver for `obj` to parameters with string
+        annotations, so they are only evaluated when accessed."""
+        params = [p for p in self.params if isinstance(p._annotation, str)]
+        has_str_return = isinstance(self._return_annotation, str)
+        if not params and not has_str_return:
+            return
+        resolver = get_annotation_resolver(obj)
+        for p in params:
+            p._resolver = resolver
+        if has_str_return:
+            self._resolver = resolver
+
+    @property
+    def return_annotation(self) -> Any:
+        resolver = self._resolver
+        if resolver is not None:
+            self._return_annotation = resolver(self._return_annotation)
+            self._resolver = None
+        return self._return_annotation
+
+    @return_annotation.setter
+    def return_annotation(self, value: Any):
+        self._return_annotation = value
+        self._resolver = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "param_by_kind": self.param_by_kind,
+            "return_annotation": self.return_annotation,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(return_annotation=state["return_annotation"])
+        self.param_by_kind = state["param_by_kind"]
+        for p in self.params:
+            self._own(p)
+
+    @property
+    def param_by_kind(self) -> OrderedDict[_ParameterKind, List[MutableParameter]]:
+        """The parameters by kind. If the mapping or its lists are modified
+        directly, the parameters may end up in the list of a different kind;
+        see `is_valid` and `fix_signature`."""
+        return self._param_by_kind
+
+    @param_by_kind.setter
+    def param_by_kind(self, value: Mapping[_ParameterKind, Iterable[MutableParameter]]):
+        self._param_by_kind = _ParameterLists(self, value)
+        self._touch()
+
+    def _lists_changed(self):
+        """Invalidate the caches after `param_by_kind` was modified directly,
+        and own the parameters that were added."""
+        self._touch()
+        for p in self.params:
+            self._own(p)
 
     def partition(
         self, fn: Callable[[MutableParameter], bool]
@@ -226,9 +513,30 @@ class MutableSignature(Sequence[MutableParameter]):
 
     @property
     def params(self) -> Tuple[MutableParameter, ...]:
-        return tuple(functools.reduce(operator.add, self.param_by_kind.values()))
+        params = self._params
+        if params is None:
+            params = tuple(itertools.chain.from_iterable(self.param_by_kind.values()))
+            self._params = params
+        return params
+
+    @property
+    def version(self) -> int:
+        """Counter that is incremented whenever the parameters change. Objects
+        derived from this signature can use it to detect that they are stale.
+
+        :return: The current version
+        """
+        return self._version
+
+    def _touch(self, keep_names: bool = False):
+        self._version += 1
+        self._params = None
+        self._index = None
+        if not keep_names:
+            self._names = None
 
     def fix_signature(self):
+        self._touch()
         self.clear_and_add_all(self.params)
 
     def is_valid(self) -> bool:
@@ -245,10 +553,50 @@ class MutableSignature(Sequence[MutableParameter]):
 
     def clear_and_add_all(self, params: Sequence[_Param]):
         for v in self.param_by_kind.values():
-            v.clear()
+            for p in v:
+                self._disown(p)
+            list.clear(v)
+        self._touch()
         for p in params:
             self.add(p)
 
+    def compact(self) -> CompactSignature:
+        """Return a compact, read-only copy of the signature, which takes much
+        less memory. See `from_compact` for the reverse conversion.
+
+        :return: The CompactSignature
+        """
+        return _to_compact(self.params, self.return_annotation)
+
+    def freeze(self, intern: bool = True) -> FrozenMutableSignature:
+        """Return an immutable, hashable copy of the signature. Frozen
+        signatures compare equal and hash the same if they have the same
+        structure, so they can be used as cache keys. See
+        `FrozenMutableSignature.thaw` for the reverse conversion.
+
+        :param intern: If True, return the shared instance from the intern
+            table if an identical signature was already frozen
+        :return: The FrozenMutableSignature
+        """
+        frozen = _to_compact(
+            self.params, self.return_annotation, FrozenMutableSignature
+        )
+        if intern:
+            return frozen.intern()
+        return frozen
+
+    @classmethod
+    def from_compact(cls, compact: CompactSignature) -> MutableSignature:
+        """Create a MutableSignature from a CompactSignature.
+
+        :param compact: The compact signature
+        :return: A new MutableSignature
+        """
+        s = cls()
+        s.clear_and_add_all(_from_compact(compact))
+        s.return_annotation = compact.return_annotation
+        return s
+
     def get_signature_parameters(self) -> Tuple[Parameter]:
         return tuple([p.to_parameter() for p in self.params])
 
@@ -266,42 +614,94 @@ class MutableSignature(Sequence[MutableParameter]):
                 yield ParameterLocation(i, j, p)
                 i += 1
 
+    def _get_names(self) -> Dict[str, MutableParameter]:
+        """Return the parameters by name. The name index is updated in place
+        when parameters are added, removed or renamed. It is only kept while
+        the names are unique."""
+        names = self._names
+        if names is None:
+            names = {}
+            for p in self.params:
+                names.setdefault(p.name, p)
+            if len(names) == len(self.params):
+                self._names = names
+        return names
+
+    def _get_index(self) -> _ParameterIndex:
+        """Return the locations of the parameters, rebuilding them if the
+        parameters changed."""
+        if self._index is None:
+            by_id: Dict[int, ParameterLocation] = {}
+            by_position: List[ParameterLocation] = []
+            for x in self._enum_param_lists():
+                by_id[id(x.param)] = x
+                by_position.append(x)
+            self._index = _ParameterIndex(by_id, by_position)
+        return self._index
+
+    def _own(self, param: MutableParameter):
+        param._owners = _add_owner(param._owners, weakref.ref(self))  # noqa
+
+    def _disown(self, param: MutableParameter):
+        ref = weakref.ref(self)
+        param._owners = tuple(r for r in param._owners if r is not ref)  # noqa
+
+    def _renamed(self, param: MutableParameter, old: str):
+        """Update the name index after `param` was renamed."""
+        names = self._names
+        if names is not None:
+            if names.get(old) is not param:
+                # not a parameter of this signature (anymore)
+                return
+            del names[old]
+            if param.name in names:
+                self._names = None
+            else:
+                names[param.name] = param
+        self._touch(keep_names=True)
+
+    def _find(self, key: Union[int, str, _Param], strict: bool) -> MutableParameter:
+        if isinstance(key, int):
+            params = self.params
+            if 0 <= key < len(params):
+                p = params[key]
+                if p.kind == Parameter.KEYWORD_ONLY and strict:
+                    raise SignatureMissingParameterException(
+                        f"There is no positional parameter {key}. "
+                        f"There is a Keyword-only parameter {p}. "
+                        f"Set `strict=False`, to return this parameter."
+                    )
+                return p
+        elif isinstance(key, str):
+            p = self._get_names().get(key)
+            if p is not None:
+                if p.kind == Parameter.POSITIONAL_ONLY and strict:
+                    raise SignatureMissingParameterException(
+                        f"There is no keyword parameter {key}. "
+                        f"There is a Positional-only parameter {p}. "
+                        f"Set `strict=False`, to return this parameter."
+                    )
+                return p
+        else:
+            p = self._get_names().get(key.name)
+            if (
+                p is not None
+                and p.annotation == key.annotation
+                and p.kind == key.kind
+                and p.default == key.default
+            ):
+                return p
+        raise SignatureMissingParameterException(f"Could not find parameter '{key}'")
+
     def get_pos_and_param(
         self, key: Union[int, str, _Param], strict: bool = True
     ) -> ParameterLocation:
-        for x in self._enum_param_lists():
-            if isinstance(key, int):
-                if x.param_index == key:
-                    if x.param.kind == Parameter.KEYWORD_ONLY and strict:
-                        raise SignatureMissingParameterException(
-                            f"There is no positional parameter {x.index}. "
-                            f"There is a Keyword-only parameter {x.param}. "
-                            f"Set `strict=False`, to return this parameter."
-                        )
-                    return x
-            elif isinstance(key, str):
-                if x.param.name == key:
-                    if x.param.kind == Parameter.POSITIONAL_ONLY and strict:
-                        raise SignatureMissingParameterException(
-                            f"There is no keyword parameter {key}. "
-                            f"There is a Positional-only parameter {x.param}. "
-                            f"Set `strict=False`, to return this parameter."
-                        )
-                    return x
-            else:
-                if (
-                    x.param.name == key.name
-                    and x.param.annotation == key.annotation
-                    and x.param.kind == key.kind
-                    and x.param.default == key.default
-                ):
-                    return x
-        raise SignatureMissingParameterException(f"Could not find parameter '{key}'")
+        return self._get_index().by_id[id(self._find(key, strict))]
 
     def get_param(
         self, key: Union[int, str, _Param], strict: bool = True
     ) -> MutableParameter:
-        return self.get_pos_and_param(key, strict=strict)[-1]
+        return self._find(key, strict)
 
     def get_params(
         self, fn: Optional[Callable[[_Param], bool]] = None
@@ -309,7 +709,7 @@ class MutableSignature(Sequence[MutableParameter]):
         if fn:
             return tuple([p for p in self.params if fn(p)])
         else:
-            return tuple(self.params)
+            return self.params
 
     def get_pos_params(self) -> Tuple[MutableParameter, ...]:
         fn = typing.cast(
@@ -344,7 +744,7 @@ class MutableSignature(Sequence[MutableParameter]):
 
     def __contains__(self, item: Union[int, str]):
         try:
-            self.get_pos_and_param(item)
+            self._find(item, True)
             return True
         except SignatureMissingParameterException:
             return False
@@ -354,9 +754,17 @@ class MutableSignature(Sequence[MutableParameter]):
 
     def _add(self, index: int, other: MutableParameter):
         if index == -1:
-            self.param_by_kind[other.kind].append(other)
+            list.append(self.param_by_kind[other.kind], other)
         else:
-            self.param_by_kind[other.kind].insert(index, other)
+            list.insert(self.param_by_kind[other.kind], index, other)
+        self._own(other)
+        self._touch(keep_names=True)
+        names = self._names
+        if names is not None:
+            if other.name in names:
+                self._names = None
+            else:
+                names[other.name] = other
 
     def _create_and_add_parameter(
         self,
@@ -413,18 +821,39 @@ class MutableSignature(Sequence[MutableParameter]):
 
     def remove(self, param: Union[str, int, MutableParameter, Parameter]):
         param_to_delete = self.get_param(param)
-        for _i, _j, p in self._enum_param_lists():
-            plist = self.param_by_kind[p.kind]
-            if p is param_to_delete:
-                plist.remove(p)
-                return
-        raise IndexError(f"Could not remove '{param}'")
+        self._remove_all([param_to_delete])
+
+    def rename(self, param: Union[int, str], name: str) -> MutableParameter:
+        """Rename a parameter.
+
+        :param param: The parameter to rename
+        :param name: The new name
+        :return: The renamed parameter
+        """
+        if name in self._get_names():
+            raise SignatureException(f"Parameter '{name}' already exists")
+        p = self[param]
+        p.name = name
+        return p
+
+    def _remove_all(self, params: Sequence[MutableParameter]):
+        """Remove parameters by identity in a single pass."""
+        ids = {id(p) for p in params}
+        for plist in self.param_by_kind.values():
+            list.__setitem__(plist, slice(None), [p for p in plist if id(p) not in ids])
+        names = self._names
+        for p in params:
+            self._disown(p)
+            if names is not None and names.get(p.name) is p:
+                del names[p.name]
+        self._touch(keep_names=True)
 
     def __str__(self):
         inner_str = ", ".join([str(p) for p in self.get_signature_parameters()])
         str_repr = f"<{self.__class__.__name__}({inner_str})"
         if self.return_annotation:
-            str_repr += f" -> {self.return_annotation.__name__}"
+            name = getattr(self.return_annotation, "__name__", self.return_annotation)
+            str_repr += f" -> {name}"
         str_repr += ">"
         return str_repr
 
@@ -473,14 +902,128 @@ class MutableSignature(Sequence[MutableParameter]):
         params = [self[k] for k in from_params]
         packed = MutableParameterTuple(params, name=name, kind=kind)
 
-        to_remove = [self[k] for k in from_params]
-        for p in to_remove:
-            self.remove(p)
+        self._remove_all(params)
         self.insert(position, packed)
 
+    def unpack(
+        self,
+        param: Union[int, str],
+        names: Optional[Sequence[str]] = None,
+        position: Optional[int] = None,
+        container: Any = None,
+    ):
+        """Split a packed parameter into individual parameters. This is the
+        inverse of `pack`.
+
+        Parameters packed by `pack` are replaced by their original members.
+        Other parameters are split according to their annotation: a
+        `NamedTuple` or `TypedDict` is split into its fields, a `Tuple[...]`
+        into one parameter per item. Transformed functions then receive the
+        packed value rebuilt from the individual arguments.
+
+        .. code-block:: python
+
+            def fn1(a, bc: Tuple[int, str]):
+                return a, bc
+
+            s = MutableSignature(fn1)
+            s.unpack("bc", names=["b", "c"])
+            s.transform(fn1)(1, 2, "c")  # (1, (2, 'c'))
+
+        :param param: The parameter to unpack
+        :param names: Names of the new parameters. Required unless they can be
+            inferred from the parameter (defaults to the field names, or to
+            `{name}_{i}` for tuples).
+        :param position: Position to insert the new parameters, relative to the
+            parameter kind (see `pack`). Defaults to the position of `param`.
+        :param container: Type used to rebuild the packed value (e.g. `tuple`,
+            `dict` or a NamedTuple class). Inferred from the annotation by default.
+        :return:
+        """
+        loc = self.get_pos_and_param(param)
+        packed = loc.param
+        if packed.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            raise ValueError(f"Cannot unpack variadic parameter '{packed.name}'")
+        if position is None:
+            position = loc.relative_index_to_kind
+        if isinstance(packed, MutableParameterTuple):
+            members = list(packed.parameters)
+            if names is not None:
+                if len(names) != len(members):
+                    raise ValueError(f"Expected {len(members)} names, got {len(names)}")
+                # members may be shared with other signatures, so they are copied
+                members = [
+                    m if m.name == member_name else _renamed_copy(m, member_name)
+                    for m, member_name in zip(members, names)
+                ]
+        else:
+            members = _unpacked_members(packed, names, container)
+        self._remove_all([packed])
+        for i, member in enumerate(members):
+            self.insert(position + i, member)
+
     def bind(self, *args: Any, **kwargs: Any) -> BoundSignature:  # noqa
         return BoundSignature(self, *args, **kwargs)
 
+    def bind_many(
+        self, records: Iterable[ArgsKwargs]
+    ) -> Generator[BoundArguments, None, None]:
+        """Lazily bind many `(args, kwargs)` records to the signature.
+
+        Equivalent to calling `bind` for each record, but the binding tables are
+        computed once and lightweight :class:`BoundArguments` are yielded instead
+        of BoundSignatures.
+
+        :param records: Iterable of `(args, kwargs)` tuples
+        :return: Generator of BoundArguments
+        """
+        return self.compile_binder().bind_many(records)
+
+    def bind_columns(
+        self,
+        records: Iterable[ArgsKwargs],
+        dtypes: Optional[Mapping[str, Any]] = None,
+    ) -> ColumnBatch:
+        """Bind many `(args, kwargs)` records at once, collecting the values of
+        each parameter into a NumPy array. Requires NumPy.
+
+        Packed parameters become record arrays with a field per member.
+        Call a function transformed with `columnar=True` with the batch to
+        call it once for all records:
+
+        .. code-block:: python
+
+            def fn(x, y, scale=1):
+                return (x + y) * scale
+
+            s = MutableSignature(fn)
+            s.pack(("x", "y"), name="point")
+            batch = s.bind_columns([(((1, 2),), {}), (((3, 4),), {"scale": 2})])
+            batch.call(s.transform(fn, columnar=True))  # array([ 3, 14])
+
+        :param records: Iterable of `(args, kwargs)` tuples
+        :param dtypes: Optional NumPy dtypes by parameter (or member) name
+        :return: The batch
+        """
+        specs = [
+            _column_spec(p)
+            for p in self.params
+            if p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        ]
+        return bind_columns(specs, self.compile_binder(), records, dtypes)
+
+    def compile_binder(self) -> BindingPlan:
+        """Return the binding plan for the current parameters. The plan is
+        cached until the signature changes.
+
+        :return: The binding plan
+        """
+        plan = self._binder
+        if plan is None or plan.version != self._version:
+            plan = BindingPlan(self.params, version=self._version)
+            self._binder = plan
+        return plan
+
     def reorder(self, *params: Union[int, str, Parameter, MutableParameter]):
         """Attempt to reorder the signature. Note that parameters of different
         kinds cannot be re-ordered.
@@ -489,70 +1032,575 @@ class MutableSignature(Sequence[MutableParameter]):
         :return:
         """
         new_params: List[MutableParameter] = []
+        seen = set()
         for p in params:
             p2 = self.get_param(p)
-            if p2 in new_params:
+            if id(p2) in seen:
                 raise SignatureException(f"Parameter '{p}' designated twice.")
+            seen.add(id(p2))
             new_params.append(p2)
         assert len(new_params) == len(self)
         for v in self.param_by_kind.values():
-            v.clear()
+            list.clear(v)
         for p in new_params:
-            self.add(p)
+            list.append(self.param_by_kind[p.kind], p)
+        self._touch(keep_names=True)
 
-    def transform(self, f: Callable[..., _T], name: Optional[str] = None):
-        s1 = self.__class__(f)
-        b1 = s1.bind()
+    def adapter_spec(
+        self,
+        target: Union[MutableSignature, SignatureLike],
+        check_types: bool = False,
+        check_every: int = 1,
+        fixed: Optional[Sequence[Tuple[MutableParameter, Any]]] = None,
+        aliases: Optional[Mapping[str, str]] = None,
+        columnar: bool = False,
+    ) -> AdapterSpec:
+        """Describe how arguments for this signature map onto the parameters
+        of `target`. Parameters are matched by name, packed parameters are
+        matched by the names of their members. Parameters with defaults that
+        do not map onto `target` are listed in `unmatched`.
+
+        :param target: The signature (or function) being called
+        :param check_types: If True, arguments are checked against the
+            annotations of this signature
+        :param check_every: Only check types on every Nth call
+        :param fixed: `(parameter, value)` pairs of parameters that are not in
+            this signature but are always passed to `target` with a constant value
+        :param aliases: Names of parameters of `target` by the names of the
+            (renamed) parameters of this signature
+        :param columnar: If True, members of packed parameters are accessed by
+            name instead of by position, as fields of record arrays (see
+            `bind_columns`)
+        :return: The argument mapping
+        """
+        if not isinstance(target, MutableSignature):
+            target = self.__class__(target)
+        sources: Dict[str, ArgumentSpec] = {}
+        groups: Dict[str, Tuple[UnpackedParameter, Dict[Any, ArgumentSpec]]] = {}
+
+        aliases = aliases or {}
+
+        def add_source(leaf: MutableParameter, arg: ArgumentSpec):
+            if isinstance(leaf, UnpackedParameter):
+                packed_name = aliases.get(leaf.packed_name, leaf.packed_name)
+                _, members = groups.setdefault(packed_name, (leaf, {}))
+                members[leaf.key] = arg
+            else:
+                name = _source_name(leaf)
+                sources[aliases.get(name, name)] = arg
 
+        for p in self.params:
+            for leaf, path in _iter_leaf_params(p, by_name=columnar):
+                add_source(leaf, ArgumentSpec(leaf.name, leaf.kind, p.name, path))
+        for leaf, value in fixed or ():
+            add_source(leaf, ArgumentSpec(leaf.name, leaf.kind, value=value))
+
+        arguments: List[ArgumentSpec] = []
+        for p in target.params:
+            if p.name in sources:
+                arguments.append(sources.pop(p.name)._replace(name=p.name, kind=p.kind))
+            elif p.name in groups:
+                leaf, members = groups.pop(p.name)
+                missing = [k for k in leaf.keys if k not in members]
+                if missing:
+                    raise SignatureMissingParameterException(
+                        f"No parameters map onto {missing} of parameter '{p.name}'"
+                    )
+                arguments.append(
+                    ArgumentSpec(
+                        p.name,
+                        p.kind,
+                        container=leaf.container,
+                        members=tuple(members[k]._replace(name=k) for k in leaf.keys),
+                    )
+                )
+            elif p.default is empty and p.kind not in (
+                Parameter.VAR_POSITIONAL,
+                Parameter.VAR_KEYWORD,
+            ):
+                raise SignatureMissingParameterException(
+                    f"No parameter maps onto required parameter '{p.name}'"
+                )
+            elif p.is_positional():
+                # fills the gap before later positional arguments
+                arguments.append(ArgumentSpec(p.name, p.kind, value=p.default))
+            else:
+                arguments.append(ArgumentSpec(p.name, p.kind))
+        # parameters with defaults that do not map onto the target only fail
+        # when a value is passed for them, as in interpreted wrappers
+        defaults = {p.name for p in self.params if p.default is not empty}
+        unmatched = tuple(
+            dict.fromkeys(a.source for a in sources.values() if a.source in defaults)
+        )
+        missing = [n for n, a in sources.items() if a.source not in defaults]
+        if missing or groups:
+            raise SignatureMissingParameterException(
+                f"Could not find parameters {missing + list(groups)} "
+                "in target signature"
+            )
+        if check_types:
+            params = tuple(
+                ParameterSpec(
+                    p.name,
+                    p.kind,
+                    p.default,
+                    compile_type_check(p.annotation),
+                    p.annotation,
+                )
+                for p in self.params
+            )
+        else:
+            params = tuple(
+                ParameterSpec(p.name, p.kind, p.default) for p in self.params
+            )
+        return AdapterSpec(params, tuple(arguments), check_every, unmatched)
+
+    def transform(
+        self,
+        f: Callable[..., _T],
+        name: Optional[str] = None,
+        compiled: bool = True,
+        check_types: bool = False,
+        check_every: int = 1,
+        profile: Optional[bool] = None,
+        picklable: bool = False,
+        columnar: bool = False,
+    ) -> Callable[..., _T]:
+        """Wrap `f` so that it can be called using this signature.
+
+        A SignatureMissingParameterException is raised if a parameter without
+        a default does not map onto `f`. Parameters with defaults that do not
+        map onto `f` raise a ValueError only when a value is passed for them.
+
+        :param f: The function to wrap
+        :param name: Optional new name of the wrapped function
+        :param compiled: If True (default), the argument mapping is analyzed once
+            and compiled into a specialized adapter function. Otherwise, arguments
+            are bound and remapped on every call.
+        :param check_types: If True, arguments are checked against the parameter
+            annotations and an ArgumentTypeError is raised on a mismatch. The
+            annotations are compiled into checks once, when wrapping.
+        :param check_every: Only check types on every Nth call, to limit the
+            overhead of checking. The first call is always checked.
+        :param profile: If True, the wrapper records call statistics (see
+            :mod:`jdv_funcutils.signature.profiling`). Defaults to whether
+            profiling is enabled when the wrapper is created.
+        :param picklable: If True, return a :class:`TransformedFunction`, which
+            can be pickled (e.g. to call it in a process pool) if `f` can.
+            Picklable wrappers are always compiled and cannot be profiled.
+        :param columnar: If True, the wrapper is called with the arrays of a
+            :class:`ColumnBatch` (see `bind_columns`), i.e. packed parameters
+            are record arrays. Columnar wrappers are always compiled and do
+            not check types.
+        :return: The wrapped function
+        """
+        if check_every < 1:
+            raise ValueError("check_every must be at least 1")
+        if picklable and (not compiled or profile):
+            raise ValueError("Picklable wrappers must be compiled and not profiled")
+        if columnar and (not compiled or check_types):
+            raise ValueError("Columnar wrappers must be compiled and not type checked")
         name = name or f.__name__
         fdoc = f.__doc__ or ""
         fdoc = (
             f"New Signature: {name}{self.to_signature()}\n"
             + "\n"
-            + left_align(f"{name}{inspect.signature(f)}:\n")
+            + left_align(f"{name}{get_signature(f)}:\n")
             + textwrap.indent(textwrap.dedent(fdoc), "    ").strip("\n")
         )
 
-        @copy_signature(self.to_signature())
-        @functools.wraps(f)
-        def wrapped(*args: Any, **kwargs: Any):
-            b2 = self.bind(*args, **kwargs)
-
-            parameter_values: List[BoundParamValue] = []
-            i = 0
-            for pv in b2.bound:
-                if isinstance(pv.mutable_parameter, MutableParameterTuple):
-                    for _param, _value in zip(
-                        pv.mutable_parameter.parameters, pv.value
-                    ):
-                        key = _param.name
-                        if _param.is_positional_only():
-                            key = i
-                        parameter_values.append(
-                            typing.cast(
-                                BoundParamValue,
-                                ParameterValue(
-                                    key=key, value=_value, mutable_parameter=_param
-                                ),
-                            )
-                        )
-                else:
-                    parameter_values.append(pv)
-
-            for pv in parameter_values:
-                param_value2 = b1.get(pv.mutable_parameter.name)
-                if param_value2 is not None:
-                    param_value2.value = pv.value
-                else:
-                    raise ValueError(f"Could not find parameter value for {pv.name}")
-            return f(*b1.args, **b1.kwargs)
-
+        if profile is None:
+            profile = profiling_enabled() and not picklable
+        stats = CallStats(profile_name(f)) if profile else None
+        target = f if stats is None else time_callee(f, stats)
+
+        if picklable:
+            spec = self.adapter_spec(f, check_types, check_every, columnar=columnar)
+            wrapped = TransformedFunction(f, spec, self.to_signature())
+        elif compiled:
+            spec = self.adapter_spec(f, check_types, check_every, columnar=columnar)
+            wrapped = compile_adapter(spec, target, name="wrapped")
+            functools.update_wrapper(wrapped, f)
+            wrapped.__signature__ = self.to_signature()  # noqa
+        else:
+            wrapped = self._interpreted_transform(target, check_types, check_every)
+        if stats is not None:
+            wrapped = time_calls(wrapped, f, stats)
         wrapped.__doc__ = fdoc
         wrapped.__name__ = name
         return wrapped
 
+    def map(
+        self,
+        f: Callable[..., _T],
+        records: Iterable[Record],
+        executor: ExecutorLike = "thread",
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
+        check_types: bool = False,
+    ) -> Generator[_T, None, None]:
+        """Lazily call `f` using this signature with each record, in a thread or
+        process pool. See :func:`jdv_funcutils.signature.parallel.parallel_map`.
+
+        .. code-block:: python
+
+            def fn(a, b):
+                return a - b
+
+            s = MutableSignature(fn)
+            s.reorder("b", "a")
+            list(s.map(fn, [((1, 2), {}), {"a": 4, "b": 3}]))  # [1, 1]
+
+        Records are bound to this signature in the calling process, so invalid
+        records raise a SignatureException before they are sent to the pool.
+        For process pools, `f` is wrapped in a picklable
+        :class:`TransformedFunction`, so `f` must be picklable.
+
+        :param f: The function to call
+        :param records: Iterable of `(args, kwargs)` tuples or keyword mappings
+        :param executor: "thread", "process" or an existing Executor
+        :param max_workers: Number of workers of created executors
+        :param chunksize: Number of records sent to a worker at once
+        :param ordered: If True (default), results are yielded in the order of the
+            records. Otherwise, they are yielded as soon as they are ready.
+        :param max_in_flight: Maximum number of pending chunks
+        :param check_types: If True, arguments are type checked. See `transform`.
+        :return: Generator of results
+        """
+        wrapped = self.transform(
+            f, check_types=check_types, picklable=is_process_executor(executor)
+        )
+        return parallel_map(
+            wrapped,
+            records,
+            executor=executor,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            plan=self.compile_binder(),
+        )
+
+    def record_adapter(
+        self, columns: Optional[Sequence[Optional[str]]] = None
+    ) -> RecordAdapter:
+        """Return a :class:`RecordAdapter` converting dict rows (or tuple rows
+        with the given column layout) into `(args, kwargs)` for this signature.
+
+        :param columns: The parameter names of the fields of tuple rows. None
+            marks columns to ignore.
+        :return: The record adapter
+        """
+        return RecordAdapter(self.compile_binder(), columns)
+
+    def partial(
+        self, f: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> Callable[..., _T]:
+        """Wrap `f` so that it can be called using this signature, with some
+        parameters fixed to the given arguments (as in `functools.partial`).
+
+        The arguments are bound once and the fixed values are compiled into
+        the wrapper as constants, so calls do not bind arguments again.
+
+        .. code-block:: python
+
+            def fn(a, b, c):
+                return a, b, c
+
+            p = MutableSignature(fn).partial(fn, 1, c=3)
+            p(2)  # (1, 2, 3)
+
+        :param f: The function to wrap
+        :param args: Positional arguments to fix
+        :param kwargs: Keyword arguments to fix
+        :return: The wrapped function, with the signature of the unbound parameters
+        """
+        unbound, fixed = self._bind_fixed(*args, **kwargs)
+        return unbound._compile_partial(f, fixed)
+
+    def curry(
+        self, f: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> Callable[..., Any]:
+        """Curry `f`, so that it can be called with the arguments of this
+        signature one or more at a time.
+
+        Calling the curried function with values for all remaining required
+        parameters calls `f`. Otherwise, the given arguments are fixed (as in
+        `partial`) and a curried function of the remaining parameters is
+        returned.
+
+        .. code-block:: python
+
+            def fn(a, b, c=3):
+                return a, b, c
+
+            curried = MutableSignature(fn).curry(fn)
+            curried(1)(2)  # (1, 2, 3)
+            curried(1)(b=2, c=4)  # (1, 2, 4)
+            curried(1, 2)  # (1, 2, 3)
+
+        Each curried function compiles its fixed arguments into a wrapper of
+        `f` when it is created, so the final call does not bind arguments.
+
+        :param f: The function to curry
+        :param args: Positional arguments to fix
+        :param kwargs: Keyword arguments to fix
+        :return: The curried function, with the signature of the unbound parameters
+        """
+        unbound, fixed = self._bind_fixed(*args, **kwargs)
+        return unbound._curry(f, fixed)
+
+    def _bind_fixed(
+        self, *args: Any, **kwargs: Any
+    ) -> Tuple[MutableSignature, List[Tuple[MutableParameter, Any]]]:
+        """Bind arguments to fix. Return the signature of the unbound
+        parameters and the fixed `(parameter, value)` pairs."""
+        bound = self.bind(*args, **kwargs)
+        if bound.values_missing_params:
+            extra = [pv.value for pv in bound.values_missing_params]
+            raise SignatureException(f"No parameters for arguments {extra}")
+        fixed: List[Tuple[MutableParameter, Any]] = []
+        for pv in bound.bound:
+            fixed += _iter_leaf_values(pv.mutable_parameter, pv.value)
+        return bound.unbound_signature(), fixed
+
+    def _compile_partial(
+        self, f: Callable[..., _T], fixed: List[Tuple[MutableParameter, Any]]
+    ) -> Callable[..., _T]:
+        spec = self.adapter_spec(f, fixed=fixed)
+        wrapped = compile_adapter(spec, f, name="partial")
+        functools.update_wrapper(wrapped, f)
+        wrapped.__signature__ = self.to_signature()  # noqa
+        return wrapped
+
+    def _curry(
+        self, f: Callable[..., Any], fixed: List[Tuple[MutableParameter, Any]]
+    ) -> Callable[..., Any]:
+        wrapped = self._compile_partial(f, fixed)
+        positional = [p.name for p in self.params if p.is_positional()]
+        required = {
+            p.name
+            for p in self.params
+            if p.default is empty
+            and p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        }
+
+        def curried(*args: Any, **kwargs: Any) -> Any:
+            given = itertools.chain(positional[: len(args)], kwargs)
+            if required.issubset(given):
+                return wrapped(*args, **kwargs)
+            unbound, more = self._bind_fixed(*args, **kwargs)
+            return unbound._curry(f, fixed + more)  # noqa
+
+        functools.update_wrapper(curried, f)
+        curried.__signature__ = self.to_signature()  # noqa
+        return curried
+
+    def _interpreted_transform(
+        self, f: Callable[..., _T], check_types: bool, check_every: int
+    ) -> Callable[..., _T]:
+        # fail on the same invalid mappings as compiled wrappers
+        self.adapter_spec(f)
+        target = self.__class__(f).params
+        target_names = {p.name for p in target}
+        unpacked: Dict[str, List[UnpackedParameter]] = {}
+        for p in self.params:
+            for leaf, _ in _iter_leaf_params(p):
+                if isinstance(leaf, UnpackedParameter):
+                    unpacked.setdefault(leaf.packed_name, []).append(leaf)
+        checks: Dict[str, Tuple[Callable[[Any], bool], Any]] = {}
+        if check_types:
+            for p in self.params:
+                checker = compile_checker(p.annotation)
+                if checker is not None:
+                    checks[p.name] = (checker, p.annotation)
+        calls = itertools.count()
+
+        def call(*args: Any, **kwargs: Any):
+            # all per-call state is local, which makes the wrapper thread-safe and reentrant
+            values: Dict[str, Any] = {}
+            bound = self.bind(*args, **kwargs).bound
+            if checks and next(calls) % check_every == 0:
+                for pv in bound:
+                    param_name = pv.mutable_parameter.name
+                    checker, annotation = checks.get(param_name, (None, None))
+                    if checker is not None and not checker(pv.value):
+                        raise argument_type_error(param_name, pv.value, annotation)
+            members: Dict[str, Dict[Any, Any]] = {k: {} for k in unpacked}
+            for pv in bound:
+                for _param, _value in _iter_leaf_values(pv.mutable_parameter, pv.value):
+                    if isinstance(_param, UnpackedParameter):
+                        members[_param.packed_name][_param.key] = _value
+                        continue
+                    name = _source_name(_param)
+                    if name not in target_names:
+                        raise ValueError(f"Could not find parameter value for {name}")
+                    values[name] = _value
+            for packed_name, leaves in unpacked.items():
+                group = members[packed_name]
+                for leaf in leaves:
+                    if leaf.key not in group and leaf.default is not empty:
+                        group[leaf.key] = leaf.default
+                values[packed_name] = leaves[0].pack_values(group)
+            call_args, call_kwargs = _to_call_args(target, values)
+            return f(*call_args, **call_kwargs)
+
+        wrapped = compile_forwarder(call, name="wrapped", kind=function_kind(f))
+        functools.update_wrapper(wrapped, f)
+        wrapped.__signature__ = self.to_signature()  # noqa
+        return wrapped
+
+
+def _iter_leaf_values(
+    param: MutableParameter, value: Any
+) -> Generator[Tuple[MutableParameter, Any], None, None]:
+    if isinstance(param, MutableParameterTuple):
+        for _param, _value in zip(param.parameters, value):
+            yield from _iter_leaf_values(_param, _value)
+    else:
+        yield param, value
+
+
+def _to_call_args(
+    params: Sequence[MutableParameter], values: Dict[str, Any]
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """Arrange values by parameter name into call arguments for `params`.
+
+    Positional parameters without a value are filled with their
+    defaults when a later positional argument is given.
+    """
+    args: List[Any] = []
+    kwargs: Dict[str, Any] = {}
+    skipped: List[MutableParameter] = []
+    for p in params:
+        if p.name not in values:
+            if p.is_positional():
+                skipped.append(p)
+            continue
+        value = values[p.name]
+        if p.is_positional() or p.kind is Parameter.VAR_POSITIONAL:
+            for _p in skipped:
+                if _p.default is empty:
+                    raise SignatureMissingParameterException(
+                        f"Missing value for parameter '{_p.name}'"
+                    )
+                args.append(_p.default)
+            skipped.clear()
+            if p.kind is Parameter.VAR_POSITIONAL:
+                args.extend(value)
+            else:
+                args.append(value)
+        elif p.kind is Parameter.VAR_KEYWORD:
+            kwargs.update(value)
+        else:
+            kwargs[p.name] = value
+    return args, kwargs
+
+
+def _to_compact(
+    params: Sequence[MutableParameter],
+    return_annotation: Any = Null,
+    cls: Type[CompactSignature] = CompactSignature,
+) -> CompactSignature:
+    members = None
+    if any(isinstance(p, MutableParameterTuple) for p in params):
+        members = tuple(
+            _to_compact(p.parameters, cls=cls)
+            if isinstance(p, MutableParameterTuple)
+            else None
+            for p in params
+        )
+    sources = None
+    if any(isinstance(p, (UnpackedParameter, RenamedParameter)) for p in params):
+        sources = tuple(_parameter_source(p) for p in params)
+    return cls(
+        tuple(p.name for p in params),
+        tuple(p.kind for p in params),
+        tuple(p.default for p in params),
+        tuple(p.annotation for p in params),
+        members,
+        return_annotation,
+        sources,
+    )
+
+
+def _from_compact(compact: CompactSignature) -> List[MutableParameter]:
+    members = compact.members or (None,) * len(compact)
+    sources = compact.sources or (None,) * len(compact)
+    return [
+        _thaw_parameter(*args)
+        for args in zip(
+            compact.names,
+            compact.defaults,
+            compact.annotations,
+            compact.kinds,
+            members,
+            sources,
+        )
+    ]
+
+
+def _thaw_parameter(
+    name: str,
+    default: Any,
+    annotation: Any,
+    kind: _ParameterKind,
+    members: Optional[CompactSignature],
+    source: Optional[ParameterSource],
+) -> MutableParameter:
+    if members is not None:
+        return MutableParameterTuple(
+            _from_compact(members),
+            annotation=annotation,
+            name=name,
+            default=default,
+            kind=kind,
+        )
+    if source is None:
+        return MutableParameter(name, default, annotation, kind)
+    if source.keys is None:
+        return RenamedParameter(name, default, annotation, kind, source.name)
+    return UnpackedParameter(
+        name,
+        default,
+        annotation,
+        kind,
+        packed_name=source.name,
+        container=source.container,
+        key=source.key,
+        keys=source.keys,
+    )
+
+
+def _iter_leaf_params(
+    param: MutableParameter, path: Tuple[Union[int, str], ...] = (), by_name=False
+) -> Generator[Tuple[MutableParameter, Tuple[Union[int, str], ...]], None, None]:
+    if isinstance(param, MutableParameterTuple):
+        for i, p in enumerate(param.parameters):
+            key = p.name if by_name else i
+            yield from _iter_leaf_params(p, path + (key,), by_name)
+    else:
+        yield param, path
+
+
+def _column_spec(param: MutableParameter) -> ColumnSpec:
+    fields = None
+    if isinstance(param, MutableParameterTuple):
+        fields = tuple(_column_spec(p) for p in param.parameters)
+    return ColumnSpec(param.name, param.kind, param.default, fields)
+
 
 class MutableParameterTuple(MutableParameter):
+
+    __slots__ = ["parameters"]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["parameters"] = self.parameters
+        return state
+
     def __init__(
         self,
         parameters: List[MutableParameter],
@@ -562,6 +1610,7 @@ class MutableParameterTuple(MutableParameter):
         kind: _ParameterKind = ParameterKind.POSITIONAL_OR_KEYWORD,
     ):
         # super().__init__(name, default, annotation, kind)
+        self._owners = ()
         if name is not None:
             self.name = name
         else:
@@ -578,9 +1627,423 @@ class MutableParameterTuple(MutableParameter):
                 default = [p.default for p in parameters]
         self.default = default
 
+    def freeze(self) -> FrozenMutableParameter:
+        return FrozenMutableParameter(
+            self.name,
+            self.default,
+            self.annotation,
+            self.kind,
+            _to_compact(self.parameters, cls=FrozenMutableSignature),
+        )
+
+
+class UnpackedParameter(MutableParameter):
+    """A parameter split out of another parameter by `MutableSignature.unpack`.
+
+    Transformed functions receive the value of the original parameter
+    `packed_name`, rebuilt from the values of all members with the same
+    `packed_name` (see `pack_values`). `key` is the index or dict key of this
+    member and `keys` the keys of all members, in order.
+    """
+
+    __slots__ = ["packed_name", "container", "key", "keys"]
+
+    def __init__(
+        self,
+        name: str,
+        default: Any,
+        annotation: Any,
+        kind: _ParameterKind,
+        packed_name: str,
+        container: Any,
+        key: Union[int, str],
+        keys: Tuple[Union[int, str], ...],
+    ):
+        super().__init__(name, default, annotation, kind)
+        self.packed_name = packed_name
+        self.container = container
+        self.key = key
+        self.keys = keys
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        for k in self.__slots__:
+            state[k] = getattr(self, k)
+        return state
+
+    def pack_values(self, values: Mapping[Union[int, str], Any]) -> Any:
+        """Rebuild the packed value from member values by key."""
+        if self.container is dict:
+            return {k: values[k] for k in self.keys}
+        items = (values[k] for k in self.keys)
+        if self.container is tuple:
+            return tuple(items)
+        return self.container(*items)
+
+
+class RenamedParameter(MutableParameter):
+    """A member of a packed parameter that was renamed by
+    `MutableSignature.unpack`. Transformed functions receive its value as
+    the parameter `source_name`."""
+
+    __slots__ = ["source_name"]
+
+    def __init__(
+        self,
+        name: str,
+        default: Any,
+        annotation: Any,
+        kind: _ParameterKind,
+        source_name: str,
+    ):
+        super().__init__(name, default, annotation, kind)
+        self.source_name = source_name
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["source_name"] = self.source_name
+        return state
+
+
+class ParameterSource(NamedTuple):
+    """The origin of an unpacked (or renamed) parameter in compact and frozen
+    signatures. `keys` is None for renamed parameters."""
+
+    name: str
+    container: Any = None
+    key: Optional[Union[int, str]] = None
+    keys: Optional[Tuple[Union[int, str], ...]] = None
+
+
+def _parameter_source(param: MutableParameter) -> Optional[ParameterSource]:
+    if isinstance(param, UnpackedParameter):
+        return ParameterSource(
+            param.packed_name, param.container, param.key, param.keys
+        )
+    if isinstance(param, RenamedParameter):
+        return ParameterSource(param.source_name)
+    return None
+
+
+def _source_name(param: MutableParameter) -> str:
+    """Return the name of the parameter of the transformed function that
+    receives the value of `param`."""
+    if isinstance(param, RenamedParameter):
+        return param.source_name
+    return param.name
+
+
+def _renamed_copy(param: MutableParameter, name: str) -> MutableParameter:
+    if type(param) is MutableParameter:
+        return RenamedParameter(
+            name, param.default, param.annotation, param.kind, source_name=param.name
+        )
+    # packed and unpacked parameters are not matched by their own name
+    renamed = copy.copy(param)
+    renamed.name = name
+    return renamed
+
+
+def _is_typed_dict(annotation: Any) -> bool:
+    return (
+        isinstance(annotation, type)
+        and issubclass(annotation, dict)
+        and hasattr(annotation, "__total__")
+    )
+
+
+def _unpacked_members(
+    param: MutableParameter, names: Optional[Sequence[str]], container: Any
+) -> List[UnpackedParameter]:
+    annotation = param.annotation
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    defaults: Mapping[Any, Any] = {}
+    if isinstance(annotation, type) and hasattr(annotation, "_fields"):
+        # NamedTuple
+        fields = annotation._fields
+        keys: List[Union[int, str]] = list(range(len(fields)))
+        default_names = list(fields)
+        hints = getattr(annotation, "__annotations__", {})
+        annotations = [hints.get(f, empty) for f in fields]
+        field_defaults = getattr(annotation, "_field_defaults", {})
+        defaults = {
+            i: field_defaults[f] for i, f in enumerate(fields) if f in field_defaults
+        }
+        container = container or annotation
+    elif _is_typed_dict(annotation):
+        hints = annotation.__annotations__
+        keys = list(hints)
+        default_names = list(hints)
+        annotations = list(hints.values())
+        container = container or dict
+    elif origin is tuple and args and args[-1] is not Ellipsis and args != ((),):
+        keys = list(range(len(args)))
+        default_names = [f"{param.name}_{i}" for i in keys]
+        annotations = list(args)
+    else:
+        if names is None:
+            raise ValueError(
+                f"Cannot infer the members of parameter '{param.name}', provide names"
+            )
+        is_dict = origin is dict or annotation is dict or container is dict
+        value_annotation = args[1] if is_dict and len(args) == 2 else empty
+        keys = list(names) if is_dict else list(range(len(names)))
+        default_names = list(names)
+        annotations = [value_annotation] * len(names)
+        if is_dict:
+            container = dict
+    if names is None:
+        names = default_names
+    elif len(names) != len(keys):
+        raise ValueError(f"Expected {len(keys)} names, got {len(names)}")
+    if container is None:
+        container = tuple
+    if not defaults and param.default is not empty:
+        defaults = {k: param.default[k] for k in keys}
+    return [
+        UnpackedParameter(
+            member_name,
+            defaults.get(key, empty),
+            member_annotation,
+            param.kind,
+            packed_name=param.name,
+            container=container,
+            key=key,
+            keys=tuple(keys),
+        )
+        for key, member_name, member_annotation in zip(keys, names, annotations)
+    ]
+
+
+class FrozenMutableParameter(ParameterLike):
+    """Immutable, hashable counterpart of :class:`MutableParameter`.
+
+    `members` holds the frozen signature of the members of a packed
+    parameter (see :class:`MutableParameterTuple`), or None. `source`
+    describes the origin of unpacked parameters (see
+    :class:`UnpackedParameter`), or is None.
+    """
+
+    __slots__ = ("name", "default", "annotation", "kind", "members", "source", "_hash")
+
+    members: Optional[FrozenMutableSignature]
+
+    def __init__(
+        self,
+        name: str,
+        default: Any,
+        annotation: Any,
+        kind: _ParameterKind,
+        members: Optional[FrozenMutableSignature] = None,
+        source: Optional[ParameterSource] = None,
+    ):
+        _set = object.__setattr__
+        _set(self, "name", name)
+        _set(self, "default", default)
+        _set(self, "annotation", annotation)
+        _set(self, "kind", kind)
+        _set(self, "members", members)
+        _set(self, "source", source)
+        _set(self, "_hash", hash(self._key()))
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (
+            self.name,
+            self.kind,
+            structural_key(self.default),
+            structural_key(self.annotation),
+            self.members,
+            structural_key(self.source),
+        )
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key: str):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        return self.__class__, (
+            self.name,
+            self.default,
+            self.annotation,
+            self.kind,
+            self.members,
+            self.source,
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenMutableParameter):
+            return False
+        return self._hash == other._hash and self._key() == other._key()
+
+    def to_parameter(self) -> Parameter:
+        return Parameter(
+            name=self.name,
+            default=self.default,
+            kind=self.kind,
+            annotation=self.annotation,
+        )
+
+    def thaw(self) -> MutableParameter:
+        """Return a new :class:`MutableParameter` (or
+        :class:`MutableParameterTuple` for packed parameters)."""
+        return _thaw_parameter(
+            self.name,
+            self.default,
+            self.annotation,
+            self.kind,
+            self.members,
+            self.source,
+        )
+
+    def __str__(self):
+        return f"<{self.__class__.__name__}({self.to_parameter()})>"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+_interned_signatures: "weakref.WeakValueDictionary[Any, FrozenMutableSignature]"
+_interned_signatures = weakref.WeakValueDictionary()
+
+
+class FrozenMutableSignature(CompactSignature):
+    """Immutable, hashable counterpart of :class:`MutableSignature`.
+
+    Two frozen signatures are equal if their parameters (names, kinds,
+    defaults, annotations, packed members and sources of unpacked
+    parameters) and return annotations are equal. The hash is computed once, on creation. Use `intern` to get a
+    shared instance for each distinct structure.
+
+    .. code-block:: python
+
+        s1 = MutableSignature(fn).freeze()
+        s2 = MutableSignature(fn).freeze()
+        assert s1 is s2
+        s3 = s1.thaw()  # a new MutableSignature
+    """
+
+    __slots__ = ("_key", "_hash", "_params", "_by_name", "__weakref__")
+
+    members: Optional[Tuple[Optional[FrozenMutableSignature], ...]]
+
+    def __init__(
+        self,
+        names: Tuple[str, ...],
+        kinds: Tuple[_ParameterKind, ...],
+        defaults: Tuple[Any, ...],
+        annotations: Tuple[Any, ...],
+        members: Optional[Tuple[Optional[CompactSignature], ...]] = None,
+        return_annotation: Any = Null,
+        sources: Optional[Tuple[Optional[Tuple[Any, ...]], ...]] = None,
+    ):
+        if members is not None:
+            members = tuple(
+                m
+                if m is None or isinstance(m, FrozenMutableSignature)
+                else FrozenMutableSignature(
+                    m.names,
+                    m.kinds,
+                    m.defaults,
+                    m.annotations,
+                    m.members,
+                    m.return_annotation,
+                    m.sources,
+                )
+                for m in members
+            )
+        if sources is not None:
+            sources = tuple(s if s is None else ParameterSource(*s) for s in sources)
+        super().__init__(
+            names, kinds, defaults, annotations, members, return_annotation, sources
+        )
+        key = (
+            self.names,
+            self.kinds,
+            tuple(structural_key(d) for d in self.defaults),
+            tuple(structural_key(a) for a in self.annotations),
+            self.members,
+            structural_key(self.return_annotation),
+            structural_key(self.sources),
+        )
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+        # frozen parameters, created on first access
+        object.__setattr__(self, "_params", None)
+        object.__setattr__(self, "_by_name", None)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenMutableSignature):
+            return False
+        return self._hash == other._hash and self._key == other._key
+
+    def intern(self) -> FrozenMutableSignature:
+        """Return the shared instance of this signature, registering this one
+        if there is none. Interned signatures are held weakly.
+
+        :return: The interned FrozenMutableSignature
+        """
+        return _interned_signatures.setdefault(self._key, self)
+
+    def _create_params(self):
+        members = self.members or (None,) * len(self)
+        sources = self.sources or (None,) * len(self)
+        params = tuple(
+            FrozenMutableParameter(*args)
+            for args in zip(
+                self.names,
+                self.defaults,
+                self.annotations,
+                self.kinds,
+                members,
+                sources,
+            )
+        )
+        by_name: Dict[str, FrozenMutableParameter] = {}
+        for p in params:
+            by_name.setdefault(p.name, p)
+        object.__setattr__(self, "_params", params)
+        object.__setattr__(self, "_by_name", by_name)
+
+    @property
+    def params(self) -> Tuple[FrozenMutableParameter, ...]:
+        if self._params is None:
+            self._create_params()
+        return self._params
+
+    def __iter__(self) -> Generator[FrozenMutableParameter, None, None]:
+        yield from self.params
+
+    def __getitem__(self, key: Union[int, str]) -> FrozenMutableParameter:
+        if self._params is None:
+            self._create_params()
+        if isinstance(key, str):
+            return self._by_name[key]
+        return self._params[key]
+
+    def thaw(self) -> MutableSignature:
+        """Return a new :class:`MutableSignature` with the same parameters.
+
+        :return: The MutableSignature
+        """
+        return MutableSignature.from_compact(self)
+
 
 class ParameterValue(ReprMixin):
-    __slots__ = ["key", "value", "mutable_parameter"]
+    __slots__ = ["_key", "_value", "_mutable_parameter", "_owners"]
+    __repr_attrs__ = ["key", "value", "mutable_parameter"]
 
     def __init__(
         self,
@@ -589,21 +2052,69 @@ class ParameterValue(ReprMixin):
         mutable_parameter: Union[MutableParameter, Null] = null,
     ):
         assert not (value is Null and mutable_parameter is Null)
-        self.key = key
-        self.value = value
-        self.mutable_parameter = mutable_parameter
+        self._key = key
+        self._value = value
+        self._mutable_parameter = mutable_parameter
+        # weak references to the BoundSignatures holding this value,
+        # which are notified when the value changes
+        self._owners: Tuple[weakref.ref, ...] = ()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "_key": self._key,
+            "_value": self._value,
+            "_mutable_parameter": self._mutable_parameter,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for k, v in state.items():
+            object.__setattr__(self, k, v)
+        self._owners = ()
+
+    def _changed(self):
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner._invalidate()  # noqa
+
+    @property
+    def key(self) -> Union[str, int]:
+        return self._key
+
+    @key.setter
+    def key(self, key: Union[str, int]):
+        self._key = key
+        self._changed()
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any):
+        self._value = value
+        self._changed()
+
+    @property
+    def mutable_parameter(self) -> Union[MutableParameter, Null]:
+        return self._mutable_parameter
+
+    @mutable_parameter.setter
+    def mutable_parameter(self, mutable_parameter: Union[MutableParameter, Null]):
+        self._mutable_parameter = mutable_parameter
+        self._changed()
 
     @property
     def name(self) -> Union[None, str]:
-        if self.mutable_parameter is not Null:
-            return self.mutable_parameter.name  # noqa
+        if self._mutable_parameter is not Null:
+            return self._mutable_parameter.name  # noqa
 
     def is_bound(self) -> bool:
         """Returns true if Parameter has value and parameter defined.
 
         :return:
         """
-        return self.value is not Null and self.mutable_parameter is not Null
+        return self._value is not Null and self._mutable_parameter is not Null
 
     def is_missing_parameter(self) -> bool:
         """Returns True if ParameterValue has a value defined but no parameter
@@ -611,7 +2122,7 @@ class ParameterValue(ReprMixin):
 
         :return:
         """
-        return self.value is not Null and self.mutable_parameter is Null
+        return self._value is not Null and self._mutable_parameter is Null
 
     def is_missing_value(self) -> bool:
         """Returns True if ParameterValue has a parameter associated but no
@@ -619,7 +2130,7 @@ class ParameterValue(ReprMixin):
 
         :return:
         """
-        return self.value is Null and self.mutable_parameter is not Null
+        return self._value is Null and self._mutable_parameter is not Null
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ParameterValue):
@@ -640,24 +2151,30 @@ class ParameterValue(ReprMixin):
 
 
 class BoundParamValue(ParameterValue):
+    __slots__ = ()
     key: Union[str, int]
     value: Any
     mutable_parameter: MutableParameter
 
 
 class ParamValueMissingParam(ParameterValue):
+    __slots__ = ()
     key: Union[str, int]
     value: Any
     mutable_parameter: Null
 
 
 class ParamValueMissingValue(ParameterValue):
+    __slots__ = ()
     key: Union[str, int]
     value: Null
     mutable_parameter: MutableParameter
 
 
 class BoundSignature(Collection[ParameterValue]):
+
+    __slots__ = ("signature", "_ref", "_data", "_cache", "__weakref__")
+
     def __init__(
         self,
         signature: Union[MutableSignature, SignatureLike],
@@ -667,9 +2184,43 @@ class BoundSignature(Collection[ParameterValue]):
         if not isinstance(signature, MutableSignature):
             signature = MutableSignature(signature)
         self.signature = signature
-        self.data: List[ParameterValue] = []
+        self._ref = weakref.ref(self)
+        self._data: List[ParameterValue] = []
+        # views derived from `data`, cleared whenever a ParameterValue changes
+        self._cache: Dict[str, Any] = {}
         self.bind(*args, **kwargs)
 
+    @property
+    def data(self) -> List[ParameterValue]:
+        return self._data
+
+    @data.setter
+    def data(self, data: List[ParameterValue]):
+        ref = self._ref
+        for pv in data:
+            pv._owners = _add_owner(pv._owners, ref)  # noqa
+        self._data = data
+        self._cache = {}
+
+    def _invalidate(self):
+        self._cache = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"signature": self.signature, "data": self._data}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.signature = state["signature"]
+        self._ref = weakref.ref(self)
+        self.data = state["data"]
+
+    def _cached(self, key: str, fn: Callable[[], _T]) -> _T:
+        cache = self._cache
+        if key in cache:
+            return cache[key]
+        value = fn()
+        cache[key] = value
+        return value
+
     def partition(
         self, fn: Callable[[ParameterValue], bool]
     ) -> Tuple[BoundSignature, BoundSignature]:
@@ -713,43 +2264,52 @@ class BoundSignature(Collection[ParameterValue]):
         return bound_sign
 
     def bind(self, *args: Any, **kwargs: Any) -> BoundSignature:
-        data_dict: Dict[typing.Hashable, ParameterValue] = {}
-        self.data.clear()
-        for i, p in enumerate(self.signature.get_params()):
-            if p.is_positional():
-                keys = (i, p.name)
-                v: ParameterValue = ParameterValue(key=i, mutable_parameter=p)
-            else:
-                keys = (p.name,)
-                v: ParameterValue = ParameterValue(key=p.name, mutable_parameter=p)
-            for k in keys:
-                data_dict[k] = v
-            self.data.append(v)
-
-        visited: typing.Dict[Union[int, str], ParameterValue] = dict()
-        for i, arg in enumerate(args):
-            if i in data_dict:
-                pv = data_dict[i]
-                assert pv.key not in visited
-                pv.value = arg
-                pv.key = i
-                visited[pv.key] = pv
-            else:
-                self.data.append(ParameterValue(key=i, value=arg))
+        plan = self.signature.compile_binder()
+        n_pos = plan.positional_count
+        n_args = min(len(args), n_pos)
+        params = plan.params
+        # the values are not shared yet, so they are set without notifying owners
+        data: List[ParameterValue] = [
+            ParameterValue(i, args[i], params[i]) for i in range(n_args)
+        ]
+        data.extend(
+            [
+                ParameterValue(i if i < n_pos else params[i].name, null, params[i])
+                for i in range(n_args, len(params))
+            ]
+        )
+        for i in range(n_pos, len(args)):
+            data.append(ParameterValue(i, args[i]))
+
+        keyword_table = plan.keyword_table
+        bound_kwargs: Dict[str, Any] = {}
+        extra_kwargs: Dict[str, Any] = {}
         for k, v in kwargs.items():
-            if k in data_dict:
-                pv = data_dict[k]
-                if pv in visited.values():
-                    raise SignatureException(
-                        f"\nInvalid Args: {self.__class__.__name__}.bind(*{args} **{kwargs})"
-                        f"\n\tCannot set arg {k}='{v}' because it is already bound."
-                        f"\n\t{pv}"
-                    )
-                pv.value = v
-                pv.key = k
-                visited[pv.key] = pv
-            else:
-                self.data.append(ParameterValue(key=k, value=v))
+            i = keyword_table.get(k)
+            if i is None:
+                data.append(ParameterValue(key=k, value=v))
+                extra_kwargs[k] = v
+                continue
+            pv = data[i]
+            if i < n_args:
+                raise SignatureException(
+                    f"\nInvalid Args: {self.__class__.__name__}.bind(*{args} **{kwargs})"
+                    f"\n\tCannot set arg {k}='{v}' because it is already bound."
+                    f"\n\t{pv}"
+                )
+            pv._value = v  # noqa
+            pv._key = k  # noqa
+            bound_kwargs[k] = v
+        owners = (self._ref,)
+        for pv in data:
+            pv._owners = owners  # noqa
+        self._data = data
+        self._cache = {
+            "args": args[:n_pos],
+            "kwargs": bound_kwargs,
+            "args_missing_params": args[n_pos:],
+            "kwargs_missing_params": extra_kwargs,
+        }
         return self
 
     def get_args(self, bound: bool = True) -> Tuple[Any, ...]:
@@ -780,48 +2340,52 @@ class BoundSignature(Collection[ParameterValue]):
 
         :return:
         """
-        return self.get_args(bound=True)
+        return self._cached("args", lambda: self.get_args(bound=True))
 
     @property
     def kwargs(self) -> Dict[str, Any]:
         """
-        Return the bound keyword args as a dict of values
+        Return the bound keyword args as a dictionary of values
         :return:
         """
-        return self.get_kwargs(bound=True)
+        return dict(self._cached("kwargs", lambda: self.get_kwargs(bound=True)))
 
     @property
     def bound(self) -> Tuple[BoundParamValue, ...]:
-        return tuple(
-            [typing.cast(BoundParamValue, d) for d in self.data if d.is_bound()]
+        return self._cached(
+            "bound",
+            lambda: tuple(
+                [typing.cast(BoundParamValue, d) for d in self.data if d.is_bound()]
+            ),
         )
 
     @property
     def params_missing_values(self) -> Tuple[ParamValueMissingValue, ...]:
-        return tuple(
-            [
-                typing.cast(ParamValueMissingValue, d)
-                for d in self.data
-                if d.is_missing_value()
-            ]
+        return self._cached(
+            "params_missing_values",
+            lambda: tuple(
+                [
+                    typing.cast(ParamValueMissingValue, d)
+                    for d in self.data
+                    if d.is_missing_value()
+                ]
+            ),
         )
 
     @property
     def values_missing_params(self) -> Tuple[ParamValueMissingParam, ...]:
-        return tuple(
-            [
-                typing.cast(ParamValueMissingParam, d)
-                for d in self.data
-                if d.is_missing_parameter()
-            ]
+        return self._cached(
+            "values_missing_params",
+            lambda: tuple(
+                [
+                    typing.cast(ParamValueMissingParam, d)
+                    for d in self.data
+                    if d.is_missing_parameter()
+                ]
+            ),
         )
 
-    @property
-    def args_missing_params(self) -> Tuple[Any, ...]:
-        """Return the unbound args as a tuple of values.
-
-        :return:
-        """
+    def _get_args_missing_params(self) -> Tuple[Any, ...]:
         pos_param_values: List[ParameterValue] = list()
 
         for param_value in self.data:
@@ -832,11 +2396,14 @@ class BoundSignature(Collection[ParameterValue]):
         return tuple(p.value for p in pos_param_values)
 
     @property
-    def kwargs_missing_params(self) -> Dict[str, Any]:
-        """
-        Return the unbound keyword args as a dict of values
+    def args_missing_params(self) -> Tuple[Any, ...]:
+        """Return the unbound args as a tuple of values.
+
         :return:
         """
+        return self._cached("args_missing_params", self._get_args_missing_params)
+
+    def _get_kwargs_missing_params(self) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         for param_value in self.data:
             if param_value.is_missing_parameter() is True and isinstance(
@@ -845,11 +2412,38 @@ class BoundSignature(Collection[ParameterValue]):
                 kwargs[param_value.key] = param_value.value
         return kwargs
 
-    def get(self, item: Union[int, str]) -> Optional[ParameterValue]:
-        for d in self.data:
+    @property
+    def kwargs_missing_params(self) -> Dict[str, Any]:
+        """
+        Return the unbound keyword args as a dictionary of values
+        :return:
+        """
+        return dict(
+            self._cached("kwargs_missing_params", self._get_kwargs_missing_params)
+        )
+
+    def _build_index(
+        self,
+    ) -> Tuple[Dict[Union[int, str], ParameterValue], Dict[Union[int, str], bool]]:
+        """Index ParameterValues by key and parameter name.
+
+        The first value wins, as for a linear search of `data`.
+        """
+        lookup: Dict[Union[int, str], ParameterValue] = {}
+        keys: Dict[Union[int, str], bool] = {}
+        for d in self._data:
+            keys[d.key] = True
             if d.mutable_parameter is not Null:
-                if d.key == item or d.name == item:
-                    return d
+                lookup.setdefault(d.key, d)
+                lookup.setdefault(d.name, d)
+        return lookup, keys
+
+    def get(self, item: Union[int, str]) -> Optional[ParameterValue]:
+        lookup, _ = self._cached("index", self._build_index)
+        try:
+            return lookup.get(item)
+        except TypeError:
+            return None
 
     def has_extra_args(self) -> bool:
         """Returns True if there are any unbound values.
@@ -889,10 +2483,13 @@ class BoundSignature(Collection[ParameterValue]):
     def unbound_signature(self, return_annotation: Any = null) -> MutableSignature:
         if return_annotation is Null:
             return_annotation = self.signature.return_annotation
-        parameters = [
-            b.mutable_parameter.to_parameter() for b in self.params_missing_values
-        ]
-        return MutableSignature(parameters, return_annotation=return_annotation)
+        # copy the parameters, keeping packed and unpacked parameters intact
+        parameters = copy.deepcopy(
+            [b.mutable_parameter for b in self.params_missing_values]
+        )
+        s = MutableSignature(return_annotation=return_annotation)
+        s.clear_and_add_all(parameters)
+        return s
 
     def __getitem__(self, item: Union[str, int]) -> Union[None, ParameterValue]:
         return self.get(item)
@@ -901,10 +2498,11 @@ class BoundSignature(Collection[ParameterValue]):
         return len(self.data)
 
     def __contains__(self, item: object) -> bool:
-        for d in self.data:
-            if item == d.key:
-                return True
-        return False
+        _, keys = self._cached("index", self._build_index)
+        try:
+            return item in keys
+        except TypeError:
+            return False
 
     def __iter__(self) -> Generator[ParameterValue, None, None]:
         yield from self.data
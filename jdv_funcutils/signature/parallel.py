@@ -0,0 +1,233 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Calling functions over many argument records in a thread or process pool.
+
+Records are either `(args, kwargs)` tuples or mappings of keyword arguments.
+They are grouped into chunks, each chunk is sent to the pool as a single
+task, and at most `max_in_flight` chunks are pending at any time, so large
+(or infinite) iterables are consumed lazily with bounded memory.
+"""
+from __future__ import annotations
+
+import collections
+import itertools
+import os
+import sys
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from inspect import Parameter
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Union
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.binding import ArgsKwargs
+from jdv_funcutils.signature.binding import BindingPlan
+from jdv_funcutils.signature.exceptions import SignatureException
+
+Record = Union[ArgsKwargs, Mapping[str, Any]]
+ExecutorLike = Union[str, Executor]
+
+# default chunk size for process pools when the number of records is unknown
+DEFAULT_PROCESS_CHUNKSIZE = 16
+
+
+def is_process_executor(executor: ExecutorLike) -> bool:
+    if isinstance(executor, str):
+        return executor == "process"
+    # process pools (and multiprocessing) are only imported when used
+    process = sys.modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+
+def _make_executor(executor: str, max_workers: Optional[int]) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(
+        f"executor must be 'thread', 'process' or an Executor, not {executor!r}"
+    )
+
+
+def _worker_count(executor: Executor, max_workers: Optional[int]) -> int:
+    if max_workers is not None:
+        return max_workers
+    return getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+
+
+def default_chunksize(records: Iterable[Any], workers: int, process: bool) -> int:
+    """Return the chunk size used when none is given.
+
+    Like `multiprocessing.Pool.map`, sized iterables are split into about four
+    chunks per worker. Otherwise, thread pools use chunks of a single record
+    and process pools use chunks of :data:`DEFAULT_PROCESS_CHUNKSIZE` records,
+    to amortize the cost of sending tasks to the workers.
+    """
+    try:
+        n = len(records)  # type: ignore
+    except TypeError:
+        return DEFAULT_PROCESS_CHUNKSIZE if process else 1
+    chunksize, remainder = divmod(n, workers * 4)
+    return max(1, chunksize + bool(remainder))
+
+
+def _normalize(record: Record) -> ArgsKwargs:
+    if isinstance(record, Mapping):
+        return (), record
+    args, kwargs = record
+    return args, kwargs
+
+
+class _RecordValidator:
+    """Checks that records can be bound to the parameters of a plan."""
+
+    __slots__ = ("plan", "required", "var_positional", "var_keyword")
+
+    def __init__(self, plan: BindingPlan):
+        self.plan = plan
+        self.required = frozenset(
+            p.name
+            for p in plan.params
+            if p.default is empty
+            and p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        )
+        self.var_positional = Parameter.VAR_POSITIONAL in plan.kind_boundaries
+        self.var_keyword = Parameter.VAR_KEYWORD in plan.kind_boundaries
+
+    def validate(self, records: List[ArgsKwargs], offset: int):
+        for i, bound in enumerate(self.plan.bind_many(records), offset):
+            if bound.extra_args and not self.var_positional:
+                raise SignatureException(
+                    f"Record {i}: too many positional arguments {bound.extra_args}"
+                )
+            if bound.extra_kwargs and not self.var_keyword:
+                raise SignatureException(
+                    f"Record {i}: unexpected keyword arguments "
+                    f"{list(bound.extra_kwargs)}"
+                )
+            missing = [n for n in bound.missing if n in self.required]
+            if missing:
+                raise SignatureException(f"Record {i}: missing arguments {missing}")
+
+
+def iter_chunks(
+    records: Iterable[Record],
+    chunksize: int,
+    plan: Optional[BindingPlan] = None,
+) -> Generator[List[ArgsKwargs], None, None]:
+    """Lazily group records into lists of `(args, kwargs)` tuples.
+
+    :param records: Iterable of `(args, kwargs)` tuples or keyword mappings
+    :param chunksize: Number of records per chunk
+    :param plan: If given, records are bound to the plan, and a
+        SignatureException is raised for the first record that does not fit
+    :return: Generator of chunks
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    validator = _RecordValidator(plan) if plan is not None else None
+    it = iter(records)
+    offset = 0
+    while True:
+        chunk = [_normalize(r) for r in itertools.islice(it, chunksize)]
+        if not chunk:
+            return
+        if validator is not None:
+            validator.validate(chunk, offset)
+        offset += len(chunk)
+        yield chunk
+
+
+def call_chunk(fn: Callable[..., Any], chunk: List[ArgsKwargs]) -> List[Any]:
+    """Call `fn` with each record of a chunk. Runs in the workers."""
+    return [fn(*args, **kwargs) for args, kwargs in chunk]
+
+
+def parallel_map(
+    fn: Callable[..., Any],
+    records: Iterable[Record],
+    executor: ExecutorLike = "thread",
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    plan: Optional[BindingPlan] = None,
+) -> Generator[Any, None, None]:
+    """Lazily call `fn` with each record in a pool of workers.
+
+    .. code-block:: python
+
+        def fn(a, b=2):
+            return a + b
+
+        list(parallel_map(fn, [((1,), {}), {"a": 2, "b": 3}]))  # [3, 5]
+
+    :param fn: The function to call. It must be picklable for process pools.
+    :param records: Iterable of `(args, kwargs)` tuples or keyword mappings
+    :param executor: "thread", "process" or an existing Executor. Executors
+        created here are shut down when the generator finishes, existing ones
+        are left running.
+    :param max_workers: Number of workers of created executors
+    :param chunksize: Number of records sent to a worker at once. See
+        :func:`default_chunksize` for the default.
+    :param ordered: If True (default), results are yielded in the order of the
+        records. Otherwise, chunks are yielded as soon as they complete.
+    :param max_in_flight: Maximum number of pending chunks. Defaults to twice
+        the number of workers.
+    :param plan: If given, records are bound to the plan before they are sent
+        to the workers, so invalid records raise a SignatureException early.
+    :return: Generator of results
+    """
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    own_executor = isinstance(executor, str)
+    pool = _make_executor(executor, max_workers) if own_executor else executor
+    workers = _worker_count(pool, max_workers)
+    if chunksize is None:
+        chunksize = default_chunksize(records, workers, is_process_executor(pool))
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    chunks = iter_chunks(records, chunksize, plan)
+    pending: Deque[Future] = collections.deque()
+    not_done: Set[Future] = set()
+    try:
+        if ordered:
+            for chunk in chunks:
+                if len(pending) >= max_in_flight:
+                    yield from pending.popleft().result()
+                pending.append(pool.submit(call_chunk, fn, chunk))
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            for chunk in chunks:
+                if len(not_done) >= max_in_flight:
+                    done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                not_done.add(pool.submit(call_chunk, fn, chunk))
+            while not_done:
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        # stop pending chunks when the results are abandoned or a chunk fails
+        for future in itertools.chain(pending, not_done):
+            future.cancel()
+        if own_executor:
+            pool.shutdown(wait=True)
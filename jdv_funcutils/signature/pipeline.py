@@ -0,0 +1,170 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Transform pipelines.
+
+A :class:`TransformPipeline` records a sequence of signature operations and
+fuses them into a single adapter, so calling the result costs the same no
+matter how many operations were applied.
+"""
+from __future__ import annotations
+
+import functools
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.adapter import compile_adapter
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.mutable_signature import _iter_leaf_values  # noqa
+from jdv_funcutils.signature.mutable_signature import MutableParameter
+from jdv_funcutils.signature.mutable_signature import MutableSignature
+
+
+class TransformPipeline:
+    """Records signature operations on a function and builds a single wrapper
+    applying all of them.
+
+    Each operation returns the pipeline, so operations can be chained:
+
+    .. code-block:: python
+
+        def fn(a, b, c, d=4):
+            return a, b, c, d
+
+        wrapped = (
+            TransformPipeline(fn)
+            .permute("c", "a", "b", "d")
+            .pack(["a", "b"])
+            .rename("c", "x")
+            .drop("d")
+            .curry(x=3)
+            .build()
+        )
+        wrapped((1, 2))  # (1, 2, 3, 4)
+
+    Operations are applied to a single :class:`MutableSignature`; parameters
+    keep track of the parameters of the function they map onto, so `build`
+    compiles one adapter for the whole pipeline.
+    """
+
+    __slots__ = ("fn", "signature", "steps", "_fixed", "_aliases")
+
+    def __init__(self, fn: Callable[..., Any]):
+        self.fn = fn
+        self.signature = MutableSignature(fn)
+        self.steps: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self._fixed: List[Tuple[MutableParameter, Any]] = []
+        self._aliases: Dict[str, str] = {}
+
+    def _record(self, step: str, *args: Any, **kwargs: Any) -> TransformPipeline:
+        self.steps.append((step, args, kwargs))
+        return self
+
+    def permute(self, *order: Union[int, str]) -> TransformPipeline:
+        """Reorder the parameters. See `MutableSignature.reorder`."""
+        self.signature.reorder(*order)
+        return self._record("permute", *order)
+
+    def pack(
+        self,
+        params: Sequence[Union[int, str]],
+        name: Optional[str] = None,
+        position: int = 0,
+    ) -> TransformPipeline:
+        """Pack parameters into a tuple parameter. See `MutableSignature.pack`."""
+        self.signature.pack(params, name=name, position=position)
+        return self._record("pack", params, name=name, position=position)
+
+    def unpack(
+        self,
+        param: Union[int, str],
+        names: Optional[Sequence[str]] = None,
+        position: Optional[int] = None,
+        container: Any = None,
+    ) -> TransformPipeline:
+        """Split a parameter into individual parameters. See
+        `MutableSignature.unpack`."""
+        self.signature.unpack(
+            param, names=names, position=position, container=container
+        )
+        return self._record("unpack", param, names=names, position=position)
+
+    def rename(self, param: Union[int, str], name: str) -> TransformPipeline:
+        """Rename a parameter.
+
+        :param param: The parameter to rename
+        :param name: The new name
+        :return: The pipeline
+        """
+        old_name = self.signature[param].name
+        self.signature.rename(param, name)
+        self._aliases[name] = self._aliases.pop(old_name, old_name)
+        return self._record("rename", param, name)
+
+    def drop(self, param: Union[int, str], value: Any = empty) -> TransformPipeline:
+        """Remove a parameter, always passing `value` (or the default of the
+        parameter) for it instead.
+
+        :param param: The parameter to drop
+        :param value: The value to pass. Defaults to the parameter default.
+        :return: The pipeline
+        """
+        p = self.signature[param]
+        if value is empty:
+            if p.default is empty:
+                raise SignatureException(
+                    f"Cannot drop parameter '{p.name}' without a default or value"
+                )
+            value = p.default
+        self._fixed += _iter_leaf_values(p, value)
+        self.signature.remove(p)
+        return self._record("drop", param, value)
+
+    def curry(self, *args: Any, **kwargs: Any) -> TransformPipeline:
+        """Fix parameters to the given arguments. See `MutableSignature.partial`."""
+        bound = self.signature.bind(*args, **kwargs)
+        if bound.values_missing_params:
+            extra = [pv.value for pv in bound.values_missing_params]
+            raise SignatureException(f"No parameters for arguments {extra}")
+        for pv in bound.bound:
+            self._fixed += _iter_leaf_values(pv.mutable_parameter, pv.value)
+            self.signature.remove(pv.mutable_parameter)
+        return self._record("curry", *args, **kwargs)
+
+    def build(
+        self,
+        name: Optional[str] = None,
+        check_types: bool = False,
+        check_every: int = 1,
+    ) -> Callable[..., Any]:
+        """Compile the pipeline into a single wrapper of the function.
+
+        :param name: Optional new name of the wrapper
+        :param check_types: If True, arguments are type checked. See
+            `MutableSignature.transform`.
+        :param check_every: Only check types on every Nth call
+        :return: The wrapper
+        """
+        spec = self.signature.adapter_spec(
+            self.fn,
+            check_types=check_types,
+            check_every=check_every,
+            fixed=self._fixed,
+            aliases=self._aliases,
+        )
+        wrapped = compile_adapter(spec, self.fn, name="wrapped")
+        functools.update_wrapper(wrapped, self.fn)
+        wrapped.__signature__ = self.signature.to_signature()  # noqa
+        if name is not None:
+            wrapped.__name__ = name
+        return wrapped
+
+    def __repr__(self) -> str:
+        steps = " -> ".join(step for step, _, _ in self.steps)
+        return f"<{self.__class__.__name__}({self.fn.__name__}: {steps})>"
@@ -0,0 +1,231 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Call statistics for wrappers created by `MutableSignature.transform` and
+`copy_signature`.
+
+Profiling is opt-in. Whether a wrapper is profiled is decided once, when it
+is created (either with the `profile` argument or with
+:func:`enable_profiling`), so wrappers created without profiling carry no
+extra cost. A profiled wrapper records its number of calls, the total time
+spent in the wrapper and the time spent in the wrapped function; the
+difference is the overhead of remapping the arguments.
+
+.. code-block:: python
+
+    enable_profiling()
+    wrapped = MutableSignature(fn).transform(fn)
+    wrapped(1, 2)
+    dump_call_stats()
+
+Times are wall-clock times measured with `time.perf_counter_ns`, so for
+coroutine functions they include the time spent waiting. For generator and
+async generator functions only calls are counted. Counters are not
+synchronized, so they are approximate when a wrapper is called concurrently
+from several threads.
+"""
+from __future__ import annotations
+
+import functools
+import sys
+import weakref
+from time import perf_counter_ns
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from jdv_funcutils.signature.adapter import compile_forwarder
+from jdv_funcutils.signature.adapter import function_kind
+from jdv_funcutils.signature.adapter import FunctionKind
+
+_enabled = False
+
+_registry: "weakref.WeakKeyDictionary[Callable[..., Any], CallStats]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class CallStats:
+    """Call statistics of a single wrapper."""
+
+    __slots__ = ("name", "calls", "total_ns", "callee_ns")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total_ns = 0
+        self.callee_ns = 0
+
+    @property
+    def overhead_ns(self) -> int:
+        """Time spent in the wrapper outside of the wrapped function."""
+        return self.total_ns - self.callee_ns
+
+    def reset(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.callee_ns = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "callee_ns": self.callee_ns,
+            "overhead_ns": self.overhead_ns,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}({self.name}) calls={self.calls} "
+            f"total_ns={self.total_ns} overhead_ns={self.overhead_ns}>"
+        )
+
+
+def enable_profiling(enabled: bool = True):
+    """Profile wrappers created from now on, unless they are created with
+    `profile=False`. Existing wrappers are not affected."""
+    global _enabled
+    _enabled = enabled
+
+
+def disable_profiling():
+    """Stop profiling wrappers created from now on."""
+    enable_profiling(False)
+
+
+def profiling_enabled() -> bool:
+    return _enabled
+
+
+def get_call_stats(wrapper: Callable[..., Any]) -> Optional[CallStats]:
+    """Return the :class:`CallStats` of a wrapper, or None if the wrapper is
+    not profiled."""
+    try:
+        return _registry.get(wrapper)
+    except TypeError:
+        return None
+
+
+def all_call_stats() -> List[CallStats]:
+    """Return the :class:`CallStats` of all living profiled wrappers."""
+    return list(_registry.values())
+
+
+def reset_call_stats():
+    """Reset the statistics of all profiled wrappers."""
+    for stats in _registry.values():
+        stats.reset()
+
+
+def dump_call_stats(file: Optional[TextIO] = None):
+    """Write a table of the statistics of all profiled wrappers, sorted by
+    overhead.
+
+    :param file: The file to write to. Defaults to `sys.stdout`.
+    """
+    file = file or sys.stdout
+    rows = sorted(all_call_stats(), key=lambda s: s.overhead_ns, reverse=True)
+    header = ("wrapper", "calls", "total ms", "callee ms", "overhead ms", "ns/call")
+    lines = [header]
+    for s in rows:
+        per_call = s.overhead_ns // s.calls if s.calls else 0
+        lines.append(
+            (
+                s.name,
+                str(s.calls),
+                f"{s.total_ns / 1e6:.3f}",
+                f"{s.callee_ns / 1e6:.3f}",
+                f"{s.overhead_ns / 1e6:.3f}",
+                str(per_call),
+            )
+        )
+    width = max(len(line[0]) for line in lines)
+    for line in lines:
+        cells = [line[0].ljust(width)] + [cell.rjust(12) for cell in line[1:]]
+        print(" ".join(cells), file=file)
+
+
+def time_callee(fn: Callable[..., Any], stats: CallStats) -> Callable[..., Any]:
+    """Return a function calling `fn` and adding the time spent in it to
+    `stats.callee_ns`. Generator functions are returned as is.
+
+    :param fn: The wrapped function
+    :param stats: The statistics to update
+    :return: The function to use as the target of the wrapper
+    """
+    kind = function_kind(fn)
+    if kind == FunctionKind.FUNCTION:
+
+        def timed(*args: Any, **kwargs: Any):
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats.callee_ns += perf_counter_ns() - start
+
+    elif kind == FunctionKind.COROUTINE:
+
+        async def timed(*args: Any, **kwargs: Any):
+            start = perf_counter_ns()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                stats.callee_ns += perf_counter_ns() - start
+
+    else:
+        return fn
+    return functools.update_wrapper(timed, fn)
+
+
+def time_calls(
+    wrapper: Callable[..., Any], fn: Callable[..., Any], stats: CallStats
+) -> Callable[..., Any]:
+    """Return a function calling `wrapper`, counting calls and adding the
+    time spent in it to `stats.total_ns`, and register it.
+
+    :param wrapper: The wrapper to profile
+    :param fn: The function wrapped by `wrapper`
+    :param stats: The statistics to update
+    :return: The profiled wrapper
+    """
+    kind = function_kind(fn)
+    if kind == FunctionKind.FUNCTION:
+
+        def profiled(*args: Any, **kwargs: Any):
+            start = perf_counter_ns()
+            try:
+                return wrapper(*args, **kwargs)
+            finally:
+                stats.total_ns += perf_counter_ns() - start
+                stats.calls += 1
+
+    elif kind == FunctionKind.COROUTINE:
+
+        async def profiled(*args: Any, **kwargs: Any):
+            start = perf_counter_ns()
+            try:
+                return await wrapper(*args, **kwargs)
+            finally:
+                stats.total_ns += perf_counter_ns() - start
+                stats.calls += 1
+
+    else:
+
+        def count(*args: Any, **kwargs: Any):
+            stats.calls += 1
+            return wrapper(*args, **kwargs)
+
+        profiled = compile_forwarder(count, name="profiled", kind=kind)
+    functools.update_wrapper(profiled, wrapper)
+    profiled.__wrapped__ = fn
+    _registry[profiled] = stats
+    return profiled
+
+
+def profile_name(fn: Callable[..., Any]) -> str:
+    name = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", repr(fn))
+    module = getattr(fn, "__module__", None)
+    return f"{module}.{name}" if module else name
@@ -0,0 +1,271 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Streaming conversion of records (dict rows or tuple rows) into call
+arguments.
+
+A :class:`RecordAdapter` compiles the parameters of a signature and an
+optional column layout into small generated functions that turn a row into
+an `(args, kwargs)` tuple with the defaults filled in. No
+:class:`BoundSignature` is created per row. Rows that cannot be bound are
+skipped and counted in a :class:`RecordReport` instead of raising one by one.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from inspect import Parameter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.binding import ArgsKwargs
+from jdv_funcutils.signature.binding import BindingPlan
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.exceptions import SignatureMissingParameterException
+
+Row = Union[Mapping[str, Any], Sequence[Any]]
+
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+_VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+class RecordReport:
+    """Aggregated problems of the rows adapted by a :class:`RecordAdapter`.
+
+    `missing` counts, per parameter, the rows without a value for it.
+    `extra` counts, per field, the rows with a field that is not a
+    parameter. Fields of tuple rows longer than the column layout are
+    counted by their index.
+    """
+
+    __slots__ = ("rows", "adapted", "missing", "extra")
+
+    def __init__(self):
+        self.rows = 0
+        self.adapted = 0
+        self.missing: Counter[str] = Counter()
+        self.extra: Counter[Union[str, int]] = Counter()
+
+    @property
+    def skipped(self) -> int:
+        return self.rows - self.adapted
+
+    def reset(self):
+        self.rows = 0
+        self.adapted = 0
+        self.missing.clear()
+        self.extra.clear()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.adapted} of {self.rows} rows adapted, "
+            f"missing fields: {dict(self.missing)}, extra fields: {dict(self.extra)}"
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self}>"
+
+
+def _compile_row_adapter(
+    params: Sequence[Any], value_of: Callable[[Any, str], str], name: str
+) -> Callable[[Any], ArgsKwargs]:
+    namespace: Dict[str, Any] = {}
+
+    def constant(value: Any) -> str:
+        key = f"_jdv_c{len(namespace)}"
+        namespace[key] = value
+        return key
+
+    args: List[str] = []
+    kwargs: List[str] = []
+    for p in params:
+        expr = value_of(p, constant(p.default) if p.default is not empty else "")
+        if p.kind in _POSITIONAL:
+            args.append(expr)
+        elif p.kind is Parameter.KEYWORD_ONLY:
+            kwargs.append(f"{p.name!r}: {expr}")
+    source = (
+        f"def {name}(row):\n"
+        f"    return ({''.join(a + ', ' for a in args)}), {{{', '.join(kwargs)}}}\n"
+    )
+    exec(compile(source, f"<record adapter {name}>", "exec"), namespace)  # noqa
+    return namespace[name]
+
+
+class RecordAdapter:
+    """Converts rows into `(args, kwargs)` tuples for a signature.
+
+    .. code-block:: python
+
+        def fn(a, b=2, *, c):
+            ...
+
+        adapter = MutableSignature(fn).record_adapter(columns=["c", "a"])
+        list(adapter.adapt([(3, 1)]))  # [((1, 2), {"c": 3})]
+        adapter = MutableSignature(fn).record_adapter()
+        list(adapter.adapt([{"a": 1, "c": 3}, {"b": 1}]))  # [((1, 2), {"c": 3})]
+        adapter.report.missing  # Counter({"a": 1, "c": 1})
+
+    Mapping rows are keyed by parameter name. Sequence rows hold the values
+    of the `columns` layout, where None marks columns to ignore. Parameters
+    that are not given use their default values. Fields that are not
+    parameters are passed in the keyword arguments if the signature has a
+    `**kwargs` parameter, and reported otherwise. Values cannot be given for
+    `*args` parameters.
+
+    :param plan: The binding plan of the signature (see
+        `MutableSignature.compile_binder`)
+    :param columns: The parameter names of the fields of sequence rows
+    """
+
+    __slots__ = (
+        "plan",
+        "columns",
+        "report",
+        "_required",
+        "_known",
+        "_var_keyword",
+        "_adapt_mapping",
+        "_adapt_sequence",
+    )
+
+    def __init__(
+        self, plan: BindingPlan, columns: Optional[Sequence[Optional[str]]] = None
+    ):
+        self.plan = plan
+        self.columns = tuple(columns) if columns is not None else None
+        self.report = RecordReport()
+        params = [p for p in plan.params if p.kind not in _VARIADIC]
+        self._required = tuple(p.name for p in params if p.default is empty)
+        self._known = frozenset(p.name for p in params)
+        self._var_keyword = Parameter.VAR_KEYWORD in plan.kind_boundaries
+        self._adapt_mapping = _compile_row_adapter(
+            params, self._mapping_value, "adapt_mapping"
+        )
+        self._adapt_sequence = None
+        if self.columns is not None:
+            self._adapt_sequence = self._compile_sequence_adapter(params)
+
+    @staticmethod
+    def _mapping_value(p: Any, default: str) -> str:
+        if default:
+            return f"row.get({p.name!r}, {default})"
+        return f"row[{p.name!r}]"
+
+    def _compile_sequence_adapter(
+        self, params: Sequence[Any]
+    ) -> Callable[[Any], ArgsKwargs]:
+        index: Dict[str, int] = {}
+        for i, name in enumerate(self.columns):
+            if name is None:
+                continue
+            if name in index:
+                raise SignatureException(f"Column '{name}' designated twice")
+            if name not in self._known and not self._var_keyword:
+                raise SignatureException(f"Column '{name}' is not a parameter")
+            index[name] = i
+        missing = [n for n in self._required if n not in index]
+        if missing:
+            raise SignatureMissingParameterException(
+                f"Columns {list(self.columns)} have no field for parameters {missing}"
+            )
+
+        def value_of(p: Any, default: str) -> str:
+            i = index.get(p.name)
+            return default if i is None else f"row[{i:d}]"
+
+        adapt = _compile_row_adapter(params, value_of, "adapt_sequence")
+        extra = [(n, i) for n, i in index.items() if n not in self._known]
+        if not extra:
+            return adapt
+
+        def adapt_with_kwargs(row: Sequence[Any]) -> ArgsKwargs:
+            args, kwargs = adapt(row)
+            for n, i in extra:
+                kwargs[n] = row[i]
+            return args, kwargs
+
+        return adapt_with_kwargs
+
+    def _adapt_short_sequence(self, row: Sequence[Any]) -> Optional[ArgsKwargs]:
+        mapping = {n: v for n, v in zip(self.columns, row) if n is not None}
+        return self._adapt_dict(mapping)
+
+    def _adapt_dict(self, row: Mapping[str, Any]) -> Optional[ArgsKwargs]:
+        try:
+            args, kwargs = self._adapt_mapping(row)
+        except KeyError:
+            for name in self._required:
+                if name not in row:
+                    self.report.missing[name] += 1
+            if not self._var_keyword and not row.keys() <= self._known:
+                self.report.extra.update(k for k in row if k not in self._known)
+            return None
+        if not row.keys() <= self._known:
+            extra = [k for k in row if k not in self._known]
+            if self._var_keyword:
+                for k in extra:
+                    kwargs[k] = row[k]
+            else:
+                self.report.extra.update(extra)
+        return args, kwargs
+
+    def adapt(
+        self, rows: Iterable[Row], strict: bool = False
+    ) -> Generator[ArgsKwargs, None, None]:
+        """Lazily convert rows into `(args, kwargs)` tuples.
+
+        Rows missing a required parameter are skipped. Problems are
+        accumulated in `report` across calls.
+
+        :param rows: Iterable of mapping rows or sequence rows
+        :param strict: If True, a SignatureMissingParameterException
+            summarizing the skipped rows is raised after the last row
+        :return: Generator of `(args, kwargs)` tuples
+        """
+        report = self.report
+        adapt_dict = self._adapt_dict
+        adapt_sequence = self._adapt_sequence
+        n_columns = len(self.columns) if self.columns is not None else 0
+        seen = adapted = 0
+        # the report accumulates across calls; strict errors only describe
+        # the rows of this call
+        missing_before = Counter(report.missing)
+        try:
+            for row in rows:
+                seen += 1
+                cls = row.__class__
+                # avoid the (slower) abstract base class check for common rows
+                if cls is dict or (cls is not tuple and isinstance(row, Mapping)):
+                    bound = adapt_dict(row)
+                elif adapt_sequence is None:
+                    raise SignatureException(
+                        "Sequence rows require a column layout (`columns`)"
+                    )
+                elif len(row) == n_columns:
+                    bound = adapt_sequence(row)
+                elif len(row) > n_columns:
+                    report.extra.update(range(n_columns, len(row)))
+                    bound = adapt_sequence(row)
+                else:
+                    bound = self._adapt_short_sequence(row)
+                if bound is None:
+                    continue
+                adapted += 1
+                yield bound
+        finally:
+            report.rows += seen
+            report.adapted += adapted
+        if strict and adapted < seen:
+            missing = report.missing - missing_before
+            raise SignatureMissingParameterException(
+                f"{seen - adapted} of {seen} rows skipped, "
+                f"missing fields: {dict(missing)}"
+            )
@@ -0,0 +1,261 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Picklable transformed functions.
+
+Wrappers generated by :func:`compile_adapter` are closures over their target
+and cannot be pickled, e.g. to send them to a `ProcessPoolExecutor`. A
+:class:`TransformedFunction` instead keeps the target function and the
+:class:`AdapterSpec` describing the argument mapping, and pickles only
+those. The adapter is compiled lazily on the first call, so unpickling is
+cheap. The target must itself be picklable. Targets created with
+`by_value=True`, such as functions decorated in place by
+`copy_signature(picklable=True)`, are pickled by their code instead if they
+cannot be imported by their qualified name. They must not be closures, and
+can only be unpickled by the same Python version.
+
+TransformedFunctions with the same target and argument mapping, such as
+the copies unpickled for each task sent to a process pool, share their
+compiled adapter within a process.
+"""
+from __future__ import annotations
+
+import functools
+import importlib
+import inspect
+import marshal
+import pickle
+import sys
+import types
+from inspect import Signature
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from jdv_funcutils.signature.adapter import AdapterSpec
+from jdv_funcutils.signature.adapter import compile_adapter
+from jdv_funcutils.signature.adapter import function_kind
+from jdv_funcutils.signature.adapter import FunctionKind
+from jdv_funcutils.signature.typecheck import compile_type_check
+from jdv_funcutils.utils.caching import LRUCache
+from jdv_funcutils.utils.caching import structural_key
+
+
+class TransformedFunction:
+    """A picklable callable adapting its arguments and calling `fn`.
+
+    On the first call, the adapter is compiled and the instance switches to
+    a subclass using the adapter as its `__call__`, so later calls do not go
+    through an extra Python frame. Calling an instance is still slightly
+    slower than calling a function, so only use it where pickling is needed.
+
+    Unlike the functions returned by default, instances are not coroutine
+    functions or generator functions for `inspect`, but calling them returns
+    a coroutine or generator if `fn` does.
+
+    If `by_value` is True, `fn` is pickled by its code when it cannot be
+    pickled by reference (see the module documentation).
+    """
+
+    __slots__ = (
+        "fn",
+        "spec",
+        "signature",
+        "kind",
+        "by_value",
+        "__dict__",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        spec: AdapterSpec,
+        signature: Signature,
+        kind: Optional[str] = None,
+        by_value: bool = False,
+    ):
+        self.fn = fn
+        self.spec = spec
+        self.signature = signature
+        self.kind = kind or function_kind(fn)
+        self.by_value = by_value
+        functools.update_wrapper(self, fn)
+        if self.kind == FunctionKind.COROUTINE and hasattr(
+            inspect, "markcoroutinefunction"
+        ):
+            inspect.markcoroutinefunction(self)
+
+    @property
+    def __signature__(self) -> Signature:
+        return self.signature
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._specialize()(*args, **kwargs)
+
+    def _specialize(self) -> Callable[..., Any]:
+        spec, checked = _without_checks(self.spec)
+        cls = _specialized_classes(
+            structural_key(spec), self.fn, spec, checked, self.kind
+        )
+        self.__class__ = cls
+        return cls.__call__
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def __reduce__(self):
+        spec, checked = _without_checks(self.spec)
+        state = {
+            k: self.__dict__[k]
+            for k in ("__name__", "__qualname__", "__doc__")
+            if k in self.__dict__
+        }
+        return (
+            _restore,
+            (
+                _picklable_function(self.fn, self.by_value),
+                spec,
+                checked,
+                self.signature,
+                self.kind,
+                self.by_value,
+                state,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"<{TransformedFunction.__name__} {self.__qualname__}{self.signature}>"
+
+
+def _importable(fn: Callable[..., Any]) -> bool:
+    obj: Any = sys.modules.get(fn.__module__)
+    for name in fn.__qualname__.split("."):
+        obj = getattr(obj, name, None)
+    return obj is fn
+
+
+def _picklable_function(fn: Callable[..., Any], by_value: bool) -> Any:
+    """Return `fn`, or an object pickling it by its code if it is a function
+    that cannot be pickled by reference and `by_value` is True."""
+    if type(fn) is not types.FunctionType or _importable(fn):
+        return fn
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    if not by_value:
+        raise pickle.PicklingError(
+            f"Cannot pickle function {name}: it cannot be imported by its "
+            "qualified name"
+        )
+    if fn.__closure__ is not None:
+        raise pickle.PicklingError(
+            f"Cannot pickle function {name} by its code: it is a closure"
+        )
+    module = sys.modules.get(fn.__module__)
+    if module is None or fn.__globals__ is not module.__dict__:
+        raise pickle.PicklingError(
+            f"Cannot pickle function {name} by its code: its globals are not "
+            "those of its module"
+        )
+    return _FunctionByValue(fn)
+
+
+class _FunctionByValue:
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: types.FunctionType):
+        self.fn = fn
+
+    def __reduce__(self):
+        fn = self.fn
+        return _load_function, (
+            fn.__module__,
+            marshal.dumps(fn.__code__),
+            fn.__qualname__,
+            fn.__defaults__,
+            tuple(fn.__kwdefaults__.items()) if fn.__kwdefaults__ else None,
+        )
+
+
+def _create_function(
+    module: str,
+    code: bytes,
+    qualname: str,
+    defaults: Optional[Tuple[Any, ...]],
+    kwdefaults: Optional[Tuple[Tuple[str, Any], ...]],
+) -> types.FunctionType:
+    fn = types.FunctionType(
+        marshal.loads(code), importlib.import_module(module).__dict__, None, defaults
+    )
+    fn.__qualname__ = qualname
+    if kwdefaults:
+        fn.__kwdefaults__ = dict(kwdefaults)
+    return fn
+
+
+# copies unpickled from the same function share the function object, and
+# therefore the specialized class
+_loaded_functions: LRUCache[types.FunctionType] = LRUCache(
+    _create_function, maxsize=256
+)
+
+
+def _load_function(*args: Any) -> types.FunctionType:
+    return _loaded_functions(*args)
+
+
+def _without_checks(spec: AdapterSpec) -> Tuple[AdapterSpec, Tuple[bool, ...]]:
+    # compiled type checks are closures; keep which parameters are checked
+    # and compile them again when needed
+    checked = tuple(p.check is not None for p in spec.params)
+    params = tuple(p._replace(check=None) for p in spec.params)
+    return spec._replace(params=params), checked
+
+
+def _with_checks(spec: AdapterSpec, checked: Tuple[bool, ...]) -> AdapterSpec:
+    if not any(checked):
+        return spec
+    params = tuple(
+        p._replace(check=compile_type_check(p.annotation)) if c else p
+        for p, c in zip(spec.params, checked)
+    )
+    return spec._replace(params=params)
+
+
+def _specialized_class(
+    key: Any,
+    fn: Callable[..., Any],
+    spec: AdapterSpec,
+    checked: Tuple[bool, ...],
+    kind: str,
+) -> Type[TransformedFunction]:
+    adapter = compile_adapter(
+        _with_checks(spec, checked), fn, name="wrapped", kind=kind
+    )
+    namespace = {"__slots__": (), "__call__": staticmethod(adapter)}
+    return type(TransformedFunction.__name__, (TransformedFunction,), namespace)
+
+
+# specs compare by value, but the adapter embeds their values (e.g. defaults
+# `1`, `True` and `1.0` are equal), so the classes are also keyed by type
+_specialized_classes: LRUCache[Type[TransformedFunction]] = LRUCache(
+    _specialized_class, maxsize=256
+)
+
+
+def _restore(
+    fn: Callable[..., Any],
+    spec: AdapterSpec,
+    checked: Tuple[bool, ...],
+    signature: Signature,
+    kind: str,
+    by_value: bool,
+    state: dict,
+) -> TransformedFunction:
+    transformed = TransformedFunction(
+        fn, _with_checks(spec, checked), signature, kind, by_value
+    )
+    transformed.__dict__.update(state)
+    return transformed
@@ -0,0 +1,231 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+"""Runtime type checks compiled from annotations.
+
+Annotations are analyzed once and turned into either a tuple of classes
+(checked with a single `isinstance` call) or a small checker function.
+Supported annotations are classes, `None`, `Any`, `Optional`, `Union`,
+`Literal`, `Callable`, `Type` and the generics `Tuple`, `List`, `Set`,
+`FrozenSet` and `Dict` (whose items are checked too). As in PEP 484, `int`
+values are accepted for `float`, and `int` and `float` values for `complex`.
+Other generics are checked against their origin class only. Annotations
+that cannot be checked (strings, type variables, ...) are ignored.
+"""
+from __future__ import annotations
+
+import collections.abc
+import types
+from typing import Any
+from typing import Callable
+from typing import ForwardRef
+from typing import get_args
+from typing import get_origin
+from typing import Literal
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.exceptions import ArgumentTypeError
+from jdv_funcutils.utils import Null
+from jdv_funcutils.utils.caching import LRUCache
+
+_UnionType = getattr(types, "UnionType", Union)
+
+Checker = Callable[[Any], bool]
+TypeCheck = Union[Tuple[type, ...], Checker]
+
+# PEP 484 numeric tower: `int` is accepted for `float`, and `int` and `float`
+# for `complex`
+_NUMERIC_TOWER = {float: (float, int), complex: (complex, float, int)}
+
+
+def _as_function(check: TypeCheck) -> Checker:
+    if isinstance(check, tuple):
+        classes = check
+
+        def check_classes(value: Any) -> bool:
+            return isinstance(value, classes)
+
+        return check_classes
+    return check
+
+
+def _check_classes(annotation: Any) -> Optional[Tuple[type, ...]]:
+    if annotation is None or annotation is type(None):
+        return (type(None),)
+    if isinstance(annotation, type) and get_origin(annotation) is None:
+        try:
+            isinstance(None, annotation)
+        except TypeError:
+            # e.g. protocols that are not runtime checkable
+            return None
+        return _NUMERIC_TOWER.get(annotation, (annotation,))
+    return None
+
+
+def _check_union(args: Tuple[Any, ...]) -> Optional[TypeCheck]:
+    checks = [compile_type_check(a) for a in args]
+    if any(c is None for c in checks):
+        return None
+    if all(isinstance(c, tuple) for c in checks):
+        return tuple(cls for c in checks for cls in c)
+    fns = [_as_function(c) for c in checks]
+
+    def check_union(value: Any) -> bool:
+        for fn in fns:
+            if fn(value):
+                return True
+        return False
+
+    return check_union
+
+
+def _check_tuple(args: Tuple[Any, ...]) -> TypeCheck:
+    if not args:
+        return (tuple,)
+    if args == ((),):
+        return lambda value: isinstance(value, tuple) and not value
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _check_items(tuple, args[0])
+    checks = [compile_type_check(a) for a in args]
+    fns = [_as_function(c) if c is not None else None for c in checks]
+    n = len(fns)
+
+    def check_tuple(value: Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != n:
+            return False
+        for fn, item in zip(fns, value):
+            if fn is not None and not fn(item):
+                return False
+        return True
+
+    return check_tuple
+
+
+def _check_items(origin: type, item_annotation: Any) -> TypeCheck:
+    item_check = compile_type_check(item_annotation)
+    if item_check is None:
+        return (origin,)
+    if isinstance(item_check, tuple):
+        classes = item_check
+
+        def check_items_isinstance(value: Any) -> bool:
+            if not isinstance(value, origin):
+                return False
+            for item in value:
+                if not isinstance(item, classes):
+                    return False
+            return True
+
+        return check_items_isinstance
+    fn = item_check
+
+    def check_items(value: Any) -> bool:
+        return isinstance(value, origin) and all(map(fn, value))
+
+    return check_items
+
+
+def _check_dict(origin: type, args: Tuple[Any, ...]) -> TypeCheck:
+    if not args:
+        return (origin,)
+    key_check, value_check = (compile_type_check(a) for a in args)
+    if key_check is None and value_check is None:
+        return (origin,)
+    key_fn = _as_function(key_check) if key_check is not None else None
+    value_fn = _as_function(value_check) if value_check is not None else None
+
+    def check_dict(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        for k, v in value.items():
+            if key_fn is not None and not key_fn(k):
+                return False
+            if value_fn is not None and not value_fn(v):
+                return False
+        return True
+
+    return check_dict
+
+
+def _check_literal(values: Tuple[Any, ...]) -> Checker:
+    def check_literal(value: Any) -> bool:
+        for v in values:
+            if value == v and type(value) is type(v):
+                return True
+        return False
+
+    return check_literal
+
+
+def _check_type(args: Tuple[Any, ...]) -> TypeCheck:
+    if args and isinstance(args[0], type):
+        cls = args[0]
+        return lambda value: isinstance(value, type) and issubclass(value, cls)
+    return (type,)
+
+
+def _compile_type_check(annotation: Any) -> Optional[TypeCheck]:
+    if (
+        annotation is Any
+        or annotation is empty
+        or annotation is Null
+        or isinstance(annotation, (str, ForwardRef, TypeVar))
+    ):
+        return None
+    classes = _check_classes(annotation)
+    if classes is not None:
+        return classes
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union or origin is _UnionType:
+        return _check_union(args)
+    if origin is Literal:
+        return _check_literal(args)
+    if origin is tuple:
+        return _check_tuple(args)
+    if origin in (list, set, frozenset):
+        return _check_items(origin, args[0]) if args else (origin,)
+    if origin is dict:
+        return _check_dict(origin, args)
+    if origin is type:
+        return _check_type(args)
+    if origin is collections.abc.Callable:
+        return callable
+    if isinstance(origin, type):
+        return _check_classes(origin)
+    return None
+
+
+_type_check_cache: LRUCache[Optional[TypeCheck]] = LRUCache(
+    _compile_type_check, maxsize=1024
+)
+
+
+def compile_type_check(annotation: Any) -> Optional[TypeCheck]:
+    """Compile an annotation into a type check.
+
+    :param annotation: The annotation
+    :return: A tuple of classes to use with `isinstance`, a function returning
+        whether a value matches the annotation, or None if the annotation
+        cannot be checked
+    """
+    return _type_check_cache(annotation)
+
+
+def compile_checker(annotation: Any) -> Optional[Checker]:
+    """Compile an annotation into a function returning whether a value
+    matches it, or None if the annotation cannot be checked."""
+    check = compile_type_check(annotation)
+    if check is None:
+        return None
+    return _as_function(check)
+
+
+def argument_type_error(name: str, value: Any, annotation: Any) -> ArgumentTypeError:
+    return ArgumentTypeError(
+        f"Argument '{name}' expected {annotation!r}, "
+        f"got {value!r} of type {type(value).__name__}"
+    )
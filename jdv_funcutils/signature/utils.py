@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import functools
 import inspect
+import sys
+import types
 from inspect import Parameter
 from inspect import Signature
 from typing import Any
@@ -11,13 +13,24 @@ from typing import Callable
 from typing import Dict
 from typing import Hashable
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
 from jdv_funcutils.imports import ParamSpec
+from jdv_funcutils.signature.adapter import _FORWARDING_SPEC  # noqa
+from jdv_funcutils.signature.adapter import compile_forwarder
+from jdv_funcutils.signature.profiling import CallStats
+from jdv_funcutils.signature.profiling import profile_name
+from jdv_funcutils.signature.profiling import profiling_enabled
+from jdv_funcutils.signature.profiling import time_callee
+from jdv_funcutils.signature.profiling import time_calls
+from jdv_funcutils.signature.transformed import TransformedFunction
 from jdv_funcutils.signature.typedefs import SignatureLike
 from jdv_funcutils.utils import Null
+from jdv_funcutils.utils.caching import CacheInfo
+from jdv_funcutils.utils.caching import WeakKeyCache
 
 
 _K = TypeVar("_K", bound=Hashable)
@@ -51,11 +64,122 @@ def ignore_params(
     return s
 
 
+_signature_cache: WeakKeyCache[Signature] = WeakKeyCache(inspect.signature)
+
+
+def _cached_signature(obj: Callable[..., Any]) -> Signature:
+    # bound methods and partials are usually created on the fly, so their
+    # signatures are derived from the cached signature of the underlying function
+    if isinstance(obj, types.MethodType):
+        return inspect._signature_bound_method(_cached_signature(obj.__func__))  # noqa
+    if isinstance(obj, functools.partial):
+        return inspect._signature_get_partial(_cached_signature(obj.func), obj)  # noqa
+    return _signature_cache(obj)
+
+
+def _unwrap(obj: Any) -> Any:
+    obj = inspect.unwrap(obj)
+    while isinstance(obj, (types.MethodType, functools.partial)):
+        obj = obj.__func__ if isinstance(obj, types.MethodType) else obj.func
+        obj = inspect.unwrap(obj)
+    return obj
+
+
+class AnnotationResolver:
+    """Evaluates string annotations (e.g. from modules using
+    `from __future__ import annotations`) in the namespace of the module
+    defining a callable.
+
+    Evaluated annotations are memoized. Annotations that cannot be evaluated
+    are returned unchanged.
+    """
+
+    __slots__ = ("globalns", "_resolved")
+
+    def __init__(self, obj: Any):
+        obj = _unwrap(obj)
+        globalns = getattr(obj, "__globals__", None)
+        if globalns is None:
+            module = sys.modules.get(getattr(obj, "__module__", None) or "")
+            globalns = vars(module) if module is not None else {}
+        self.globalns: Dict[str, Any] = globalns
+        self._resolved: Dict[str, Any] = {}
+
+    def __call__(self, annotation: Any) -> Any:
+        if not isinstance(annotation, str):
+            return annotation
+        try:
+            return self._resolved[annotation]
+        except KeyError:
+            pass
+        try:
+            value = eval(annotation, self.globalns)  # noqa
+        except Exception:
+            return annotation
+        self._resolved[annotation] = value
+        return value
+
+    def __copy__(self) -> AnnotationResolver:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> AnnotationResolver:
+        return self
+
+
+_annotation_resolver_cache: WeakKeyCache[AnnotationResolver] = WeakKeyCache(
+    AnnotationResolver
+)
+
+
+def get_annotation_resolver(obj: Callable[..., Any]) -> AnnotationResolver:
+    """Return the (cached) :class:`AnnotationResolver` for a callable.
+
+    :param obj: The callable
+    :return: The resolver
+    """
+    return _annotation_resolver_cache(_unwrap(obj))
+
+
+def invalidate_signature(obj: Optional[Callable[..., Any]] = None):
+    """Invalidate cached signatures.
+
+    Signatures of callables are cached by :func:`get_signature`. If a callable
+    is modified after its signature was requested (e.g. by setting `__signature__`),
+    its cached signature must be invalidated. This also invalidates resolved
+    string annotations (see :func:`get_annotation_resolver`).
+
+    :param obj: The callable to invalidate. If None, the whole cache is cleared.
+    :return:
+    """
+    if obj is None:
+        _signature_cache.clear()
+        _annotation_resolver_cache.clear()
+        return
+    _annotation_resolver_cache.invalidate(_unwrap(obj))
+    while isinstance(obj, (types.MethodType, functools.partial)):
+        obj = obj.__func__ if isinstance(obj, types.MethodType) else obj.func
+    _signature_cache.invalidate(obj)
+
+
+def signature_cache_info() -> CacheInfo:
+    """Return hit/miss statistics of the signature cache."""
+    return _signature_cache.info()
+
+
 def get_signature(
     obj: SignatureLike,
     return_annotation: Any = Null,
     ignore: Union[str, Tuple[str, ...], List[str], None] = None,
+    cache: bool = True,
 ) -> Signature:
+    """Return the signature of a callable, signature or list of parameters.
+
+    :param obj: The signature-like object
+    :param return_annotation: Optional return annotation when `obj` is a list of parameters
+    :param ignore: Names of parameters to exclude from the signature
+    :param cache: If True, signatures of callables are memoized. See `invalidate_signature`.
+    :return: The signature
+    """
     if isinstance(obj, list):
         kwargs = {}
         if return_annotation is not Null:
@@ -63,6 +187,8 @@ def get_signature(
         signature = Signature(obj, **kwargs)
     elif isinstance(obj, Signature):
         signature = obj
+    elif cache:
+        signature = _cached_signature(obj)
     else:
         signature = inspect.signature(obj)
     signature = ignore_params(signature, ignore=ignore)
@@ -77,29 +203,68 @@ def signature_to_param_dict(s: Signature):
     return dict(s.parameters)
 
 
+def _copy_function(fn: types.FunctionType) -> types.FunctionType:
+    copied = types.FunctionType(
+        fn.__code__, fn.__globals__, fn.__name__, fn.__defaults__, fn.__closure__
+    )
+    if fn.__kwdefaults__ is not None:
+        copied.__kwdefaults__ = dict(fn.__kwdefaults__)
+    functools.update_wrapper(copied, fn)
+    return copied
+
+
 def copy_signature(
     obj: SignatureLike,
     return_annotation: Any = Null,
     ignore: Union[str, Tuple[str, ...], List[str], None] = None,
+    profile: Optional[bool] = None,
+    picklable: bool = False,
+    copy_function: bool = False,
 ) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]:
+    """Decorator giving a function the signature of `obj`.
+
+    By default, the function is wrapped in a generated function forwarding
+    `*args` and `**kwargs` to it.
+
+    :param obj: The signature-like object to copy the signature from
+    :param return_annotation: Optional return annotation when `obj` is a list
+        of parameters
+    :param ignore: Names of parameters to exclude from the signature
+    :param profile: If True, the wrapper records call statistics (see
+        :mod:`jdv_funcutils.signature.profiling`)
+    :param picklable: If True, return a picklable :class:`TransformedFunction`.
+        A function that cannot be imported by its qualified name, such as a
+        function decorated in place, is pickled by its code. It must not be
+        a closure, and the pickled data can only be loaded by the same
+        Python version.
+    :param copy_function: If True, plain Python functions are copied instead
+        of wrapped, so calls cost no extra frame. The copy shares the code,
+        globals and closure of the function, but later changes to the
+        defaults of the function are not reflected. Other callables, and
+        profiled functions, are still wrapped.
+    :return: The decorator
+    """
     signature = get_signature(obj, return_annotation=return_annotation, ignore=ignore)
-    if isinstance(ignore, str):
-        ignore = (ignore,)
-    if ignore:
-        parameters: List[Parameter] = []
-        for _, p in signature.parameters.items():
-            p: Parameter
-            if p.name in ignore:
-                continue
-            parameters.append(p)
-        signature = Signature(parameters)
 
-    def wrapped(fn: Callable[_P, _T]) -> Callable[_P, _T]:
-        @functools.wraps(fn)
-        def _wrapped(*args: _P.args, **kwargs: _P.kwargs):
-            return fn(*args, **kwargs)
+    if picklable and profile:
+        raise ValueError("Picklable wrappers cannot be profiled")
 
+    def wrapped(fn: Callable[_P, _T]) -> Callable[_P, _T]:
+        if picklable:
+            return TransformedFunction(fn, _FORWARDING_SPEC, signature, by_value=True)
+        enabled = profiling_enabled() if profile is None else profile
+        if copy_function and not enabled and type(fn) is types.FunctionType:
+            copied = _copy_function(fn)
+            copied.__signature__ = signature  # noqa
+            return copied
+        stats = CallStats(profile_name(fn)) if enabled else None
+        target = fn if stats is None else time_callee(fn, stats)
+        # the wrapper is a coroutine function, generator function etc. if `fn` is
+        _wrapped = compile_forwarder(target, name="_wrapped")
+        functools.update_wrapper(_wrapped, fn)
         _wrapped.__signature__ = signature  # noqa
+        if stats is not None:
+            _wrapped = time_calls(_wrapped, fn, stats)
         return _wrapped
 
     return wrapped
@@ -0,0 +1,188 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from jdv_funcutils.utils.null import Null
+
+_V = TypeVar("_V")
+
+
+def structural_key(value: Any) -> Any:
+    """Return a hashable key for `value`, such that equal values have equal
+    keys. Values of different types (e.g. `1`, `True` and `1.0`) get
+    different keys, also inside lists, tuples, dicts and sets. Other
+    unhashable values are keyed by identity."""
+    cls = type(value)
+    if isinstance(value, (list, tuple)):
+        return cls, tuple(structural_key(v) for v in value)
+    if isinstance(value, dict):
+        return cls, frozenset(
+            (structural_key(k), structural_key(v)) for k, v in value.items()
+        )
+    if isinstance(value, (set, frozenset)):
+        return cls, frozenset(structural_key(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return cls, id(value)
+    return cls, value
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+    maxsize: Optional[int] = None
+
+
+class WeakKeyCache(Generic[_V]):
+    """Caches values computed from objects without keeping the objects
+    alive.
+
+    Hashable objects are stored in a :class:`weakref.WeakKeyDictionary`.
+    Unhashable objects that support weak references are keyed by `id` and
+    evicted when they are garbage collected. Objects that support neither
+    are never cached.
+    """
+
+    def __init__(self, fn: Callable[[Any], _V]):
+        self.fn = fn
+        self._data: "weakref.WeakKeyDictionary[Any, _V]" = weakref.WeakKeyDictionary()
+        self._by_id: Dict[int, Tuple["weakref.ref[Any]", _V]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, obj: Any) -> _V:
+        try:
+            value = self._data[obj]
+        except KeyError:
+            self.misses += 1
+            value = self.fn(obj)
+            self._data[obj] = value
+            return value
+        except TypeError:
+            return self._get_by_id(obj)
+        self.hits += 1
+        return value
+
+    def _get_by_id(self, obj: Any) -> _V:
+        key = id(obj)
+        entry = self._by_id.get(key)
+        if entry is not None and entry[0]() is obj:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = self.fn(obj)
+        try:
+            ref = weakref.ref(obj, self._remove_id_callback(key))
+        except TypeError:
+            return value
+        self._by_id[key] = (ref, value)
+        return value
+
+    def _remove_id_callback(self, key: int) -> Callable[["weakref.ref[Any]"], None]:
+        def remove(ref: "weakref.ref[Any]"):
+            entry = self._by_id.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._by_id[key]
+
+        return remove
+
+    def invalidate(self, obj: Any) -> bool:
+        """Remove a single object from the cache.
+
+        :param obj: The object
+        :return: True if the object was cached
+        """
+        try:
+            return self._data.pop(obj, Null) is not Null
+        except TypeError:
+            entry = self._by_id.get(id(obj))
+            if entry is not None and entry[0]() is obj:
+                del self._by_id[id(obj)]
+                return True
+            return False
+
+    def clear(self):
+        """Remove all objects from the cache and reset statistics."""
+        self._data.clear()
+        self._by_id.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self))
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._by_id)
+
+
+class LRUCache(Generic[_V]):
+    """Caches values computed from hashable arguments, evicting the least
+    recently used entry once `maxsize` entries are stored.
+
+    Calls with unhashable arguments are computed but never cached.
+    """
+
+    def __init__(self, fn: Callable[..., _V], maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.fn = fn
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[Any, ...], _V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args: Any) -> _V:
+        try:
+            with self._lock:
+                value = self._data[args]
+                self._data.move_to_end(args)
+                self.hits += 1
+                return value
+        except KeyError:
+            pass
+        except TypeError:
+            return self.fn(*args)
+        value = self.fn(*args)
+        with self._lock:
+            self.misses += 1
+            self._data[args] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def invalidate(self, *args: Any) -> bool:
+        """Remove the entry for a single set of arguments.
+
+        :return: True if the arguments were cached
+        """
+        with self._lock:
+            try:
+                return self._data.pop(args, Null) is not Null
+            except TypeError:
+                return False
+
+    def clear(self):
+        """Remove all entries from the cache and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -24,6 +24,7 @@ def resolve_attr(obj, name, default: Any = Null):
 
 
 class ReprMixin:
+    __slots__ = ()
     __repr_name__: Optional[Union[str, Tuple[str, Callable]]] = Null
     __repr_attrs__: Optional[List[Union[str, Tuple[str, Callable]]]] = None
 
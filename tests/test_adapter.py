@@ -0,0 +1,149 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import asyncio
+import inspect
+from inspect import Parameter
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.adapter import adapter_source
+from jdv_funcutils.signature.adapter import AdapterSpec
+from jdv_funcutils.signature.adapter import ArgumentSpec
+from jdv_funcutils.signature.adapter import compile_adapter
+from jdv_funcutils.signature.adapter import function_kind
+from jdv_funcutils.signature.adapter import FunctionKind
+from jdv_funcutils.signature.adapter import ParameterSpec
+
+
+def test_compile_adapter():
+    spec = AdapterSpec(
+        params=(
+            ParameterSpec("x", Parameter.POSITIONAL_ONLY),
+            ParameterSpec("y", Parameter.POSITIONAL_OR_KEYWORD, default=5),
+            ParameterSpec("z", Parameter.KEYWORD_ONLY),
+        ),
+        arguments=(
+            ArgumentSpec("a", Parameter.POSITIONAL_OR_KEYWORD, "z"),
+            ArgumentSpec("b", Parameter.POSITIONAL_OR_KEYWORD, "x", path=(1,)),
+            ArgumentSpec("c", Parameter.KEYWORD_ONLY, "y"),
+        ),
+    )
+
+    def fn(a, b, *, c):
+        return a, b, c
+
+    adapter = compile_adapter(spec, fn)
+    assert str(inspect.signature(adapter)) == "(x, /, y=5, *, z)"
+    assert adapter((0, 1), z=2) == (2, 1, 5)
+
+
+def test_adapter_source_avoids_name_collisions():
+    def fn(_jdv_fn, _jdv_c0):
+        return _jdv_fn, _jdv_c0
+
+    s = MutableSignature(fn)
+    s.reorder(1, 0)
+    source = adapter_source(s.adapter_spec(fn))
+    assert "__jdv_fn(" in source
+    assert s.transform(fn)(2, 3) == (3, 2)
+
+
+class TestFunctionKinds:
+    @pytest.fixture(params=[True, False], ids=["compiled", "interpreted"])
+    def compiled(self, request):
+        return request.param
+
+    def test_coroutine(self, compiled):
+        async def fn(a, b):
+            await asyncio.sleep(0)
+            return a - b
+
+        wrapped = reversed_signature(fn, compiled)
+        assert inspect.iscoroutinefunction(wrapped)
+        assert asyncio.run(wrapped(1, 3)) == 2
+
+    def test_generator(self, compiled):
+        def fn(a, b):
+            received = yield a
+            yield received
+            return b
+
+        wrapped = reversed_signature(fn, compiled)
+        assert inspect.isgeneratorfunction(wrapped)
+        gen = wrapped(1, 2)
+        assert next(gen) == 2
+        assert gen.send("x") == "x"
+        with pytest.raises(StopIteration) as exc:
+            next(gen)
+        assert exc.value.value == 1
+
+    def test_async_generator(self, compiled):
+        closed = []
+
+        async def fn(a, b):
+            try:
+                received = yield a
+                while True:
+                    try:
+                        received = yield received
+                    except KeyError:
+                        received = "caught"
+            finally:
+                closed.append(b)
+
+        wrapped = reversed_signature(fn, compiled)
+        assert inspect.isasyncgenfunction(wrapped)
+
+        async def run():
+            gen = wrapped(1, 2)
+            results = [await gen.__anext__()]
+            results.append(await gen.asend("x"))
+            results.append(await gen.athrow(KeyError()))
+            results.append(await gen.__anext__())
+            await gen.aclose()
+            return results
+
+        assert asyncio.run(run()) == [2, "x", "caught", None]
+        assert closed == [1]
+
+    def test_async_generator_iteration(self, compiled):
+        async def fn(a, b):
+            for i in range(a, b):
+                yield i
+
+        wrapped = reversed_signature(fn, compiled)
+
+        async def run():
+            return [i async for i in wrapped(5, 2)]
+
+        assert asyncio.run(run()) == [2, 3, 4]
+
+    def test_adapter_source(self):
+        spec = AdapterSpec(
+            params=(ParameterSpec("x", Parameter.POSITIONAL_OR_KEYWORD),),
+            arguments=(ArgumentSpec("a", Parameter.POSITIONAL_OR_KEYWORD, "x"),),
+        )
+        source = adapter_source(spec, kind=FunctionKind.COROUTINE)
+        assert source == "async def adapter(x):\n    return await _jdv_fn(x)\n"
+
+    def test_function_kind(self):
+        async def coro():
+            ...
+
+        async def agen():
+            yield
+
+        def gen():
+            yield
+
+        assert function_kind(coro) == FunctionKind.COROUTINE
+        assert function_kind(agen) == FunctionKind.ASYNC_GENERATOR
+        assert function_kind(gen) == FunctionKind.GENERATOR
+        assert function_kind(lambda: None) == FunctionKind.FUNCTION
+
+
+def reversed_signature(fn, compiled):
+    s = MutableSignature(fn)
+    s.reorder(1, 0)
+    return s.transform(fn, compiled=compiled)
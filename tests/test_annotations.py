@@ -0,0 +1,90 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+from __future__ import annotations
+
+import pickle
+from copy import deepcopy
+from typing import List
+from typing import Tuple
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.utils import get_annotation_resolver
+from jdv_funcutils.signature.utils import invalidate_signature
+
+
+def fn1(a: int, b: List[str], c: Later = None, d: Unknown = None) -> Later:  # noqa
+    return a
+
+
+class Later:
+    pass
+
+
+class Foo:
+    def bar(self, a: int) -> Later:
+        ...
+
+
+def test_annotations_are_lazy():
+    s = MutableSignature(fn1)
+    assert s["a"]._annotation == "int"
+    assert s._return_annotation == "Later"
+    assert s["a"].annotation is int
+    assert s["a"]._annotation is int
+    assert s["b"]._annotation == "List[str]"
+
+
+def test_to_signature_resolves():
+    s = MutableSignature(fn1).to_signature()
+    assert s.parameters["a"].annotation is int
+    assert s.parameters["b"].annotation == List[str]
+    assert s.parameters["c"].annotation is Later
+    assert s.return_annotation is Later
+
+
+def test_unresolvable_annotation():
+    s = MutableSignature(fn1)
+    assert s["d"].annotation == "Unknown"
+    assert str(s)
+
+
+def test_pack_resolves():
+    s = MutableSignature(fn1)
+    s.pack(["a", "b"])
+    assert s[0].annotation == Tuple[int, List[str]]
+
+
+def test_resolver_is_cached_per_function():
+    invalidate_signature()
+    resolver = get_annotation_resolver(fn1)
+    assert get_annotation_resolver(fn1) is resolver
+    assert get_annotation_resolver(Foo().bar) is get_annotation_resolver(Foo().bar)
+    assert get_annotation_resolver(Foo().bar) is not resolver
+    MutableSignature(fn1)["a"].annotation
+    assert resolver._resolved == {"int": int}
+    invalidate_signature(fn1)
+    assert get_annotation_resolver(fn1) is not resolver
+
+
+def test_setting_annotation():
+    s = MutableSignature(fn1)
+    s["a"].annotation = "float"
+    assert s["a"].annotation == "float"
+    s.return_annotation = "int"
+    assert s.return_annotation == "int"
+
+
+def test_bound_method():
+    s = MutableSignature(Foo().bar)
+    assert s["a"].annotation is int
+    assert s.return_annotation is Later
+
+
+def test_copy_and_pickle():
+    s = MutableSignature(fn1)
+    s2 = deepcopy(s)
+    assert s2["a"].annotation is int
+    assert s2.return_annotation is Later
+    s3 = pickle.loads(pickle.dumps(MutableSignature(fn1)))
+    assert s3["a"].annotation is int
+    assert s3.params == s.params
@@ -0,0 +1,89 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+from copy import deepcopy
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.binding import BoundArguments
+from jdv_funcutils.signature.mutable_signature import SignatureException
+
+
+def fn1(a: int, b: int, /, c: int, d: int = 4, *, e: int = 5):
+    ...
+
+
+RECORDS = [
+    ((1, 2, 3), {}),
+    ((1, 2), {"c": 3, "e": 6}),
+    ((1, 2, 3, 4), {"e": 6}),
+    ((1,), {"extra": 1}),
+    ((1, 2, 3, 4, 5, 6), {}),
+    ((), {"c": 3, "a": 1}),
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_bind_many_matches_bind(record):
+    s = MutableSignature(fn1)
+    args, kwargs = record
+    bound = s.bind(*args, **kwargs)
+    (result,) = list(s.bind_many([record]))
+    assert result.args == bound.args
+    assert result.kwargs == bound.kwargs
+    assert result.extra_args == bound.args_missing_params
+    assert result.extra_kwargs == bound.kwargs_missing_params
+    assert result.missing == tuple(pv.name for pv in bound.params_missing_values)
+
+
+def test_bind_many_is_lazy():
+    s = MutableSignature(fn1)
+
+    def records():
+        yield (1, 2, 3), {}
+        raise RuntimeError("should not be consumed")
+
+    results = s.bind_many(records())
+    assert next(results) == BoundArguments((1, 2, 3), {}, (), {}, ("d", "e"))
+
+
+def test_bind_many_already_bound():
+    s = MutableSignature(fn1)
+    with pytest.raises(SignatureException):
+        list(s.bind_many([((1, 2, 3), {"c": 3})]))
+
+
+class TestCompileBinder:
+    def test_plan(self):
+        s = MutableSignature(fn1)
+        plan = s.compile_binder()
+        assert plan.names == ("a", "b", "c", "d", "e")
+        assert plan.positional_count == 4
+        assert plan.keyword_table["e"] == 4
+        assert plan.defaults[3] == 4
+        assert plan.kind_boundaries[MutableSignature.POSITIONAL_ONLY] == (0, 2)
+        assert plan.kind_boundaries[MutableSignature.POSITIONAL_OR_KEYWORD] == (2, 4)
+        assert plan.kind_boundaries[MutableSignature.KEYWORD_ONLY] == (4, 5)
+
+    def test_plan_is_immutable(self):
+        plan = MutableSignature(fn1).compile_binder()
+        with pytest.raises(AttributeError):
+            plan.positional_count = 0
+        with pytest.raises(TypeError):
+            plan.keyword_table["f"] = 5
+
+    def test_plan_is_cached_until_signature_changes(self):
+        s = MutableSignature(fn1)
+        plan = s.compile_binder()
+        assert s.compile_binder() is plan
+        s.reorder(0, 1, "d", "c", "e")
+        plan2 = s.compile_binder()
+        assert plan2 is not plan
+        assert plan2.names == ("a", "b", "d", "c", "e")
+        assert s.bind(1, 2, 3).get("d").value == 3
+
+    def test_deepcopy(self):
+        s = MutableSignature(fn1)
+        s.bind(1, 2, 3)
+        s2 = deepcopy(s)
+        assert s2.compile_binder().names == s.compile_binder().names
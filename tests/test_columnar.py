@@ -0,0 +1,106 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import subprocess
+import sys
+from typing import NamedTuple
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.exceptions import SignatureException
+
+
+def fn(x, y, scale=1, *, offset=0):
+    return (x + y) * scale + offset
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def norm(p: Point, scale=1):
+    return (p.x + p.y) * scale
+
+
+def test_numpy_not_imported():
+    code = "import sys, jdv_funcutils; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+class TestBindColumns:
+    @pytest.fixture(autouse=True)
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_columns(self, np):
+        s = MutableSignature(fn)
+        batch = s.bind_columns([((1, 2), {}), ((3,), {"y": 4, "offset": 1})])
+        assert batch.size == 2
+        x, y, scale = batch.args
+        assert x.tolist() == [1, 3]
+        assert y.tolist() == [2, 4]
+        assert scale.tolist() == [1, 1]
+        assert batch.kwargs["offset"].tolist() == [0, 1]
+        assert batch.call(fn).tolist() == [3, 8]
+
+    def test_dtypes(self, np):
+        s = MutableSignature(fn)
+        batch = s.bind_columns([((1, 2), {})], dtypes={"x": np.float32})
+        assert batch.args[0].dtype == np.float32
+        assert batch.args[1].dtype.kind == "i"
+
+    def test_packed(self, np):
+        s = MutableSignature(fn)
+        s.pack(("x", "y"), name="point")
+        batch = s.bind_columns([(((1, 2),), {}), (((3, 4),), {"scale": 2})])
+        point = batch.args[0]
+        assert point.dtype.names == ("x", "y")
+        assert point.x.tolist() == [1, 3]
+        assert point["y"].tolist() == [2, 4]
+        wrapped = s.transform(fn, columnar=True)
+        assert batch.call(wrapped).tolist() == [3, 14]
+
+    def test_nested_packed(self, np):
+        s = MutableSignature(fn)
+        s.pack(("x", "y"), name="xy")
+        s.pack(("xy", "scale"), name="xys")
+        batch = s.bind_columns([((((1, 2), 3),), {})])
+        assert batch.args[0]["xy"]["y"].tolist() == [2]
+        assert batch.call(s.transform(fn, columnar=True)).tolist() == [9]
+
+    def test_unpacked(self, np):
+        s = MutableSignature(norm)
+        s.unpack("p")
+        batch = s.bind_columns([((1, 2), {}), ((3, 4), {"scale": 2})])
+        assert batch.call(s.transform(norm, columnar=True)).tolist() == [3, 14]
+
+    def test_empty(self, np):
+        s = MutableSignature(fn)
+        s.pack(("x", "y"), name="point")
+        batch = s.bind_columns([])
+        assert batch.size == 0
+        assert len(batch.args[0]) == 0
+
+    @pytest.mark.parametrize(
+        "record",
+        [((1,), {}), ((1, 2, 3, 4), {}), ((1, 2), {"z": 1})],
+    )
+    def test_invalid_record(self, np, record):
+        with pytest.raises(SignatureException, match="Record 1"):
+            MutableSignature(fn).bind_columns([((1, 2), {}), record])
+
+    def test_invalid_packed_value(self, np):
+        s = MutableSignature(fn)
+        s.pack(("x", "y"), name="point")
+        with pytest.raises(SignatureException):
+            s.bind_columns([(((1, 2, 3),), {})])
+
+
+@pytest.mark.parametrize("options", [{"compiled": False}, {"check_types": True}])
+def test_invalid_transform_options(options):
+    with pytest.raises(ValueError):
+        MutableSignature(fn).transform(fn, columnar=True, **options)
@@ -0,0 +1,230 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import gc
+import pickle
+from typing import NamedTuple
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.compact import CompactSignature
+from jdv_funcutils.signature.mutable_signature import _interned_signatures
+from jdv_funcutils.signature.mutable_signature import FrozenMutableParameter
+from jdv_funcutils.signature.mutable_signature import FrozenMutableSignature
+from jdv_funcutils.signature.mutable_signature import MutableParameterTuple
+
+
+def fn1(a: int, b: str, /, c: float = 1.0, *args, d: int = 4, **kwargs) -> int:
+    return a
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def norm(p: Point):
+    return p.x + p.y
+
+
+def add(x: int, y: int):
+    return x + y
+
+
+def test_compact_round_trip():
+    s = MutableSignature(fn1)
+    compact = s.compact()
+    assert isinstance(compact, CompactSignature)
+    assert compact.names == ("a", "b", "c", "args", "d", "kwargs")
+    assert compact.defaults[2] == 1.0
+    assert compact.members is None
+    assert str(compact.to_signature()) == str(s.to_signature())
+    s2 = MutableSignature.from_compact(compact)
+    assert s2.params == s.params
+    assert s2.return_annotation is int
+
+
+def test_compact_packed_round_trip():
+    s = MutableSignature(fn1)
+    s.pack(["c", "d"])
+    compact = s.compact()
+    assert compact.members[2].names == ("c", "d")
+    s2 = MutableSignature.from_compact(compact)
+    assert isinstance(s2[2], MutableParameterTuple)
+    assert str(s2.to_signature()) == str(s.to_signature())
+    assert s2.transform(fn1)(3, "b", (1.5, 2)) == 3
+
+
+def test_compact_unpacked_round_trip():
+    s = MutableSignature(norm)
+    s.unpack("p")
+    compact = s.compact()
+    assert compact.sources[0] == ("p", Point, 0, (0, 1))
+    s2 = MutableSignature.from_compact(compact)
+    assert s2.transform(norm)(1, 2) == 3
+    assert MutableSignature(add).compact().sources is None
+
+
+def test_compact_is_immutable():
+    compact = MutableSignature(fn1).compact()
+    with pytest.raises(AttributeError):
+        compact.names = ()
+
+
+def test_compact_pickle():
+    compact = MutableSignature(fn1).compact()
+    compact2 = pickle.loads(pickle.dumps(compact))
+    assert compact2.names == compact.names
+    assert compact2.kinds == compact.kinds
+
+
+def test_slots():
+    s = MutableSignature(fn1)
+    s.pack(["c", "d"])
+    bound = s.bind(3, "b", (1.5, 2))
+    for obj in [s, s[0], s[2], bound, bound.data[0], s.compact()]:
+        assert not hasattr(obj, "__dict__"), obj
+
+
+class TestFrozenSignature:
+    def test_freeze_thaw_round_trip(self):
+        s = MutableSignature(fn1)
+        frozen = s.freeze()
+        assert isinstance(frozen, FrozenMutableSignature)
+        assert frozen.names == ("a", "b", "c", "args", "d", "kwargs")
+        s2 = frozen.thaw()
+        assert isinstance(s2, MutableSignature)
+        assert s2.params == s.params
+        assert s2.return_annotation is int
+        s2.remove("d")
+        assert "d" in frozen.names
+
+    def test_structural_equality_and_hash(self):
+        def fn2(a: int, b: str, /, c: float = 1.0, *args, d: int = 4, **kwargs) -> int:
+            return a
+
+        f1 = MutableSignature(fn1).freeze(intern=False)
+        f2 = MutableSignature(fn2).freeze(intern=False)
+        assert f1 is not f2
+        assert f1 == f2
+        assert hash(f1) == hash(f2)
+        assert len({f1, f2}) == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            lambda a, b=True: None,
+            lambda a, b=1.0: None,
+            lambda a: None,
+            lambda a, *, b=1: None,
+            lambda a: int,
+        ],
+    )
+    def test_structural_inequality(self, other):
+        f1 = MutableSignature(lambda a, b=1: None).freeze()
+        f2 = MutableSignature(other).freeze()
+        assert f1 != f2
+
+    def test_return_annotation(self):
+        s = MutableSignature(fn1)
+        f1 = s.freeze()
+        s.return_annotation = str
+        assert s.freeze() != f1
+
+    def test_intern(self):
+        f1 = MutableSignature(fn1).freeze()
+        f2 = MutableSignature(fn1).freeze()
+        assert f1 is f2
+        f3 = MutableSignature(fn1).freeze(intern=False)
+        assert f3 is not f1
+        assert f3.intern() is f1
+
+    def test_intern_is_weak(self):
+        def fn2(x123, y456=3):
+            pass
+
+        frozen = MutableSignature(fn2).freeze()
+        key = frozen._key
+        assert key in _interned_signatures
+        del frozen
+        gc.collect()
+        assert key not in _interned_signatures
+
+    def test_cache_key(self):
+        cache = {MutableSignature(fn1).freeze(): 1}
+        assert cache[MutableSignature(fn1).freeze(intern=False)] == 1
+
+    def test_unhashable_default(self):
+        def fn2(a=[1, 2], b={"x": [3]}):
+            pass
+
+        f1 = MutableSignature(fn2).freeze(intern=False)
+        f2 = MutableSignature(fn2).freeze(intern=False)
+        assert f1 == f2
+        assert hash(f1) == hash(f2)
+
+    def test_packed(self):
+        s = MutableSignature(fn1)
+        s.pack(["c", "d"])
+        frozen = s.freeze()
+        assert isinstance(frozen.members[2], FrozenMutableSignature)
+        hash(frozen)
+        param = frozen["c__d"]
+        assert param.members.names == ("c", "d")
+        assert isinstance(param.thaw(), MutableParameterTuple)
+        s2 = frozen.thaw()
+        assert isinstance(s2[2], MutableParameterTuple)
+        assert s2.transform(fn1)(3, "b", (1.5, 2)) == 3
+        assert s2.freeze() is frozen
+
+    def test_getitem(self):
+        frozen = MutableSignature(fn1).freeze()
+        assert frozen["c"] is frozen[2] is frozen.params[2]
+        assert frozen["c"].name == "c"
+        with pytest.raises(KeyError):
+            frozen["x"]
+
+    def test_unpacked(self):
+        s = MutableSignature(norm)
+        s.unpack("p")
+        frozen = s.freeze()
+        assert frozen != MutableSignature(add).freeze()
+        assert frozen.thaw().transform(norm)(1, 2) == 3
+        assert frozen["x"].thaw().packed_name == "p"
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+        assert s.freeze() is frozen
+
+    def test_unpacked_with_names(self):
+        s = MutableSignature(add)
+        s.pack(["x", "y"])
+        s.unpack("x__y", names=["a", "b"])
+        frozen = s.freeze()
+        s2 = MutableSignature(add)
+        s2.rename("x", "a")
+        s2.rename("y", "b")
+        assert frozen != s2.freeze()
+        assert frozen.thaw().transform(add)(1, 2) == 3
+        assert frozen["a"].thaw().source_name == "x"
+
+    def test_is_immutable(self):
+        frozen = MutableSignature(fn1).freeze()
+        with pytest.raises(AttributeError):
+            frozen.names = ()
+        with pytest.raises(AttributeError):
+            frozen[0].name = "x"
+
+    def test_pickle(self):
+        frozen = MutableSignature(fn1).freeze()
+        frozen2 = pickle.loads(pickle.dumps(frozen))
+        assert frozen2 == frozen
+        assert hash(frozen2) == hash(frozen)
+
+    def test_frozen_parameter(self):
+        s = MutableSignature(fn1)
+        p = s["c"].freeze()
+        assert isinstance(p, FrozenMutableParameter)
+        assert p == MutableSignature(fn1)["c"].freeze()
+        assert hash(p) == hash(MutableSignature(fn1)["c"].freeze())
+        assert p != s["d"].freeze()
+        assert p.thaw() == s["c"]
+        assert MutableSignature(fn1).freeze()["c"] == p
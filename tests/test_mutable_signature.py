@@ -1,8 +1,11 @@
 #  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
 #  You may use, distribute, and modify this code under the terms of the MIT license.
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from copy import deepcopy
 from typing import Any
+from typing import Dict
 from typing import NamedTuple
 from typing import Tuple
 
@@ -10,10 +13,13 @@ import pytest
 
 from jdv_funcutils import MutableSignature
 from jdv_funcutils.imports import empty
+from jdv_funcutils.signature.adapter import adapter_source
 from jdv_funcutils.signature.mutable_signature import BoundSignature
+from jdv_funcutils.signature.mutable_signature import clear_packed_type_cache
 from jdv_funcutils.signature.mutable_signature import MutableParameter
 from jdv_funcutils.signature.mutable_signature import MutableParameterTuple
 from jdv_funcutils.signature.mutable_signature import named_tuple_type_constructor
+from jdv_funcutils.signature.mutable_signature import packed_type_cache_info
 from jdv_funcutils.signature.mutable_signature import ParameterValue
 from jdv_funcutils.signature.mutable_signature import SignatureException
 from jdv_funcutils.signature.mutable_signature import SignatureMissingParameterException
@@ -44,6 +50,72 @@ class TestMutableSignature:
         assert not s.is_valid()
         s.clear_and_add_all(s.params)
         assert s.is_valid()
+        assert [p.name for p in s] == ["d", "a", "b"]
+
+    def test_fix_signature_after_direct_mutation(self, foo):
+        s = MutableSignature(foo)
+        s.param_by_kind[MutableParameter.KEYWORD_ONLY].append(
+            MutableParameter(
+                "d", default=None, annotation=int, kind=MutableSignature.POSITIONAL_ONLY
+            )
+        )
+        s.fix_signature()
+        assert s.is_valid()
+        assert [p.name for p in s] == ["d", "a", "b"]
+        assert s[0].name == "d"
+
+    def test_params_cache(self, foo):
+        s = MutableSignature(foo)
+        version = s.version
+        assert s.params is s.params
+        assert len(s) == 2
+
+        s.add("c")
+        assert s.version > version
+        assert [p.name for p in s] == ["a", "b", "c"]
+
+        version = s.version
+        s.remove("a")
+        assert s.version > version
+        assert [p.name for p in s.params] == ["b", "c"]
+
+        version = s.version
+        s.reorder("c", "b")
+        assert s.version > version
+        assert [p.name for p in s.get_params()] == ["c", "b"]
+
+    def test_params_cache_after_direct_mutation(self, foo):
+        s = MutableSignature(foo)
+        assert "c" not in s
+        plist = s.param_by_kind[MutableParameter.POSITIONAL_OR_KEYWORD]
+        version = s.version
+        plist.append(
+            MutableParameter("c", empty, empty, MutableParameter.POSITIONAL_OR_KEYWORD)
+        )
+        assert s.version > version
+        assert [p.name for p in s] == ["a", "b", "c"]
+        assert "c" in s
+        plist[0] = plist.pop()
+        assert [p.name for p in s] == ["c", "b"]
+        assert s.bind(1, 2)["c"].value == 1
+        assert [p.name for p in deepcopy(s)] == ["c", "b"]
+
+    def test_params_cache_after_param_by_kind_assignment(self, foo):
+        s = MutableSignature(foo)
+        assert len(s) == 2
+        kind = MutableParameter.POSITIONAL_OR_KEYWORD
+        c = MutableParameter("c", empty, empty, kind)
+        s.param_by_kind[kind] = [*s.param_by_kind[kind], c]
+        assert len(s) == 3
+        assert "c" in s
+        c.name = "d"
+        assert "d" in s and "c" not in s
+        s.param_by_kind[kind].pop()
+        assert [p.name for p in s] == ["a", "b"]
+        del s.param_by_kind[kind]
+        assert len(s) == 0
+        assert "a" not in s
+        assert [p.name for p in deepcopy(s)] == []
 
     def test_str(self):
         def bar(a: int, b: str, c: float = 4.0) -> float:
@@ -134,6 +206,123 @@ class TestMutableSignature:
         assert "c" in s
         assert "d" not in s
 
+    def test_index_consistency(self):
+        def bar(a, b, /, c, d=1, *args, e, f=2, **kwargs):
+            ...
+
+        s = MutableSignature(bar)
+
+        def check():
+            locations = list(s._enum_param_lists())
+            for x in locations:
+                assert s.get_pos_and_param(x.param_index, strict=False) == x
+                assert s.get_pos_and_param(x.param.name, strict=False) == x
+                assert s.get_pos_and_param(x.param) == x
+            assert len(s._get_index().by_position) == len(locations)
+
+        check()
+        s.add("g", kind=MutableParameter.KEYWORD_ONLY)
+        check()
+        s.add("h")
+        check()
+        s.insert(0, "i", kind=MutableParameter.POSITIONAL_ONLY)
+        check()
+        s.remove("c")
+        check()
+        s.reorder(0, 2, 1, "d", "h", "args", "e", "f", "g", "kwargs")
+        check()
+        s.pack(["d", "h"], position=1)
+        check()
+        s.clear_and_add_all(list(s)[::-1])
+        check()
+        assert [p.name for p in s] == [
+            "a",
+            "b",
+            "i",
+            "d__h",
+            "args",
+            "g",
+            "f",
+            "e",
+            "kwargs",
+        ]
+
+    def test_rename(self):
+        def bar(a, b, *, c):
+            ...
+
+        s = MutableSignature(bar)
+        names = s._get_names()
+        s["a"].name = "z"
+        assert "z" in s
+        assert "a" not in s
+        assert s.get_pos_and_param("z").param_index == 0
+        s.insert(1, "x")
+        s.remove("b")
+        s.reorder("x", "z", "c")
+        assert s._get_names() is names
+        assert list(names) == ["c", "z", "x"]
+        assert [p.name for p in s] == ["x", "z", "c"]
+        assert s.bind(1, 2, c=3)["z"].value == 2
+
+    def test_rename_shared_parameter(self):
+        def bar(a, b):
+            ...
+
+        s1 = MutableSignature(bar)
+        s2, _ = s1.partition(lambda p: p.name == "a")
+        s1.remove("b")
+        s1["a"].name = "z"
+        assert "z" in s1 and "z" in s2
+        s1.remove("z")
+        s2["z"].name = "y"
+        assert "y" in s2
+        assert not s1
+
+    def test_owners_of_shared_parameter_are_bounded(self):
+        def bar(a, b):
+            ...
+
+        s = MutableSignature(bar)
+        for _ in range(100):
+            s.partition(lambda p: p.name == "a")
+            copy(s)
+        assert len(s["a"]._owners) <= 3  # noqa
+        s2, _ = s.partition(lambda p: p.name == "a")
+        s["a"].name = "z"
+        assert "z" in s2
+
+    def test_rename_method(self):
+        def bar(a, /, b):
+            ...
+
+        s = MutableSignature(bar)
+        assert s.rename(0, "x") is s[0]
+        with pytest.raises(SignatureException):
+            s.rename("b", "x")
+        assert [p.name for p in s] == ["x", "b"]
+
+    def test_rename_to_existing_name(self):
+        def bar(a, b):
+            ...
+
+        s = MutableSignature(bar)
+        s["b"].name = "a"
+        assert s["a"] is s[0]
+        s[0].name = "c"
+        assert s["a"] is s[1]
+
+    def test_getitem_kw_only_strict(self):
+        def bar(a: int, *, b: int):
+            ...
+
+        s = MutableSignature(bar)
+        with pytest.raises(
+            SignatureMissingParameterException, match="no positional parameter 1"
+        ):
+            s.get_param(1)
+        assert s.get_param(1, strict=False).name == "b"
+
     def test_get_param(self, s):
         assert s.get_param("b").name == "b"
 
@@ -454,6 +643,127 @@ class TestTransform:
             == "New Signature: fn1(c: str, b: int, a: int)\n\nfn1(a: int, b: int, c: str):\n"
         )
 
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_transform_kw_only(self, compiled):
+        def fn1(a: int, b: int, *, c: int = 3):
+            return (a, b, c)
+
+        s1 = MutableSignature(fn1)
+        s1.reorder("b", "a", "c")
+        fn2 = s1.transform(fn1, compiled=compiled)
+        assert fn2(1, 2) == (2, 1, 3)
+        assert fn2(1, 2, c=4) == (2, 1, 4)
+        assert fn2(b=1, a=2) == (2, 1, 3)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_transform_thread_safety(self, compiled):
+        def fn1(a: int, b: int, *, c: int = 0):
+            return (a, b, c)
+
+        s1 = MutableSignature(fn1)
+        s1.reorder("b", "a", "c")
+        fn2 = s1.transform(fn1, compiled=compiled)
+
+        def call(i):
+            if i % 2:
+                return i, fn2(i + 1, i + 2, c=i)
+            return i, fn2(b=i + 1, a=i + 2)
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(call, range(5000)))
+
+        for i, result in results:
+            assert result == (i + 2, i + 1, i if i % 2 else 0)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_transform_reentrant(self, compiled):
+        def fn1(n: int, acc: int):
+            if n == 0:
+                return acc
+            return fn2(acc + n, n - 1)
+
+        s1 = MutableSignature(fn1)
+        s1.reorder("acc", "n")
+        fn2 = s1.transform(fn1, compiled=compiled)
+        assert fn2(0, 10) == sum(range(11))
+
+    def test_transform_var_args(self):
+        def fn1(a, b, *args, c=3, **kwargs):
+            return (a, b, args, c, kwargs)
+
+        s1 = MutableSignature(fn1)
+        s1.reorder("b", "a", "args", "c", "kwargs")
+        fn2 = s1.transform(fn1)
+        assert fn2(1, 2, 3, 4, c=5, d=6) == (2, 1, (3, 4), 5, {"d": 6})
+        assert str(inspect.signature(fn2)) == "(b, a, *args, c=3, **kwargs)"
+
+    def test_transform_pos_only(self):
+        def fn1(a, b, /, c):
+            return (a, b, c)
+
+        s1 = MutableSignature(fn1)
+        s1.reorder(1, 0, 2)
+        fn2 = s1.transform(fn1)
+        assert fn2(1, 2, c=3) == (2, 1, 3)
+        with pytest.raises(TypeError):
+            fn2(1, b=2, c=3)
+
+    def test_transform_removed_param_uses_default(self):
+        def fn1(a, b=2, c=3):
+            return (a, b, c)
+
+        s1 = MutableSignature(fn1)
+        s1.remove("b")
+        fn2 = s1.transform(fn1)
+        assert fn2(1) == (1, 2, 3)
+        assert fn2(1, 4) == (1, 2, 4)
+
+    def test_transform_missing_required_param(self):
+        def fn1(a, b):
+            return (a, b)
+
+        s1 = MutableSignature(fn1)
+        s1.remove("b")
+        with pytest.raises(SignatureMissingParameterException):
+            s1.transform(fn1)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_transform_unknown_param(self, compiled):
+        def fn1(a, b):
+            return (a, b)
+
+        s1 = MutableSignature(fn1)
+        s1.add("c")
+        with pytest.raises(SignatureMissingParameterException):
+            s1.transform(fn1, compiled=compiled)
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"compiled": False}, {"picklable": True}, {"check_types": True}]
+    )
+    def test_transform_unknown_param_with_default(self, options):
+        def fn1(a, b):
+            return (a, b)
+
+        s1 = MutableSignature(fn1)
+        s1.add(MutableParameter("c", 0, int, MutableParameter.KEYWORD_ONLY))
+        fn2 = s1.transform(fn1, **options)
+        assert fn2(1, 2) == (1, 2)
+        with pytest.raises(ValueError, match="Could not find parameter value for c"):
+            fn2(1, 2, c=3)
+
+    def test_compiled_transform_adds_one_frame(self):
+        def fn1(a, b):
+            return inspect.currentframe().f_back.f_back.f_code.co_name
+
+        s1 = MutableSignature(fn1)
+        s1.reorder(1, 0)
+        fn2 = s1.transform(fn1)
+
+        def caller():
+            return fn2(1, 2)
+
+        assert caller() == "caller"
+
     class TestPackingParameter:
         """Tests related to packing multiple parameters into a single
         parameter."""
@@ -493,6 +803,29 @@ class TestTransform:
             TupleType = tuple_type_constructor(annots, Foo)
             assert str(TupleType) == "typing.Tuple[int, typing.Any, int]"
 
+        def test_packed_types_are_cached(self):
+            def fn1(a: int, b, c: int):
+                return (a, b, c)
+
+            clear_packed_type_cache()
+            s1 = MutableSignature(fn1)
+            s1.pack(["a", "b"])
+            s2 = MutableSignature(fn1)
+            s2.pack(["a", "b"])
+            assert s1[0].annotation is s2[0].annotation
+            info = packed_type_cache_info()["tuple_type_constructor"]
+            assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+            annots = [int, str]
+            NT1 = named_tuple_type_constructor(annots, ["a", "b"])
+            assert named_tuple_type_constructor(annots, ["a", "b"]) is NT1
+            assert named_tuple_type_constructor(annots, ["a", "c"]) is not NT1
+            assert named_tuple_type_constructor([int, int], ["a", "b"]) is not NT1
+            info = packed_type_cache_info()["named_tuple_type_constructor"]
+            assert info.currsize == 3
+            clear_packed_type_cache()
+            assert packed_type_cache_info()["tuple_type_constructor"].currsize == 0
+
         def test_mutable_parameter_tuple(self):
             def fn1(a: int, b, c: int):
                 return (a, b, c)
@@ -591,3 +924,347 @@ fn1(a: int, b: float, c: str, d: list) -> tuple:
     :param d: Argument d
     :return: Returns a tuple of all the arguments"""
             assert fn2.__doc__ == expected
+
+
+class TestBoundSignatureCache:
+    def fn1(self, a: int, b: int, *, c: int = 3):
+        ...
+
+    def test_args_are_cached(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4)
+        assert bound.args is bound.args
+        assert bound.args == (1,)
+        assert bound.kwargs == {"c": 4}
+        assert bound.params_missing_values is bound.params_missing_values
+
+    def test_kwargs_are_copies(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4, x=5)
+        kwargs = bound.kwargs
+        assert type(kwargs) is dict
+        kwargs["c"] = 0
+        assert bound.kwargs == {"c": 4}
+        extra = bound.kwargs_missing_params
+        assert type(extra) is dict
+        extra.clear()
+        assert bound.kwargs_missing_params == {"x": 5}
+
+    def test_owners_of_values_are_bounded(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4)
+        for _ in range(100):
+            bound.partition(lambda pv: pv.name == "a")
+        pv = bound.get("a")
+        assert len(pv._owners) <= 2  # noqa
+        a, _ = bound.partition(lambda pv: pv.name == "a")
+        assert a.args == (1,)
+        pv.value = 2
+        assert a.args == (2,)
+        assert bound.args == (2,)
+
+    def test_cache_invalidated_on_value_change(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4)
+        assert [pv.name for pv in bound.params_missing_values] == ["b"]
+        bound.get("b").value = 2
+        assert bound.args == (1, 2)
+        assert bound.params_missing_values == ()
+        bound.get("c").value = 5
+        assert bound.kwargs == {"c": 5}
+
+    def test_cache_invalidated_on_partition(self):
+        bound = MutableSignature(self.fn1).bind(1, 2, c=4)
+        a, b = bound.partition(lambda pv: pv.name == "a")
+        assert a.args == (1,)
+        assert bound.args == (1, 2)
+        a.get("a").value = 5
+        assert a.args == (5,)
+        assert bound.args == (5, 2)
+
+    def test_cache_invalidated_on_rebind(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4)
+        assert bound.args == (1,)
+        bound.bind(2, 3, extra=4)
+        assert bound.args == (2, 3)
+        assert bound.kwargs_missing_params == {"extra": 4}
+
+    def test_deepcopy(self):
+        bound = MutableSignature(self.fn1).bind(1, c=4)
+        copied = deepcopy(bound)
+        assert copied.args == (1,)
+        copied.get("a").value = 2
+        assert copied.args == (2,)
+        assert bound.args == (1,)
+
+    def test_get_and_contains(self):
+        bound = MutableSignature(self.fn1).bind(1, b=2, extra=3)
+        assert bound.get(0).name == "a"
+        assert bound.get("a").name == "a"
+        assert bound.get("b").value == 2
+        assert bound.get(1) is None
+        assert bound.get("extra") is None
+        assert bound.get("c").key == "c"
+        assert bound.get([]) is None
+        assert 0 in bound
+        assert "a" not in bound
+        assert "b" in bound
+        assert "extra" in bound
+        assert [] not in bound
+
+    def test_get_after_partition_and_key_change(self):
+        bound = MutableSignature(self.fn1).bind(1, 2, c=3)
+        a, b = bound.partition(lambda pv: pv.name == "c")
+        assert a.get("c").value == 3
+        assert a.get("a") is None
+        assert b.get("a").value == 1
+        b.get("a").key = "a"
+        assert "a" in b
+        assert 0 not in b
+        assert "a" in bound
+
+
+class TestPartial:
+    def test_partial(self):
+        def fn(a: int, b: int, c: int = 3, *, d: int = 4):
+            return a, b, c, d
+
+        s = MutableSignature(fn)
+        p = s.partial(fn, 1, c=5)
+        assert str(inspect.signature(p)) == "(b: int, *, d: int = 4)"
+        assert p(2) == (1, 2, 5, 4)
+        assert p(b=2, d=6) == (1, 2, 5, 6)
+        assert p.__name__ == "fn"
+
+    def test_partial_kw_only(self):
+        def fn(a, *, b, c=3):
+            return a, b, c
+
+        p = MutableSignature(fn).partial(fn, b=2, c=4)
+        assert str(inspect.signature(p)) == "(a)"
+        assert p(1) == (1, 2, 4)
+
+    def test_partial_permuted(self):
+        def fn(a, b, c):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.reorder(2, 0, 1)
+        p = s.partial(fn, 3)
+        assert str(inspect.signature(p)) == "(a, b)"
+        assert p(1, 2) == (1, 2, 3)
+
+    def test_partial_packed(self):
+        def fn(a, b, c):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.pack(["a", "c"])
+        p = s.partial(fn, b=2)
+        assert p((1, 3)) == (1, 2, 3)
+        p2 = s.partial(fn, (1, 3))
+        assert p2(2) == (1, 2, 3)
+
+    def test_partial_does_not_bind(self, monkeypatch):
+        def fn(a, b):
+            return a, b
+
+        s = MutableSignature(fn)
+        p = s.partial(fn, 1)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("bind called")
+
+        monkeypatch.setattr(MutableSignature, "bind", fail)
+        assert p(2) == (1, 2)
+
+    def test_partial_too_many_args(self):
+        def fn(a, b):
+            return a, b
+
+        with pytest.raises(SignatureException):
+            MutableSignature(fn).partial(fn, 1, 2, 3)
+
+    def test_partial_missing_target_parameter(self):
+        def fn(a, b):
+            return a, b
+
+        def fn2(a):
+            return a
+
+        with pytest.raises(SignatureMissingParameterException):
+            MutableSignature(fn2).partial(fn, 1)
+
+    def test_curry(self):
+        def fn(a, b, c):
+            return a, b, c
+
+        assert MutableSignature(fn).curry(fn, 1, 2)(3) == (1, 2, 3)
+        curried = MutableSignature(fn).curry(fn)
+        assert str(inspect.signature(curried)) == "(a, b, c)"
+        assert curried(1)(2)(3) == (1, 2, 3)
+        assert curried(1, 2)(3) == (1, 2, 3)
+        assert curried(c=3)(1)(2) == (1, 2, 3)
+        step = curried(1)
+        assert str(inspect.signature(step)) == "(b, c)"
+        assert step(2, 3) == step(2)(3) == (1, 2, 3)
+        assert step(4, 5) == (1, 4, 5)
+
+    def test_curry_defaults(self):
+        def fn(a, b, c=3, *args, d=4):
+            return a, b, c, args, d
+
+        curried = MutableSignature(fn).curry(fn)
+        assert curried(1)(2) == (1, 2, 3, (), 4)
+        assert curried(1)(b=2, d=5) == (1, 2, 3, (), 5)
+        assert curried(1, 2, 3, 4) == (1, 2, 3, (4,), 4)
+        assert curried(1, d=5)(2) == (1, 2, 3, (), 5)
+
+    def test_curry_invalid_arguments(self):
+        def fn(a, b):
+            return a, b
+
+        curried = MutableSignature(fn).curry(fn, 1)
+        with pytest.raises(TypeError):
+            curried(2, 3)
+        with pytest.raises(SignatureException):
+            MutableSignature(fn).curry(fn, 1, 2, 3)
+
+
+class Point(NamedTuple):
+    x: int
+    y: float = 1.0
+
+
+class TestUnpack:
+    @pytest.fixture(params=[True, False], ids=["compiled", "interpreted"])
+    def compiled(self, request):
+        return request.param
+
+    def test_unpack_packed(self, compiled):
+        def fn(a, b, c):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.pack(["a", "c"], position=1)
+        s.unpack("a__c")
+        assert str(s.to_signature()) == "(b, a, c)"
+        assert s.transform(fn, compiled=compiled)(2, 1, 3) == (1, 2, 3)
+
+    def test_unpack_packed_with_names(self, compiled):
+        def fn(a, b, c):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.pack(["a", "b"])
+        packed = s["a__b"]
+        s.unpack("a__b", names=["x", "y"])
+        assert str(s.to_signature()) == "(x, y, c)"
+        assert [p.name for p in packed.parameters] == ["a", "b"]
+        wrapped = s.transform(fn, compiled=compiled)
+        assert wrapped(1, 2, 3) == (1, 2, 3)
+        assert wrapped(y=2, x=1, c=3) == (1, 2, 3)
+
+    def test_pack_unpack_round_trip(self):
+        def fn(a: int, b: str, c: float):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.pack(["a", "b"])
+        s.unpack(0)
+        assert s.params == MutableSignature(fn).params
+
+    def test_unpack_tuple(self, compiled):
+        def fn(a, bc: Tuple[int, str]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        assert str(s.to_signature()) == "(a, b: int, c: str)"
+        assert s.transform(fn, compiled=compiled)(1, 2, "c") == (1, (2, "c"))
+
+    def test_unpack_tuple_default_names(self):
+        def fn(bc: Tuple[int, str]):
+            return bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc")
+        assert [p.name for p in s] == ["bc_0", "bc_1"]
+
+    def test_unpack_named_tuple(self, compiled):
+        def fn(z: int, p: Point):
+            return z, p
+
+        s = MutableSignature(fn)
+        s.unpack("p")
+        assert str(s.to_signature()) == "(z: int, x: int, y: float = 1.0)"
+        result = s.transform(fn, compiled=compiled)(3, 1, 2.0)
+        assert result == (3, Point(1, 2.0))
+        assert isinstance(result[1], Point)
+        assert s.transform(fn, compiled=compiled)(3, x=1) == (3, Point(1, 1.0))
+
+    def test_unpack_dict(self, compiled):
+        def fn(options: Dict[str, int]):
+            return options
+
+        s = MutableSignature(fn)
+        s.unpack("options", names=["a", "b"])
+        assert str(s.to_signature()) == "(a: int, b: int)"
+        assert s.transform(fn, compiled=compiled)(1, b=2) == {"a": 1, "b": 2}
+
+    def test_unpack_requires_names(self):
+        def fn(options: dict):
+            return options
+
+        with pytest.raises(ValueError):
+            MutableSignature(fn).unpack("options")
+
+    def test_unpack_wrong_number_of_names(self):
+        def fn(bc: Tuple[int, str]):
+            return bc
+
+        with pytest.raises(ValueError):
+            MutableSignature(fn).unpack("bc", names=["b"])
+
+    def test_unpack_then_reorder(self, compiled):
+        def fn(a, bc: Tuple[int, int]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        s.reorder("c", "a", "b")
+        assert s.transform(fn, compiled=compiled)(3, 1, 2) == (1, (2, 3))
+
+    def test_unpack_then_pack(self):
+        def fn(a, bc: Tuple[int, int]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        s.pack(["a", "c"])
+        assert s.transform(fn)((1, 3), 2) == (1, (2, 3))
+
+    def test_unpack_partial(self):
+        def fn(a, bc: Tuple[int, int]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        assert s.partial(fn, 1, 2)(3) == (1, (2, 3))
+        assert s.partial(fn, 1, 2, 3)() == (1, (2, 3))
+
+    def test_missing_member(self):
+        def fn(a, bc: Tuple[int, int]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        s.remove("c")
+        with pytest.raises(SignatureMissingParameterException):
+            s.transform(fn)
+
+    def test_compiled_source(self):
+        def fn(a, bc: Tuple[int, int]):
+            return a, bc
+
+        s = MutableSignature(fn)
+        s.unpack("bc", names=["b", "c"])
+        assert adapter_source(s.adapter_spec(fn)) == (
+            "def adapter(a, b, c):\n    return _jdv_fn(a, (b, c, ))\n"
+        )
@@ -0,0 +1,160 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import itertools
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.parallel import default_chunksize
+from jdv_funcutils.signature.parallel import iter_chunks
+from jdv_funcutils.signature.parallel import parallel_map
+
+
+def subtract(a, b, c=0):
+    return a - b - c
+
+
+def sleep_then_return(a):
+    time.sleep(a)
+    return a
+
+
+def test_multiprocessing_not_imported():
+    code = "import sys, jdv_funcutils; print('multiprocessing' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+class TestChunks:
+    def test_iter_chunks(self):
+        records = [((1, 2), {}), {"a": 1, "b": 2}, ((1,), {"b": 2})]
+        chunks = list(iter_chunks(records, 2))
+        assert chunks == [
+            [((1, 2), {}), ((), {"a": 1, "b": 2})],
+            [((1,), {"b": 2})],
+        ]
+
+    @pytest.mark.parametrize(
+        "record, message",
+        [
+            (((1,), {}), "missing arguments \\['b'\\]"),
+            (((1, 2, 3, 4), {}), "too many positional arguments"),
+            (((1, 2), {"d": 1}), "unexpected keyword arguments \\['d'\\]"),
+        ],
+    )
+    def test_invalid_record(self, record, message):
+        plan = MutableSignature(subtract).compile_binder()
+        records = [((1, 2), {}), record]
+        with pytest.raises(SignatureException, match=f"Record 1: {message}"):
+            list(iter_chunks(records, 1, plan))
+
+    @pytest.mark.parametrize(
+        "records, workers, process, expected",
+        [
+            (list(range(100)), 4, False, 7),
+            (list(range(3)), 4, True, 1),
+            (iter(range(100)), 4, False, 1),
+            (iter(range(100)), 4, True, 16),
+        ],
+    )
+    def test_default_chunksize(self, records, workers, process, expected):
+        assert default_chunksize(records, workers, process) == expected
+
+
+class TestParallelMap:
+    @pytest.mark.parametrize("chunksize", [None, 1, 3])
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_map(self, chunksize, ordered):
+        records = [((i, 1), {}) for i in range(20)]
+        results = list(
+            parallel_map(
+                subtract, records, max_workers=4, chunksize=chunksize, ordered=ordered
+            )
+        )
+        expected = list(range(-1, 19))
+        if ordered:
+            assert results == expected
+        else:
+            assert sorted(results) == expected
+
+    def test_unordered_yields_completed_first(self):
+        records = [{"a": 0.2}, {"a": 0.0}]
+        results = parallel_map(
+            sleep_then_return, records, max_workers=2, chunksize=1, ordered=False
+        )
+        assert list(results) == [0.0, 0.2]
+
+    def test_bounded_in_flight(self):
+        consumed = itertools.count()
+
+        def records():
+            for i in range(100):
+                next(consumed)
+                yield (i,), {}
+
+        results = parallel_map(
+            lambda x: x, records(), max_workers=2, chunksize=5, max_in_flight=2
+        )
+        assert next(results) == 0
+        # one chunk yielded, at most max_in_flight + 1 chunks read
+        assert next(consumed) <= 3 * 5
+        results.close()
+
+    def test_existing_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            records = [((i,), {}) for i in range(5)]
+            results = list(parallel_map(lambda x: x * 2, records, pool))
+            assert results == [0, 2, 4, 6, 8]
+            # the executor is not shut down
+            assert pool.submit(lambda: 1).result() == 1
+
+    def test_exception(self):
+        def fail(a):
+            if a == 3:
+                raise ValueError(a)
+            return a
+
+        records = [((i,), {}) for i in range(10)]
+        with pytest.raises(ValueError):
+            list(parallel_map(fail, records, chunksize=2))
+
+    def test_threads_are_used(self):
+        names = parallel_map(
+            lambda _: threading.current_thread().name,
+            [((i,), {}) for i in range(4)],
+            max_workers=2,
+        )
+        assert threading.current_thread().name not in set(names)
+
+    @pytest.mark.parametrize("option", ["chunksize", "max_in_flight"])
+    def test_invalid_options(self, option):
+        with pytest.raises(ValueError):
+            next(parallel_map(subtract, [((1, 2), {})], **{option: 0}))
+
+    def test_invalid_executor(self):
+        with pytest.raises(ValueError):
+            next(parallel_map(subtract, [((1, 2), {})], executor="fibers"))
+
+
+class TestSignatureMap:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_map(self, executor):
+        s = MutableSignature(subtract)
+        s.reorder("b", "a", "c")
+        records = [((1, 2), {}), {"a": 4, "b": 3, "c": 1}, ((2,), {"a": 5})]
+        results = s.map(subtract, records, executor=executor, max_workers=2)
+        assert list(results) == [1, 0, 3]
+
+    def test_invalid_record(self):
+        s = MutableSignature(subtract)
+        s.reorder("b", "a", "c")
+        with pytest.raises(SignatureException):
+            list(s.map(subtract, [((1, 2), {}), {"b": 1}]))
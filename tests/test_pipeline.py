@@ -0,0 +1,101 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import inspect
+from typing import Tuple
+
+import pytest
+
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.pipeline import TransformPipeline
+
+
+def fn(a, b, c, d=4):
+    return a, b, c, d
+
+
+def test_pipeline():
+    wrapped = (
+        TransformPipeline(fn)
+        .permute("c", "a", "b", "d")
+        .pack(["a", "b"])
+        .rename("c", "x")
+        .drop("d")
+        .curry(x=3)
+        .build()
+    )
+    assert [p.name for p in inspect.signature(wrapped).parameters.values()] == ["a__b"]
+    assert wrapped((1, 2)) == (1, 2, 3, 4)
+    assert wrapped.__name__ == "fn"
+
+
+def test_pipeline_is_a_single_adapter():
+    def fn2(a, b, c, d):
+        return a, b, c, d
+
+    pipeline = TransformPipeline(fn2)
+    for _ in range(10):
+        pipeline.permute(1, 2, 3, 0)
+    wrapped = pipeline.build(name="fused")
+    assert wrapped.__name__ == "fused"
+    assert wrapped(3, 4, 1, 2) == (1, 2, 3, 4)
+    assert wrapped.__wrapped__ is fn2
+
+
+def test_rename():
+    wrapped = TransformPipeline(fn).rename("a", "x").rename("x", "y").build()
+    assert str(inspect.signature(wrapped)) == "(y, b, c, d=4)"
+    assert wrapped(1, 2, 3) == (1, 2, 3, 4)
+    assert wrapped(y=1, b=2, c=3) == (1, 2, 3, 4)
+
+
+def test_rename_existing():
+    with pytest.raises(SignatureException):
+        TransformPipeline(fn).rename("a", "b")
+
+
+def test_rename_keyword_only():
+    def fn2(a, *, b):
+        return a, b
+
+    wrapped = TransformPipeline(fn2).rename("b", "x").build()
+    assert wrapped(1, x=2) == (1, 2)
+
+
+def test_drop():
+    assert TransformPipeline(fn).drop("d").build()(1, 2, 3) == (1, 2, 3, 4)
+    assert TransformPipeline(fn).drop("a", 5).build()(1, 2) == (5, 1, 2, 4)
+    with pytest.raises(SignatureException):
+        TransformPipeline(fn).drop("a")
+
+
+def test_drop_packed():
+    wrapped = TransformPipeline(fn).pack(["a", "b"]).drop("a__b", (1, 2)).build()
+    assert wrapped(3) == (1, 2, 3, 4)
+
+
+def test_unpack_and_rename():
+    def fn2(a, bc: Tuple[int, int]):
+        return a, bc
+
+    wrapped = (
+        TransformPipeline(fn2)
+        .rename("bc", "pair")
+        .unpack("pair", names=["b", "c"])
+        .rename("b", "x")
+        .build()
+    )
+    assert str(inspect.signature(wrapped)) == "(a, x: int, c: int)"
+    assert wrapped(1, 2, 3) == (1, (2, 3))
+
+
+def test_curry():
+    wrapped = TransformPipeline(fn).permute("d", "c", "b", "a").curry(1, 2).build()
+    assert str(inspect.signature(wrapped)) == "(b, a)"
+    assert wrapped(3, 4) == (4, 3, 2, 1)
+    with pytest.raises(SignatureException):
+        TransformPipeline(fn).curry(1, 2, 3, 4, 5)
+
+
+def test_repr():
+    pipeline = TransformPipeline(fn).permute(1, 0, 2, 3).drop("d")
+    assert repr(pipeline) == "<TransformPipeline(fn: permute -> drop)>"
@@ -0,0 +1,124 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import asyncio
+import inspect
+import io
+import time
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.profiling import all_call_stats
+from jdv_funcutils.signature.profiling import disable_profiling
+from jdv_funcutils.signature.profiling import dump_call_stats
+from jdv_funcutils.signature.profiling import enable_profiling
+from jdv_funcutils.signature.profiling import get_call_stats
+from jdv_funcutils.signature.profiling import reset_call_stats
+from jdv_funcutils.signature.utils import copy_signature
+
+
+@pytest.fixture(autouse=True)
+def profiling_disabled():
+    disable_profiling()
+    yield
+    disable_profiling()
+
+
+def fn(a, b, c):
+    return a, b, c
+
+
+def reversed_transform(f, **kwargs):
+    s = MutableSignature(f)
+    s.reorder(*reversed(range(len(s))))
+    return s.transform(f, **kwargs)
+
+
+class TestProfiling:
+    def test_not_profiled_by_default(self):
+        wrapped = reversed_transform(fn)
+        assert get_call_stats(wrapped) is None
+        assert wrapped(3, 2, 1) == (1, 2, 3)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_profile(self, compiled):
+        def slow(a, b):
+            time.sleep(0.001)
+            return a, b
+
+        s = MutableSignature(slow)
+        s.reorder("b", "a")
+        wrapped = s.transform(slow, compiled=compiled, profile=True)
+        assert wrapped(2, 1) == (1, 2)
+        assert wrapped(b=1, a=2) == (2, 1)
+        assert str(inspect.signature(wrapped)) == "(b, a)"
+        assert wrapped.__wrapped__ is slow
+        stats = get_call_stats(wrapped)
+        assert stats.calls == 2
+        assert stats.callee_ns >= 2_000_000
+        assert stats.total_ns >= stats.callee_ns
+        assert stats.overhead_ns == stats.total_ns - stats.callee_ns
+
+    def test_checked_at_creation(self):
+        enable_profiling()
+        profiled = reversed_transform(fn)
+        not_profiled = reversed_transform(fn, profile=False)
+        disable_profiling()
+        profiled(3, 2, 1)
+        not_profiled(3, 2, 1)
+        assert get_call_stats(profiled).calls == 1
+        assert get_call_stats(not_profiled) is None
+
+    def test_exception_is_counted(self):
+        def fail(a):
+            raise ValueError(a)
+
+        wrapped = MutableSignature(fail).transform(fail, profile=True)
+        with pytest.raises(ValueError):
+            wrapped(1)
+        assert get_call_stats(wrapped).calls == 1
+
+    def test_coroutine(self):
+        async def foo(a, b):
+            await asyncio.sleep(0.001)
+            return a, b
+
+        wrapped = reversed_transform(foo, profile=True)
+        assert inspect.iscoroutinefunction(wrapped)
+        assert asyncio.run(wrapped(2, 1)) == (1, 2)
+        stats = get_call_stats(wrapped)
+        assert stats.calls == 1
+        assert stats.callee_ns >= 1_000_000
+
+    def test_generator(self):
+        def foo(a, b):
+            yield a
+            yield b
+
+        wrapped = reversed_transform(foo, profile=True)
+        assert inspect.isgeneratorfunction(wrapped)
+        assert list(wrapped(2, 1)) == [1, 2]
+        assert get_call_stats(wrapped).calls == 1
+
+    def test_copy_signature(self):
+        def bar(*args, **kwargs):
+            return args, kwargs
+
+        wrapped = copy_signature(fn, profile=True)(bar)
+        assert wrapped(1, 2, c=3) == ((1, 2), {"c": 3})
+        assert inspect.signature(wrapped) == inspect.signature(fn)
+        assert get_call_stats(wrapped).calls == 1
+
+    def test_registry(self):
+        wrapped = reversed_transform(fn, profile=True)
+        wrapped(3, 2, 1)
+        stats = get_call_stats(wrapped)
+        assert stats in all_call_stats()
+
+        out = io.StringIO()
+        dump_call_stats(out)
+        assert f"{__name__}.fn" in out.getvalue()
+
+        reset_call_stats()
+        assert stats.calls == 0
+        assert stats.total_ns == 0
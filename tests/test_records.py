@@ -0,0 +1,148 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+from types import MappingProxyType
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.exceptions import SignatureException
+from jdv_funcutils.signature.exceptions import SignatureMissingParameterException
+
+
+def fn(a, b=2, *, c, d=4):
+    return a, b, c, d
+
+
+def fn_kwargs(a, b=2, **kwargs):
+    return a, b, kwargs
+
+
+def call_all(f, bound):
+    return [f(*args, **kwargs) for args, kwargs in bound]
+
+
+class TestMappingRows:
+    def test_adapt(self):
+        adapter = MutableSignature(fn).record_adapter()
+        rows = [{"a": 1, "c": 3}, {"a": 1, "b": 5, "c": 3, "d": 6}]
+        bound = list(adapter.adapt(rows))
+        assert bound == [((1, 2), {"c": 3, "d": 4}), ((1, 5), {"c": 3, "d": 6})]
+        assert call_all(fn, bound) == [(1, 2, 3, 4), (1, 5, 3, 6)]
+        assert adapter.report.rows == 2
+        assert adapter.report.skipped == 0
+
+    def test_missing_and_extra_are_aggregated(self):
+        adapter = MutableSignature(fn).record_adapter()
+        rows = [
+            {"a": 1, "c": 3, "x": 0},
+            {"b": 1},
+            {"a": 1},
+            {"a": 1, "c": 3, "x": 0, "y": 0},
+        ]
+        bound = list(adapter.adapt(rows))
+        assert len(bound) == 2
+        report = adapter.report
+        assert report.rows == 4
+        assert report.adapted == 2
+        assert report.skipped == 2
+        assert report.missing == {"a": 1, "c": 2}
+        assert report.extra == {"x": 2, "y": 1}
+
+    def test_extra_fields_of_skipped_rows(self):
+        def add(a, b, c=0):
+            return a + b + c
+
+        s = MutableSignature(add)
+        s.pack(("a", "b"))
+        adapter = s.record_adapter()
+        assert list(adapter.adapt([{"a": 1, "b": 2, "c": 3}])) == []
+        assert adapter.report.missing == {"a__b": 1}
+        assert adapter.report.extra == {"a": 1, "b": 1}
+
+    def test_strict(self):
+        adapter = MutableSignature(fn).record_adapter()
+        rows = [{"a": 1, "c": 3}, {"a": 1}]
+        bound = []
+        with pytest.raises(SignatureMissingParameterException, match="1 of 2"):
+            for args_kwargs in adapter.adapt(rows, strict=True):
+                bound.append(args_kwargs)
+        assert len(bound) == 1
+
+    def test_strict_reports_rows_of_this_call(self):
+        adapter = MutableSignature(fn).record_adapter()
+        list(adapter.adapt([{"a": 1}, {"c": 3}]))
+        with pytest.raises(
+            SignatureMissingParameterException,
+            match=r"1 of 1 rows skipped, missing fields: \{'c': 1\}",
+        ):
+            list(adapter.adapt([{"a": 1}], strict=True))
+        assert adapter.report.missing == {"a": 1, "c": 2}
+
+    def test_var_keyword_receives_extra_fields(self):
+        adapter = MutableSignature(fn_kwargs).record_adapter()
+        bound = list(adapter.adapt([{"a": 1, "x": 0}]))
+        assert call_all(fn_kwargs, bound) == [(1, 2, {"x": 0})]
+        assert not adapter.report.extra
+
+    def test_other_mappings(self):
+        adapter = MutableSignature(fn).record_adapter()
+        bound = list(adapter.adapt([MappingProxyType({"a": 1, "c": 3})]))
+        assert bound == [((1, 2), {"c": 3, "d": 4})]
+
+    def test_sequence_rows_require_columns(self):
+        adapter = MutableSignature(fn).record_adapter()
+        with pytest.raises(SignatureException):
+            list(adapter.adapt([(1, 3)]))
+
+    def test_reordered_signature(self):
+        def subtract(a, b):
+            return a - b
+
+        s = MutableSignature(subtract)
+        s.reorder("b", "a")
+        adapter = s.record_adapter()
+        bound = list(adapter.adapt([{"a": 3, "b": 1}]))
+        assert bound == [((1, 3), {})]
+        assert call_all(s.transform(subtract), bound) == [2]
+
+
+class TestSequenceRows:
+    def test_adapt(self):
+        adapter = MutableSignature(fn).record_adapter(columns=["c", None, "a"])
+        bound = list(adapter.adapt([(3, "ignored", 1), [5, "ignored", 6]]))
+        assert bound == [((1, 2), {"c": 3, "d": 4}), ((6, 2), {"c": 5, "d": 4})]
+
+    def test_long_and_short_rows(self):
+        adapter = MutableSignature(fn).record_adapter(columns=["a", "c", "b"])
+        rows = [(1, 3, 2, "x", "y"), (1, 3), (1,)]
+        bound = list(adapter.adapt(rows))
+        assert bound == [((1, 2), {"c": 3, "d": 4}), ((1, 2), {"c": 3, "d": 4})]
+        assert adapter.report.extra == {3: 1, 4: 1}
+        assert adapter.report.missing == {"c": 1}
+
+    def test_var_keyword_columns(self):
+        adapter = MutableSignature(fn_kwargs).record_adapter(columns=["x", "a"])
+        bound = list(adapter.adapt([(0, 1)]))
+        assert call_all(fn_kwargs, bound) == [(1, 2, {"x": 0})]
+
+    @pytest.mark.parametrize(
+        "columns, exception",
+        [
+            (["a", "a", "c"], SignatureException),
+            (["a", "c", "x"], SignatureException),
+            (["a", "b"], SignatureMissingParameterException),
+        ],
+    )
+    def test_invalid_columns(self, columns, exception):
+        with pytest.raises(exception):
+            MutableSignature(fn).record_adapter(columns=columns)
+
+    def test_report_accumulates(self):
+        adapter = MutableSignature(fn).record_adapter(columns=["a", "c"])
+        list(adapter.adapt([(1, 3), (1,)]))
+        list(adapter.adapt([(1,)]))
+        assert adapter.report.rows == 3
+        assert adapter.report.missing == {"c": 2}
+        adapter.report.reset()
+        assert adapter.report.rows == 0
+        assert not adapter.report.missing
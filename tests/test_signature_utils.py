@@ -0,0 +1,188 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import asyncio
+import functools
+import gc
+import inspect
+
+import pytest
+
+from jdv_funcutils.signature.utils import copy_signature
+from jdv_funcutils.signature.utils import get_signature
+from jdv_funcutils.signature.utils import invalidate_signature
+from jdv_funcutils.signature.utils import signature_cache_info
+from jdv_funcutils.utils.caching import WeakKeyCache
+
+
+class TestGetSignature:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        invalidate_signature()
+        yield
+        invalidate_signature()
+
+    def test_cached(self):
+        def foo(a: int, b: str = "b"):
+            ...
+
+        s = get_signature(foo)
+        assert s == inspect.signature(foo)
+        assert get_signature(foo) is s
+        info = signature_cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.currsize == 1
+
+    def test_not_cached(self):
+        def foo(a: int, b: str = "b"):
+            ...
+
+        get_signature(foo, cache=False)
+        assert signature_cache_info().currsize == 0
+
+    def test_invalidate(self):
+        def foo(a: int, b: str = "b"):
+            ...
+
+        get_signature(foo)
+        foo.__signature__ = inspect.Signature()
+        assert len(get_signature(foo).parameters) == 2
+        invalidate_signature(foo)
+        assert len(get_signature(foo).parameters) == 0
+
+    def test_weak_keys(self):
+        def foo(a: int, b: str = "b"):
+            ...
+
+        get_signature(foo)
+        assert signature_cache_info().currsize == 1
+        del foo
+        gc.collect()
+        assert signature_cache_info().currsize == 0
+
+    def test_bound_method(self):
+        class Foo:
+            def bar(self, a: int, b: str = "b"):
+                ...
+
+        foo = Foo()
+        assert get_signature(foo.bar) == inspect.signature(foo.bar)
+        assert get_signature(Foo().bar) == inspect.signature(foo.bar)
+        assert signature_cache_info().hits == 1
+
+    def test_partial(self):
+        def foo(a: int, b: str = "b", *, c: int = 4):
+            ...
+
+        p1 = functools.partial(foo, 1, c=5)
+        p2 = functools.partial(foo, b="c")
+        assert get_signature(p1) == inspect.signature(p1)
+        assert get_signature(p2) == inspect.signature(p2)
+        assert signature_cache_info().currsize == 1
+
+    def test_unhashable_callable(self):
+        class Foo:
+            __hash__ = None
+
+            def __call__(self, a: int):
+                ...
+
+        foo = Foo()
+        assert get_signature(foo) == inspect.signature(foo)
+        assert get_signature(foo) == inspect.signature(foo)
+        assert signature_cache_info().hits == 1
+        del foo
+        gc.collect()
+        assert signature_cache_info().currsize == 0
+
+
+def test_weak_key_cache_not_weakrefable():
+    cache = WeakKeyCache(str)
+    assert cache(1) == "1"
+    assert cache(1) == "1"
+    assert cache.info().hits == 0
+    assert len(cache) == 0
+
+
+class TestCopySignature:
+    def test_copy_signature(self):
+        def foo(a: int, b: str = "b"):
+            ...
+
+        @copy_signature(foo)
+        def bar(*args, **kwargs):
+            return args, kwargs
+
+        assert inspect.signature(bar) == inspect.signature(foo)
+        assert bar(1, b="c") == ((1,), {"b": "c"})
+        assert bar.__name__ == "bar"
+
+    def test_copy_signature_coroutine(self):
+        def foo(a: int):
+            ...
+
+        @copy_signature(foo)
+        async def bar(*args):
+            return args
+
+        assert inspect.iscoroutinefunction(bar)
+        assert inspect.signature(bar) == inspect.signature(foo)
+        assert asyncio.run(bar(1)) == (1,)
+
+    def test_copy_signature_generator(self):
+        def foo(a: int):
+            ...
+
+        @copy_signature(foo)
+        def bar(a):
+            yield a
+
+        assert inspect.isgeneratorfunction(bar)
+        assert list(bar(1)) == [1]
+
+    def test_copy_signature_ignore(self):
+        def foo(a: int, b: str = "b") -> int:
+            ...
+
+        @copy_signature(foo, ignore="b")
+        def bar(*args, **kwargs):
+            return args, kwargs
+
+        assert str(inspect.signature(bar)) == "(a: int) -> int"
+
+    @pytest.mark.parametrize("kind", ["function", "coroutine"])
+    def test_copy_function(self, kind):
+        def foo(a: int, *, b: str = "b"):
+            ...
+
+        x = 1
+
+        def bar(a, *, b="c"):
+            return a, b, x
+
+        async def abar(a, *, b="c"):
+            return bar(a, b=b)
+
+        fn = bar if kind == "function" else abar
+        copied = copy_signature(foo, copy_function=True)(fn)
+        assert copied is not fn
+        assert copied.__code__ is fn.__code__
+        assert copied.__wrapped__ is fn
+        assert copied.__name__ == fn.__name__
+        assert inspect.signature(copied) == inspect.signature(foo)
+        assert inspect.signature(fn) != inspect.signature(foo)
+        assert inspect.iscoroutinefunction(copied) is (kind == "coroutine")
+        result = copied(1) if kind == "function" else asyncio.run(copied(1))
+        assert result == (1, "c", 1)
+
+        copied.__kwdefaults__["b"] = "d"
+        assert fn.__kwdefaults__ == {"b": "c"}
+
+    def test_copy_function_falls_back_to_wrapper(self):
+        def foo(a: int):
+            ...
+
+        bar = functools.partial(lambda a, b: (a, b), b=2)
+        wrapped = copy_signature(foo, copy_function=True)(bar)
+        assert inspect.signature(wrapped) == inspect.signature(foo)
+        assert wrapped(1) == (1, 2)
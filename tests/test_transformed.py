@@ -0,0 +1,181 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import asyncio
+import inspect
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.exceptions import ArgumentTypeError
+from jdv_funcutils.signature.transformed import TransformedFunction
+from jdv_funcutils.signature.utils import copy_signature
+
+
+def fn(a: int, b: int, c: int = 3):
+    return a, b, c
+
+
+async def afn(a, b):
+    return a, b
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def norm(p: Point):
+    return p.x + p.y
+
+
+def reversed_transform(f, **kwargs):
+    s = MutableSignature(f)
+    s.reorder("b", "a", *list(s)[2:])
+    return s.transform(f, picklable=True, **kwargs)
+
+
+reversed_fn = reversed_transform(fn)
+
+
+@copy_signature(fn, picklable=True)
+def decorated(*args, **kwargs):
+    """Decorated in place."""
+    return args, kwargs
+
+
+class TestTransformedFunction:
+    def test_call(self):
+        wrapped = reversed_transform(fn)
+        assert isinstance(wrapped, TransformedFunction)
+        assert wrapped(2, 1) == (1, 2, 3)
+        assert wrapped(b=2, a=1, c=4) == (1, 2, 4)
+        assert str(inspect.signature(wrapped)) == "(b: int, a: int, c: int = 3)"
+        assert wrapped.__name__ == "fn"
+        assert wrapped.__wrapped__ is fn
+
+    def test_specialized_after_first_call(self):
+        wrapped = reversed_transform(fn)
+        assert type(wrapped) is TransformedFunction
+        wrapped(2, 1)
+        assert type(wrapped) is not TransformedFunction
+        assert isinstance(wrapped, TransformedFunction)
+        assert wrapped(2, 1) == (1, 2, 3)
+
+    @pytest.mark.parametrize("called", [False, True])
+    def test_pickle(self, called):
+        wrapped = reversed_transform(fn, name="swapped")
+        if called:
+            wrapped(2, 1)
+        loaded = pickle.loads(pickle.dumps(wrapped))
+        assert type(loaded) is TransformedFunction
+        assert loaded.__name__ == "swapped"
+        assert loaded.__doc__ == wrapped.__doc__
+        assert loaded.fn is fn
+        assert inspect.signature(loaded) == inspect.signature(wrapped)
+        assert loaded(2, 1) == (1, 2, 3)
+
+    @pytest.mark.parametrize("options", [{}, {"check_types": True}])
+    def test_copies_share_adapter(self, options):
+        wrapped = reversed_transform(fn, **options)
+        data = pickle.dumps(wrapped)
+        a, b = pickle.loads(data), pickle.loads(data)
+        assert a(2, 1) == b(2, 1) == (1, 2, 3)
+        assert type(a) is type(b)
+        assert type(wrapped) is TransformedFunction
+        other = reversed_transform(fn, **options)
+        other(2, 1)
+        assert type(other) is type(a)
+
+    def test_equal_defaults_of_different_types(self):
+        def identity(x):
+            return x
+
+        wrapped = []
+        for default in (1, True, 1.0):
+            s = MutableSignature(identity)
+            s["x"].default = default
+            wrapped.append(s.transform(identity, picklable=True))
+        results = [w() for w in wrapped]
+        assert results == [1, True, 1.0]
+        assert [type(r) for r in results] == [int, bool, float]
+
+    def test_pickle_type_checks(self):
+        wrapped = reversed_transform(fn, check_types=True)
+        loaded = pickle.loads(pickle.dumps(wrapped))
+        assert loaded(2, 1) == (1, 2, 3)
+        with pytest.raises(ArgumentTypeError):
+            loaded("2", 1)
+
+    def test_pickle_unpacked(self):
+        s = MutableSignature(norm)
+        s.unpack("p")
+        wrapped = s.transform(norm, picklable=True)
+        loaded = pickle.loads(pickle.dumps(wrapped))
+        assert loaded(1, y=2) == 3
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(reversed_fn, [2, 4], [1, 3]))
+        assert results == [(1, 2, 3), (3, 4, 3)]
+
+    def test_coroutine(self):
+        wrapped = reversed_transform(afn)
+        loaded = pickle.loads(pickle.dumps(wrapped))
+        assert asyncio.run(loaded(2, 1)) == (1, 2)
+
+    def test_method(self):
+        class Foo:
+            def bar(self, a):
+                return self, a
+
+            baz = MutableSignature(bar).transform(bar, picklable=True)
+
+        foo = Foo()
+        assert foo.baz(1) == (foo, 1)
+        assert Foo.baz(foo, 1) == (foo, 1)
+
+    def test_invalid_options(self):
+        s = MutableSignature(fn)
+        with pytest.raises(ValueError):
+            s.transform(fn, picklable=True, compiled=False)
+        with pytest.raises(ValueError):
+            s.transform(fn, picklable=True, profile=True)
+
+    def test_pickle_decorated_function(self):
+        data = pickle.dumps(decorated)
+        a, b = pickle.loads(data), pickle.loads(data)
+        assert a(1, 2, c=4) == ((1, 2), {"c": 4})
+        assert a.fn is b.fn
+        assert a.fn.__qualname__ == "decorated"
+        assert a.__doc__ == "Decorated in place."
+        assert inspect.signature(a) == inspect.signature(fn)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(decorated, [1, 2], [3, 4])) == [
+                ((1, 3), {}),
+                ((2, 4), {}),
+            ]
+
+    def test_pickle_local_function(self):
+        def local(a, b, *, c=3):
+            return a, b, c
+
+        with pytest.raises(pickle.PicklingError, match="cannot be imported"):
+            pickle.dumps(reversed_transform(local))
+        wrapped = copy_signature(local, picklable=True)(local)
+        loaded = pickle.loads(pickle.dumps(pickle.loads(pickle.dumps(wrapped))))
+        assert loaded(1, 2, c=4) == (1, 2, 4)
+
+        def closure(a, b):
+            return local(a, b)
+
+        with pytest.raises(pickle.PicklingError, match="closure"):
+            pickle.dumps(copy_signature(closure, picklable=True)(closure))
+
+    def test_copy_signature(self):
+        wrapped = copy_signature(fn, picklable=True)(afn)
+        loaded = pickle.loads(pickle.dumps(wrapped))
+        assert inspect.signature(loaded) == inspect.signature(fn)
+        assert asyncio.run(loaded(1, 2)) == (1, 2)
@@ -0,0 +1,185 @@
+#  Copyright (c) 2022 Justin Vrana. All Rights Reserved.
+#  You may use, distribute, and modify this code under the terms of the MIT license.
+import asyncio
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Literal
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+import pytest
+
+from jdv_funcutils import MutableSignature
+from jdv_funcutils.signature.exceptions import ArgumentTypeError
+from jdv_funcutils.signature.typecheck import compile_checker
+from jdv_funcutils.signature.typecheck import compile_type_check
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "annotation,valid,invalid",
+    [
+        (int, [1, True], ["1", 1.0, None]),
+        (float, [1.0, 1], ["1", 1j, None]),
+        (complex, [1j, 1.0, 1], ["1", None]),
+        (List[float], [[1, 1.0]], [[1j]]),
+        (Optional[float], [1, None], ["1"]),
+        (None, [None], [0]),
+        (Optional[int], [1, None], ["1"]),
+        (Union[int, str], [1, "1"], [1.0]),
+        (Union[List[int], str], [[1], "1"], [["1"], 1]),
+        (Tuple[int, str], [(1, "a")], [(1,), (1, 2), [1, "a"]]),
+        (Tuple[int, ...], [(), (1, 2)], [(1, "a"), [1]]),
+        (Tuple, [(1, "a")], [[1]]),
+        (List[int], [[], [1, 2]], [[1, "a"], (1,)]),
+        (List[Optional[int]], [[1, None]], [[1.0]]),
+        (List, [[1, "a"]], [(1,)]),
+        (Set[str], [{"a"}], [{1}, frozenset({"a"})]),
+        (FrozenSet[str], [frozenset({"a"})], [{"a"}]),
+        (Dict[str, int], [{"a": 1}], [{1: 1}, {"a": "b"}, [("a", 1)]]),
+        (Dict[str, Any], [{"a": "b"}], [{1: 1}]),
+        (Sequence[int], [[1], (1,)], [{1}]),
+        (Literal["a", 1], ["a", 1], ["b", True]),
+        (Callable[[int], int], [len], [1]),
+        (Type[int], [int, bool], [str, 1]),
+        (Point, [Point(1, 2)], [(1, 2)]),
+    ],
+)
+def test_compile_checker(annotation, valid, invalid):
+    checker = compile_checker(annotation)
+    for value in valid:
+        assert checker(value), value
+    for value in invalid:
+        assert not checker(value), value
+
+
+@pytest.mark.parametrize(
+    "annotation", [Any, "int", TypeVar("T"), Union[int, "Foo"]]  # noqa
+)
+def test_unchecked_annotations(annotation):
+    assert compile_checker(annotation) is None
+
+
+def test_isinstance_checks():
+    assert compile_type_check(int) == (int,)
+    assert compile_type_check(Optional[int]) == (int, type(None))
+
+
+def test_compile_is_cached():
+    assert compile_type_check(List[int]) is compile_type_check(List[int])
+
+
+class TestTransformCheckTypes:
+    @pytest.fixture(params=[True, False], ids=["compiled", "interpreted"])
+    def compiled(self, request):
+        return request.param
+
+    def test_check_types(self, compiled):
+        def fn(a: int, b: Optional[str] = None, *, c: List[int]):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        wrapped = s.transform(fn, compiled=compiled, check_types=True)
+        assert wrapped(1, "b", c=[1]) == (1, "b", [1])
+        assert wrapped(1, c=[]) == (1, None, [])
+        with pytest.raises(ArgumentTypeError) as exc:
+            wrapped("1", c=[1])
+        assert "'a'" in str(exc.value)
+        with pytest.raises(TypeError):
+            wrapped(1, 2, c=[1])
+        with pytest.raises(TypeError):
+            wrapped(1, c=["a"])
+
+    def test_numeric_tower(self, compiled):
+        def fn(a: float, b: complex = 0j):
+            return a, b
+
+        s = MutableSignature(fn)
+        wrapped = s.transform(fn, compiled=compiled, check_types=True)
+        assert wrapped(1, 2) == (1, 2)
+        assert wrapped(1.5, 2.5) == (1.5, 2.5)
+        with pytest.raises(ArgumentTypeError):
+            wrapped(1j)
+
+    def test_defaults_are_not_checked(self):
+        def fn(a: int = None, *, b: str = None):
+            return a, b
+
+        wrapped = MutableSignature(fn).transform(fn, check_types=True)
+        assert wrapped() == (None, None)
+        with pytest.raises(ArgumentTypeError):
+            wrapped(b=1)
+
+    def test_not_checked_by_default(self, compiled):
+        def fn(a: int):
+            return a
+
+        wrapped = MutableSignature(fn).transform(fn, compiled=compiled)
+        assert wrapped("a") == "a"
+
+    def test_packed(self, compiled):
+        def fn(a: int, b: str, c: float):
+            return a, b, c
+
+        s = MutableSignature(fn)
+        s.pack(["a", "b"])
+        wrapped = s.transform(fn, compiled=compiled, check_types=True)
+        assert wrapped((1, "b"), 1.0) == (1, "b", 1.0)
+        with pytest.raises(ArgumentTypeError):
+            wrapped((1, 2), 1.0)
+        with pytest.raises(ArgumentTypeError):
+            wrapped((1, "b", 3), 1.0)
+
+    def test_check_every(self, compiled):
+        def fn(a: int):
+            return a
+
+        wrapped = MutableSignature(fn).transform(
+            fn, compiled=compiled, check_types=True, check_every=3
+        )
+        with pytest.raises(ArgumentTypeError):
+            wrapped("a")
+        assert wrapped("b") == "b"
+        assert wrapped("c") == "c"
+        with pytest.raises(ArgumentTypeError):
+            wrapped("d")
+
+    def test_invalid_check_every(self):
+        def fn(a: int):
+            return a
+
+        with pytest.raises(ValueError):
+            MutableSignature(fn).transform(fn, check_types=True, check_every=0)
+
+    def test_var_args(self):
+        def fn(*args: int, **kwargs: str):
+            return args, kwargs
+
+        wrapped = MutableSignature(fn).transform(fn, check_types=True)
+        assert wrapped(1, 2, a="a") == ((1, 2), {"a": "a"})
+        with pytest.raises(ArgumentTypeError):
+            wrapped(1, "2")
+        with pytest.raises(ArgumentTypeError):
+            wrapped(1, a=1)
+
+    def test_coroutine(self):
+        async def fn(a: int):
+            return a
+
+        wrapped = MutableSignature(fn).transform(fn, check_types=True)
+        assert asyncio.run(wrapped(1)) == 1
+        with pytest.raises(ArgumentTypeError):
+            asyncio.run(wrapped("1"))
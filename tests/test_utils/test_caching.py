@@ -0,0 +1,60 @@
+import pytest
+
+from jdv_funcutils.utils.caching import LRUCache
+from jdv_funcutils.utils.caching import structural_key
+
+
+def test_lru_cache():
+    calls = []
+
+    def fn(x, y):
+        calls.append((x, y))
+        return x + y
+
+    cache = LRUCache(fn, maxsize=2)
+    assert cache(1, 2) == 3
+    assert cache(1, 2) == 3
+    assert calls == [(1, 2)]
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 1, 1, 2)
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(lambda x: object(), maxsize=2)
+    a = cache(1)
+    cache(2)
+    assert cache(1) is a
+    cache(3)
+    assert len(cache) == 2
+    assert cache(1) is a
+    assert cache.invalidate(1)
+    assert not cache.invalidate(1)
+    assert cache(1) is not a
+
+
+def test_lru_cache_unhashable():
+    cache = LRUCache(lambda x: len(x))
+    assert cache([1, 2]) == 2
+    assert len(cache) == 0
+    assert not cache.invalidate([1, 2])
+
+
+def test_lru_cache_clear():
+    cache = LRUCache(lambda x: x)
+    cache(1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().misses == 0
+
+
+def test_lru_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(lambda x: x, maxsize=0)
+
+
+def test_structural_key():
+    assert structural_key((1, [2], {"a": {3}})) == structural_key((1, [2], {"a": {3}}))
+    keys = {structural_key(v) for v in (1, True, 1.0, (1,), (True,), [1], [1.0])}
+    assert len(keys) == 7
+    a, b = bytearray(b"a"), bytearray(b"a")
+    assert structural_key(a) == structural_key(a) != structural_key(b)